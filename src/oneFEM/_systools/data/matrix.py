@@ -17,14 +17,14 @@
 #   definition of the Matrix data object
 
 from ..math_tools import _is_close
-from numpy import array, zeros, copy
+from numpy import array, zeros, copy, ndarray
 
 class Matrix(object):
     def __init__(self, init=[], shape=[0, 0], dtype=float):
         # initialize variables
         self.__dtype = dtype
 
-        if init == []:
+        if isinstance(init, list) and len(init) == 0:
             if isinstance(shape, list) and len(shape)==2:
                 if isinstance(shape[0], int) and isinstance(shape[1], int):
                     self.__size = shape
@@ -52,13 +52,12 @@ class Matrix(object):
         elif isinstance(init, Matrix):
             self.__copy(init)
 
-        elif isinstance(init, array):
-            if init.shape[0] > 0 and init.shape[1] == 1:
-                self.__data = copy(init, dtype=self.__dtype)
-            elif init.shape[1] > 0 and init.shape[0] == 1:
-                self.__data = copy(init, dtype=self.__dtype)
+        elif isinstance(init, ndarray):
+            if init.ndim == 2:
+                self.__data = array(init, dtype=self.__dtype)
+                self.__size = list(init.shape)
             else:
-                raise ValueError("Matrix.__init__(): data must be a 1D array")
+                raise ValueError("Matrix.__init__(): data must be a 2D array")
 
         else:
             raise ValueError("Matrix.__init__(): data type not supported")
@@ -68,12 +67,36 @@ class Matrix(object):
     def __copy(self, vector_other):
         # copy the data of another vector
         # vector_other is a Vector object instance
-        self.data = copy(vector_other.data)
-        self.length = vector_other.length
-        self.dtype = vector_other.dtype
+        self.__data = copy(vector_other.data)
+        self.__size = list(vector_other.data.shape)
+        self.__dtype = vector_other.dtype
 
 
     # public methods
+    @property
+    def data(self):
+        # underlying numpy array of the matrix
+        return self.__data
+
+
+    @property
+    def dtype(self):
+        # data type of the matrix entries
+        return self.__dtype
+
+
+    def __array__(self, dtype=None, copy=None):
+        # allow numpy functions to operate on the matrix directly
+        if dtype is None:
+            return self.__data
+        return self.__data.astype(dtype)
+
+
+    def __getitem__(self, index):
+        # return the entry (or entries) at index
+        return self.__data[index]
+
+
     # implement division
     def __truediv__(self, scalar):
         # divide the vector by a scalar
@@ -18,7 +18,7 @@
 
 from ..math_tools import _is_close
 from numpy import dot, cross, sqrt
-from numpy import array, copy
+from numpy import array, copy, ndarray
 from .matrix import Matrix
 
 class Vector(object):
@@ -33,27 +33,23 @@ class Vector(object):
             raise ValueError("Vector.__init__(): shape must be an integer")
 
         # initialize data
-        if isinstance(init, list):
-            if len(init) > 0:
-                self.__length = len(init)
-                self.__data = array(init.copy(), dtype=self.__dtype)
-                if not self.__is_row_vector:
-                    self.__data = self.__data.transpose()
-            
+        if isinstance(init, list) and len(init) > 0:
+            self.__length = len(init)
+            self.__data = array(init.copy(), dtype=self.__dtype)
+            if not self.__is_row_vector:
+                self.__data = self.__data.transpose()
+
         elif isinstance(init, Vector):
             self.__copy(init)
 
-        elif isinstance(init, array):
-            if init.shape[0] > 0 and init.shape[1] == 1:
-                self.__data = copy(init, dtype=self.__dtype)
-                if not self.__is_row_vector:
-                    self.__data = self.__data.transpose()
-            elif init.shape[1] > 0 and init.shape[0] == 1:
-                self.__data = copy(init, dtype=self.__dtype)
+        elif isinstance(init, ndarray):
+            if init.ndim == 1 or (init.ndim == 2 and 1 in init.shape):
+                self.__data = array(init, dtype=self.__dtype).ravel()
+                self.__length = self.__data.shape[0]
             else:
                 raise ValueError("Vector.__init__(): data must be a 1D array")
 
-        elif init==[]:
+        elif isinstance(init, list):
             if shape > 0:
                 self.__data = array([0.0]*shape, dtype=self.__dtype)
                 if not self.__is_row_vector:
@@ -69,13 +65,36 @@ class Vector(object):
     def __copy(self, vector_other):
         # copy the data of another vector
         # vector_other is a Vector object instance
-        self.data = copy(vector_other.data)
-        self.length = vector_other.length
-        self.is_row_vector = vector_other.is_row_vector
-        self.dtype = vector_other.dtype
+        self.__data = copy(vector_other.data)
+        self.__length = len(vector_other)
+        self.__dtype = vector_other.dtype
 
 
     # public methods
+    @property
+    def data(self):
+        # underlying numpy array of the vector
+        return self.__data
+
+
+    @property
+    def dtype(self):
+        # data type of the vector entries
+        return self.__dtype
+
+
+    def __array__(self, dtype=None, copy=None):
+        # allow numpy functions to operate on the vector directly
+        if dtype is None:
+            return self.__data
+        return self.__data.astype(dtype)
+
+
+    def __getitem__(self, index):
+        # return the entry (or entries) at index
+        return self.__data[index]
+
+
     # implement matrix multiplication
     def __matmul__(self, vector_other):
         # multiply two vectors to obtain a matrix
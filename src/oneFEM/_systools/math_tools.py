@@ -20,6 +20,7 @@
 #from .data import Vector, Matrix, Tensor, CTensor
 
 # import precision math tools
+import numpy as np
 from numpy import isclose
 
 # define globals
@@ -41,4 +42,34 @@ def _is_zero(val):
     # Check if the value is close to zero
     # val is a floating point number
     # Return True if it is close, False otherwise
-    return isclose(val, 0.0, rtol=RTOL, atol=ATOL)
\ No newline at end of file
+    return isclose(val, 0.0, rtol=RTOL, atol=ATOL)
+
+def _local_axes(dx):
+    # Compute the lengths and local axes of a batch of 2-node members
+    # dx is a (nElem, nD) array of node j - node i coordinate differences
+    # local x runs from node i to node j, local y is normal to x and to the
+    # global Z axis (global Y for members parallel to Z) and z completes the
+    # right-handed triad. For 2D (nD=2) members z is the global Z axis.
+    # Return the lengths (nElem,) and the rotation matrices (nElem, nD, nD)
+    # whose rows are the local axes expressed in global coordinates
+    dx = np.asarray(dx, dtype=float)
+    L = np.sqrt(np.einsum('ei,ei->e', dx, dx))
+    if np.any(_is_zero(L)):
+        raise ValueError("_local_axes(): zero-length member in batch!")
+
+    x = dx / L[:, None]
+    if dx.shape[1] == 2:
+        R = np.empty((dx.shape[0], 2, 2))
+        R[:, 0, :] = x
+        R[:, 1, 0] = -x[:, 1]
+        R[:, 1, 1] = x[:, 0]
+        return L, R
+
+    ref = np.zeros_like(x)
+    vertical = _is_close(np.abs(x[:, 2]), 1.0)
+    ref[~vertical, 2] = 1.0
+    ref[vertical, 1] = 1.0
+    y = np.cross(ref, x)
+    y /= np.sqrt(np.einsum('ei,ei->e', y, y))[:, None]
+    z = np.cross(x, y)
+    return L, np.stack((x, y, z), axis=1)
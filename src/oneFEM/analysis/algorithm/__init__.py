@@ -4,16 +4,22 @@ from .main import Algorithm
 from .linear import Linear
 from .krylov_newton import Krylov
 from .newton_raphson import Newton
+from .line_search import LineSearch, Bisection, Secant, RegulaFalsi
 
 # delete modules imported from .py directories
 del main
 del linear
 del krylov_newton
 del newton_raphson
+del line_search
 
 __all__ = [
     "Algorithm",
     "Linear",
     "Krylov",
-    "Newton"
+    "Newton",
+    "LineSearch",
+    "Bisection",
+    "Secant",
+    "RegulaFalsi"
 ]
\ No newline at end of file
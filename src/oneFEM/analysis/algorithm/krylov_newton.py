@@ -1,5 +1,82 @@
+##-----------------------------------------------------------------------##
+#                                                                         #
+#        #--oneFEM--#: One FEM software in a galaxy far far away          #
+#                                                                         #
+#                   Computational Mechanics 2025                          #
+#                   University of Chieti-Pescara                          #
+#                 Written by: Onur Deniz AKAN, Ud'A                       #
+#                         9 February 2025                                 #
+#                                                                         #
+##-----------------------------------------------------------------------##
+#KRYLOV solver sub-object definition
+#   Krylov subspace accelerated Newton (Carlson and Miller). the tangent
+#   is factorized once per step (or once per analysis) and every iteration
+#   costs one residual and one back substitution. the preconditioned
+#   residuals r_k = K0^-1 R_k of previous iterations give the action of
+#   the (unknown) current tangent on the previous increments v_i:
+#       AV_i = r_i - r_(i+1)
+#   the increment minimizes the linearized residual over that subspace:
+#       c = argmin || r_k - AV c ||,    v_k = V c + (r_k - AV c)
+
+import numpy as np
 from .main import Algorithm
 
 class Krylov(Algorithm):
-    def __init__(self):
-        super().__init__()
\ No newline at end of file
+    def __init__(self, ID=-1, tangent="step", maxDim=3, lineSearch=None):
+        """
+        Krylov-Newton algorithm
+        :param ID: algorithm ID
+        :param tangent: "step" (factorize at the first iteration of every step)
+                        or "initial" (factorize once per analysis)
+        :param maxDim: maximum dimension of the Krylov subspace
+        :param lineSearch: (Optional) LineSearch object
+        """
+        if tangent not in ("step", "initial"):
+            raise ValueError("oneFEM.Krylov() - Tangent must be 'step' or 'initial'!")
+        super().__init__(ID, tangent, lineSearch)
+        self._maxDim = max(int(maxDim), 0)
+
+    def solve(self, model, system=None, test=None):
+        """
+        Iterate the current step to equilibrium
+        :param model: Domain object (u holds the trial displacements)
+        :param system: System object (default: UmfPack)
+        :param test: Test (or Analysis) object (default: NormUnbalance)
+        :return: True if converged
+        """
+        system, test = self._defaults(system, test)
+        uu, _ = self._dofs()
+        u = model.u
+
+        R, Fint = self._residual(model)
+        self._updateTangent(model, system, 0)
+
+        test._start()
+        V, AV = [], []
+        r_prev = None
+        while True:
+            r = system._solve(R)
+            if r_prev is not None and self._maxDim > 0:
+                AV.append(r_prev - r)
+                if len(AV) > self._maxDim:
+                    V.pop(0)
+                    AV.pop(0)
+
+                Vm = np.column_stack(V)
+                AVm = np.column_stack(AV)
+                c = np.linalg.lstsq(AVm, r, rcond=None)[0]
+                du = Vm @ c + (r - AVm @ c)
+            else:
+                du = r
+
+            u[uu] += du
+            R, Fint, du = self._step(model, du, R)
+
+            V.append(du)
+            r_prev = r
+            if test._test(R, du):
+                self._reactions(model, Fint)
+                return True
+
+            if test._exhausted():
+                return False
@@ -0,0 +1,137 @@
+##-----------------------------------------------------------------------##
+#                                                                         #
+#        #--oneFEM--#: One FEM software in a galaxy far far away          #
+#                                                                         #
+#                   Computational Mechanics 2025                          #
+#                   University of Chieti-Pescara                          #
+#                 Written by: Onur Deniz AKAN, Ud'A                       #
+#                         9 February 2025                                 #
+#                                                                         #
+##-----------------------------------------------------------------------##
+#LINESEARCH sub-object definition
+#   scales the increment du of a Newton-type iteration by eta so that the
+#   residual is (nearly) orthogonal to it:
+#       s(eta) = du . R(u0 + eta du),   |s(eta)| <= tol |s(0)|
+#   s(0) = du . R(u0) and s(1) come for free from the iteration; every
+#   other trial costs one residual evaluation through the domain update
+#   path (Algorithm._residual) and no tangent or factorization.
+#     - Bisection: halves the bracket [eta_a, eta_b] with s_a > 0 > s_b
+#     - Secant: secant through the last two trials
+#     - RegulaFalsi: secant through the bracket ends (keeps the bracket)
+#   an unbracketed root (s(1) > 0: too short a step) is searched by
+#   doubling eta up to maxEta.
+
+class LineSearch(object):
+    def __init__(self, ID=-1, tol=0.8, maxIter=10, minEta=0.1, maxEta=10.0):
+        """
+        Line search of the Newton-type algorithms
+        :param ID: line search ID
+        :param tol: ratio |s(eta)/s(0)| below which the search stops
+        :param maxIter: maximum number of residual evaluations per search
+        :param minEta: lower bound of eta
+        :param maxEta: upper bound of eta
+        """
+        if not 0.0 < minEta <= 1.0 <= maxEta:
+            raise ValueError("oneFEM.{}() - Bounds must satisfy 0 < minEta <= 1 <= maxEta!".format(type(self).__name__))
+
+        self._ID = ID
+        self._tol = tol
+        self._maxIter = int(maxIter)
+        self._minEta = minEta
+        self._maxEta = maxEta
+        self._eta = 1.0         # step factor of the last search
+        self._nEval = 0         # residual evaluations of the last search
+
+    def _next(self, a, b, prev, curr):
+        """
+        Next trial of a bracketed root
+        :param a: (eta, s) lower end of the bracket (s > 0)
+        :param b: (eta, s) upper end of the bracket (s < 0)
+        :param prev: (eta, s) previous trial
+        :param curr: (eta, s) current trial
+        :return: next eta
+        """
+        raise NotImplementedError("LINESEARCH._next(): method must be implemented by subclasses.")
+
+    def _search(self, algorithm, model, du, R0, R, Fint):
+        """
+        Search the step factor of the increment du
+        (on entry the trial displacements hold u0 + du)
+        :param algorithm: Algorithm object (free d.o.f.s and residual)
+        :param model: Domain object
+        :param du: increment of the free d.o.f.s
+        :param R0: residual at u0
+        :param R: residual at u0 + du
+        :param Fint: resisting force vector at u0 + du
+        :return: eta, residual and resisting force vector at u0 + eta du
+        """
+        self._eta, self._nEval = 1.0, 0
+        s0 = float(du @ R0)
+        s1 = float(du @ R)
+        if s0 <= 0.0 or abs(s1) <= self._tol*s0:
+            return self._eta, R, Fint
+
+        uu, _ = algorithm._dofs()
+        u = model.u
+        u0 = u[uu] - du
+
+        a, b = (0.0, s0), None
+        if s1 < 0.0:
+            b = (1.0, s1)
+        else:
+            a = (1.0, s1)
+        prev, curr = (0.0, s0), (1.0, s1)
+
+        for _ in range(self._maxIter):
+            if b is None:
+                eta = min(2.0*curr[0], self._maxEta)
+            else:
+                eta = self._next(a, b, prev, curr)
+            eta = min(max(eta, self._minEta), self._maxEta)
+            if eta == curr[0]:
+                break
+
+            u[uu] = u0 + eta*du
+            R, Fint = algorithm._residual(model)
+            s = float(du @ R)
+            self._nEval += 1
+
+            prev, curr = curr, (eta, s)
+            if s < 0.0:
+                b = curr if b is None or eta < b[0] else b
+            else:
+                a = curr if eta > a[0] else a
+            if abs(s) <= self._tol*s0:
+                break
+
+        self._eta = curr[0]
+        return self._eta, R, Fint
+
+    def getEta(self):
+        """Return the step factor of the last search."""
+        return self._eta
+
+    def getEvaluations(self):
+        """Return the number of residual evaluations of the last search."""
+        return self._nEval
+
+
+class Bisection(LineSearch):
+    def _next(self, a, b, prev, curr):
+        # Midpoint of the bracket
+        return 0.5*(a[0] + b[0])
+
+
+class Secant(LineSearch):
+    def _next(self, a, b, prev, curr):
+        # Secant through the last two trials (midpoint if they are flat)
+        ds = curr[1] - prev[1]
+        if ds == 0.0:
+            return 0.5*(a[0] + b[0])
+        return curr[0] - curr[1]*(curr[0] - prev[0])/ds
+
+
+class RegulaFalsi(LineSearch):
+    def _next(self, a, b, prev, curr):
+        # Secant through the ends of the bracket (stays inside it)
+        return b[0] - b[1]*(b[0] - a[0])/(b[1] - a[1])
@@ -10,6 +10,11 @@
 ##-----------------------------------------------------------------------##
 #LINEAR solver sub-object definition
 #   Linear static solver
+#   solves Kuu uu = Fu - Kup up and recovers the reactions Fp = Kpu uu + Kpp up
+#   multi-case mode (solveCases): the nodal loads of every load pattern are
+#   the columns of one right-hand side P; Kuu is factorized once and all the
+#   cases are solved in one block back substitution. the case results are
+#   kept by the domain (see Superposition) for the load combinations.
 
 import numpy as np
 from .main import Algorithm
@@ -20,6 +25,7 @@ class Linear(Algorithm):
         super().__init__(ID)
         self._nSteps = nSteps
         self._dt = dt
+        self._superposition = None  # results of the load cases (Superposition)
 
     @staticmethod
     def add_analysis(data):
@@ -50,29 +56,69 @@ class Linear(Algorithm):
 
         return model
 
-    def solve(self, model):
+    def solve(self, model, system=None):
         # Compute displacement increment and reaction increment
-        # Displacement increment
-        uu = self.uu
-        pp = self.pp
-        K = model.K
+        # (the blocks of K and the factorization of Kuu are cached: a load
+        # step costs one solve and the matvecs of the reactions)
+        uu, pp = self._dofs()
+        blocks = self._blocks(model.K.tocsr())
         F = model.F
         u = model.u
-        
+
         # Solve for displacements at free DOFs
-        u[uu] = np.linalg.solve(
-            K[np.ix_(uu, uu)],
-            F[uu] - K[np.ix_(uu, pp)].dot(u[pp])
-        )
-        
+        system, _ = self._defaults(system, None)
+        system._setA(blocks["Kuu"])
+        u[uu] = system._solve(F[uu] - blocks["Kup"] @ u[pp])
+
         # Compute reactions at fixed DOFs
-        F[pp] = (
-            K[np.ix_(pp, pp)].dot(u[pp]) +
-            K[np.ix_(pp, uu)].dot(u[uu])
-        )
-        
-        # Update the model
-        model.u = u
-        model.F = F
-        
+        F[pp] = blocks["Kpu"] @ u[uu] + blocks["Kpp"] @ u[pp]
+
         return model
+
+    def solveCases(self, model, system=None):
+        """
+        Solve every load pattern of the domain as a separate load case
+        (one factorization of Kuu, one block solve; fixed d.o.f.s at zero)
+        :param model: Domain object (assembled, see Domain._assemble)
+        :param system: System object (default: UmfPack)
+        :return: list of the pattern IDs of the cases
+        """
+        uu, pp = self._dofs()
+        blocks = self._blocks(model.K.tocsr())
+        IDs, P = model._assembleLoads()
+
+        system, _ = self._defaults(system, None)
+        system._setA(blocks["Kuu"])
+
+        U = np.zeros_like(P)
+        U[uu] = np.asarray(system._solve(P[uu])).reshape(uu.shape[0], -1)
+        P[pp] = blocks["Kpu"] @ U[uu]
+
+        self._superposition = model._superpose(IDs, U, P)
+        return IDs
+
+    def getCase(self, pID):
+        """
+        Return the results of a load case
+        :param pID: pattern ID
+        :return: (nDOF,) displacements, (nDOF,) loads/reactions
+        """
+        return self._superposition.getCase(pID)
+
+    def getCombination(self, factors, model=None):
+        """
+        Combine the load cases linearly
+        :param factors: dict {pattern ID: factor}
+        :param model: (Optional) Domain object receiving the combination in u and F
+        :return: (nDOF,) displacements, (nDOF,) loads/reactions
+        """
+        u = self._superposition.getDisp(factors)
+        F = self._superposition.getReactions(factors)
+        if model is not None:
+            model.u[:] = u
+            model.F[:] = F
+        return u, F
+
+    def getCaseIDs(self):
+        """Return the pattern IDs of the load cases."""
+        return self._superposition.getCaseIDs()
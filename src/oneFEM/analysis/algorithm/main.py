@@ -12,7 +12,151 @@
 #   keeps universal vars, functions and list of analyses
 #   if static solve u = K\F
 #   if transient solve Ma + Cv + Ku = F
+#   nonlinear algorithms iterate on the residual R = F - Fint(u) of the
+#   free d.o.f.s (uu), the fixed d.o.f.s (pp) keep their prescribed u
+#   the stiffness is split once into the free/fixed blocks
+#       [Kuu Kup]
+#       [Kpu Kpp]   (free-first permutation of K)
+#   the blocks keep their sparsity pattern and are refilled from K.data
+#   through a cached index map while the pattern of K does not change
+
+import numpy as np
+from scipy.sparse import csr_matrix
+from ..system.umfpack import UmfPack
+from ..test.unbalanced_load import NormUnbalance
 
 class Algorithm(object):
-    def __init__(self, ID=-1):
-        self._ID = ID
\ No newline at end of file
+    # tangent policies of the nonlinear algorithms
+    #   "iteration": new tangent at every iteration (full Newton)
+    #   "step":      new tangent at the first iteration of every step (modified Newton)
+    #   "initial":   tangent of the first step only (initial-tangent Newton)
+    _tangent_policies = ("iteration", "step", "initial")
+
+    def __init__(self, ID=-1, tangent="iteration", lineSearch=None):
+        if tangent not in self._tangent_policies:
+            raise ValueError("oneFEM.{}() - Unknown tangent policy {}!".format(type(self).__name__, tangent))
+
+        self._ID = ID
+        self._tangent_policy = tangent
+        self._is_initialized = False    # True once the tangent has been formed
+        self._line_search = lineSearch  # LineSearch object (None: full steps)
+        self._default_system = None     # default System object (kept between steps)
+        self._default_test = None       # default Test object
+        self._partition = None          # cached block partition of K (see _blocks)
+        self.uu = []    # free d.o.f.s
+        self.pp = []    # fixed d.o.f.s
+
+    def _setDOFs(self, uu, pp):
+        """
+        Set the free and fixed d.o.f.s (see Analysis._organize)
+        :param uu: free d.o.f.s
+        :param pp: fixed d.o.f.s
+        """
+        self.uu = np.asarray(uu, dtype=np.int64)
+        self.pp = np.asarray(pp, dtype=np.int64)
+        self._partition = None
+
+    def _dofs(self):
+        # Free and fixed d.o.f.s as integer arrays
+        return np.asarray(self.uu, dtype=np.int64), np.asarray(self.pp, dtype=np.int64)
+
+    def _defaults(self, system, test):
+        # Default system of equations and convergence test (created once, so
+        # that the factorization of the default system is reused)
+        if system is None:
+            if self._default_system is None:
+                self._default_system = UmfPack()
+            system = self._default_system
+        if test is None:
+            if self._default_test is None:
+                self._default_test = NormUnbalance()
+            test = self._default_test
+        return system, test
+
+    def _blocks(self, K):
+        """
+        Split K into its free/fixed blocks
+        :param K: global stiffness (scipy.sparse CSR, sorted indices)
+        :return: dict of the "Kuu", "Kup", "Kpu", "Kpp" blocks (CSR)
+        """
+        uu, pp = self._dofs()
+        part = self._partition
+        if part is None or not (
+                np.array_equal(part["uu"], uu) and np.array_equal(part["pp"], pp) and
+                (part["indptr"] is K.indptr or np.array_equal(part["indptr"], K.indptr)) and
+                (part["indices"] is K.indices or np.array_equal(part["indices"], K.indices))):
+            # symbolic: permute the positions of the entries of K (free first)
+            nu = uu.shape[0]
+            perm = np.concatenate((uu, pp))
+            pos = csr_matrix((np.arange(1, K.nnz + 1, dtype=np.float64), K.indices, K.indptr), shape=K.shape)
+            pos = pos[perm][:, perm].tocsr()
+            pos.sort_indices()
+
+            part = {"uu": uu, "pp": pp, "indptr": K.indptr, "indices": K.indices, "blocks": {}}
+            for name, rows, cols in (("Kuu", slice(0, nu), slice(0, nu)), ("Kup", slice(0, nu), slice(nu, None)),
+                                     ("Kpu", slice(nu, None), slice(0, nu)), ("Kpp", slice(nu, None), slice(nu, None))):
+                block = pos[rows, cols].tocsr()
+                block.sort_indices()
+                part["blocks"][name] = (block.indptr, block.indices, block.shape, block.data.astype(np.int64) - 1)
+            self._partition = part
+
+        # numeric: gather the values of K (new data arrays, shared patterns)
+        return {name: csr_matrix((K.data[src], indices, indptr), shape=shape, copy=False)
+                for name, (indptr, indices, shape, src) in part["blocks"].items()}
+
+    def _residual(self, model):
+        """
+        Update the domain for the trial displacements and compute the residual
+        :param model: Domain object
+        :return: residual of the free d.o.f.s, resisting force vector (all d.o.f.s)
+        """
+        uu, _ = self._dofs()
+        model._update()
+        Fint = model._resistingForce()
+        return model.F[uu] - Fint[uu], Fint
+
+    def _step(self, model, du, R0):
+        """
+        Residual after the increment du (already added to u), scaled by the
+        line search if any (the tangent and its factorization are not touched)
+        :param model: Domain object
+        :param du: increment of the free d.o.f.s
+        :param R0: residual before the increment
+        :return: residual, resisting force vector, increment actually taken
+        """
+        R, Fint = self._residual(model)
+        if self._line_search is not None:
+            eta, R, Fint = self._line_search._search(self, model, du, R0, R, Fint)
+            du = eta*du
+        return R, Fint, du
+
+    def _tangent(self, model, system):
+        """
+        Assemble the tangent stiffness and set the free block as system matrix
+        :param model: Domain object
+        :param system: System object
+        """
+        model._assembleTangent()
+        system._setA(self._blocks(model.K.tocsr())["Kuu"])
+
+    def _updateTangent(self, model, system, iteration):
+        """
+        Form the tangent if the tangent policy asks for it (otherwise the
+        cached factorization of the system is reused)
+        :param model: Domain object
+        :param system: System object
+        :param iteration: iteration of the current step (0: first)
+        """
+        if (self._tangent_policy == "iteration" or not self._is_initialized or
+                (self._tangent_policy == "step" and iteration == 0)):
+            self._tangent(model, system)
+            self._is_initialized = True
+
+    def _reactions(self, model, Fint):
+        """
+        Store the reactions (resisting force of the fixed d.o.f.s) in F
+        :param model: Domain object
+        :param Fint: resisting force vector (all d.o.f.s)
+        """
+        _, pp = self._dofs()
+        model.F[pp] = Fint[pp]
\ No newline at end of file
@@ -1,5 +1,61 @@
+##-----------------------------------------------------------------------##
+#                                                                         #
+#        #--oneFEM--#: One FEM software in a galaxy far far away          #
+#                                                                         #
+#                   Computational Mechanics 2025                          #
+#                   University of Chieti-Pescara                          #
+#                 Written by: Onur Deniz AKAN, Ud'A                       #
+#                         9 February 2025                                 #
+#                                                                         #
+##-----------------------------------------------------------------------##
+#NEWTON solver sub-object definition
+#   Newton-Raphson iterations K_t du = R(u), u += du. the tangent policy
+#   sets how often K_t is formed and factorized:
+#     - "iteration": full Newton (quadratic convergence, one factorization
+#       per iteration)
+#     - "step": modified Newton (one factorization per step)
+#     - "initial": initial-tangent Newton (one factorization per analysis)
+#   between two tangents the System keeps its factorization and every
+#   iteration costs one residual and one back substitution (plus the
+#   residuals of the line search, if any).
+
 from .main import Algorithm
 
 class Newton(Algorithm):
-    def __init__(self):
-        super().__init__()
\ No newline at end of file
+    def __init__(self, ID=-1, tangent="iteration", lineSearch=None):
+        """
+        Newton-Raphson algorithm
+        :param ID: algorithm ID
+        :param tangent: "iteration", "step" or "initial" (see Algorithm._tangent_policies)
+        :param lineSearch: (Optional) LineSearch object
+        """
+        super().__init__(ID, tangent, lineSearch)
+
+    def solve(self, model, system=None, test=None):
+        """
+        Iterate the current step to equilibrium
+        :param model: Domain object (u holds the trial displacements)
+        :param system: System object (default: UmfPack)
+        :param test: Test (or Analysis) object (default: NormUnbalance)
+        :return: True if converged
+        """
+        system, test = self._defaults(system, test)
+        uu, _ = self._dofs()
+        u = model.u
+
+        R, Fint = self._residual(model)
+        test._start()
+        iteration = 0
+        while True:
+            self._updateTangent(model, system, iteration)
+            du = system._solve(R)
+
+            u[uu] += du
+            R, Fint, du = self._step(model, du, R)
+            iteration += 1
+            if test._test(R, du):
+                self._reactions(model, Fint)
+                return True
+
+            if test._exhausted():
+                return False
@@ -1,10 +1,13 @@
 # oneFEM/analysis/eigen/__init__.py
 
 from .main import Eigen
+from .response_spectrum import ResponseSpectrum
 
 # delete modules imported from .py directories
 del main
+del response_spectrum
 
 __all__ = [
-    "Eigen"
+    "Eigen",
+    "ResponseSpectrum"
 ]
\ No newline at end of file
@@ -1,3 +1,229 @@
+##-----------------------------------------------------------------------##
+#                                                                         #
+#        #--oneFEM--#: One FEM software in a galaxy far far away          #
+#                                                                         #
+#                   Computational Mechanics 2025                          #
+#                   University of Chieti-Pescara                          #
+#                 Written by: Onur Deniz AKAN, Ud'A                       #
+#                         9 February 2025                                 #
+#                                                                         #
+##-----------------------------------------------------------------------##
+#EIGEN object definition
+#   generalized eigenproblem K phi = lambda M phi of the free d.o.f.s on the
+#   sparse assembled K and M (nodal masses and element consistent masses,
+#   see Domain._assembleMass). the modes nearest to the shift sigma are
+#   found by Lanczos (scipy eigsh) in shift-invert mode: the operator
+#   (K - sigma M)^-1 is applied with the factorization of a System object,
+#   so with sigma = 0 the factorization of Kuu of the static analysis is
+#   reused. the modes (M-normalized, expanded to all d.o.f.s) are cached
+#   on the domain, which drops them when K or M change.
+#   method="subspace": block subspace iteration on q = min(2p, p+8) vectors,
+#   started from the last modes of the domain (warm start, ex: after a
+#   construction stage or a gravity preload) and completed with random
+#   vectors. every iteration is a correction followed by a Rayleigh-Ritz
+#   projection on the current K and M:
+#       X <- X - P^-1 (K X - M X Lambda),   P = K_s - sigma M
+#   with the factorization of P current this is the classical subspace
+#   iteration X <- P^-1 M X (Lambda - sigma); with an older K_s it still
+#   converges to the modes of the current K, so P is only refactorized
+#   when the shift changes (or, as a safeguard, when an older K_s has not
+#   converged within refresh iterations). the p Ritz values nearest to
+#   sigma are kept; convergence is checked mode by mode on the relative
+#   change of these eigenvalues.
+
+import numpy as np
+from scipy.linalg import eigh
+from scipy.sparse.linalg import LinearOperator, eigsh
+from ..system.umfpack import UmfPack
+
 class Eigen(object):
-    def __init__(self):
-        pass
\ No newline at end of file
+    def __init__(self, ID=-1, nModes=10, sigma=0.0, tol=0.0, maxIter=None, method="lanczos", refresh=10):
+        """
+        Eigen solver
+        :param ID: eigen solver ID
+        :param nModes: number of modes
+        :param sigma: shift (the modes with eigenvalues nearest to sigma are found)
+        :param tol: relative accuracy of the eigenvalues (0: machine precision
+                    for lanczos, 1e-10 for subspace)
+        :param maxIter: maximum number of Lanczos restarts or subspace iterations
+                        (None: scipy default or 50)
+        :param method: "lanczos" or "subspace"
+        :param refresh: subspace iterations after which a factorization of an
+                        older K is replaced by one of the current K
+        """
+        if int(nModes) < 1:
+            raise ValueError("oneFEM.Eigen() - Number of modes must be positive!")
+        if method not in ("lanczos", "subspace"):
+            raise ValueError("oneFEM.Eigen() - Unknown method {}!".format(method))
+
+        self._ID = ID
+        self._nModes = int(nModes)
+        self._sigma = float(sigma)
+        self._tol = tol
+        self._maxIter = maxIter
+        self._method = method
+        self._refresh = int(refresh)
+        self._system = None         # default System object (kept between solutions)
+        self._shifted = None        # (system, sigma, matrix) of the factorized K_s - sigma M
+        self._nIter = 0             # iterations of the last subspace iteration
+        self._change = np.zeros(0)  # relative eigenvalue change of every mode at the last iteration
+        self._converged = np.zeros(0, dtype=bool)  # convergence of every mode
+        self._eigenvalues = np.zeros(0)
+        self._modes = np.zeros((0, 0))
+
+    def _matrices(self, model, dofs):
+        """
+        Free blocks of K and M (M is assembled if missing)
+        :return: Kuu, Muu (scipy.sparse CSR)
+        """
+        if not hasattr(model.M, "shape") or model.M.shape != (model.nDOF, model.nDOF):
+            model._assembleMass()
+        K = model.K.tocsr()
+        M = model.M.tocsr()
+        return K[dofs][:, dofs].tocsr(), M[dofs][:, dofs].tocsr()
+
+    def _cached(self, model, dofs):
+        """Return the cached modes of the domain if they answer this solution (else None)."""
+        modes = model.getModes()
+        if (modes is None or modes["sigma"] != self._sigma or
+                modes["eigenvalues"].shape[0] < self._nModes or not np.array_equal(modes["dofs"], dofs)):
+            return None
+        return modes
+
+    def _shift(self, system, Kuu, Muu, sigma, keep=False):
+        """
+        Set K - sigma M as system matrix
+        :param keep: keep the current factorization of the system if it was
+                     set by this solver with the same shift (K may have changed)
+        :return: (K - sigma M)^-1 as a scipy LinearOperator (System._solve)
+        """
+        shifted = self._shifted
+        if not (keep and shifted is not None and shifted[0] is system and shifted[1] == sigma and
+                system.getA() is shifted[2] and system.getA().shape == Kuu.shape):
+            system._setA(Kuu if sigma == 0.0 else (Kuu - sigma*Muu).tocsr())
+            self._shifted = (system, sigma, system.getA())
+        n = Kuu.shape[0]
+        return LinearOperator((n, n), matvec=lambda b: system._solve(np.ravel(b)), dtype=float)
+
+    @staticmethod
+    def _ritz(X, Kuu, Muu):
+        # Rayleigh-Ritz projection of K and M on the columns of X
+        Kr = X.T @ (Kuu @ X)
+        Mr = X.T @ (Muu @ X)
+        vals, Q = eigh(0.5*(Kr + Kr.T), 0.5*(Mr + Mr.T))
+        return vals, X @ Q
+
+    def _nearest(self, vals, p):
+        # Indices of the p Ritz values nearest to the shift
+        return np.argsort(np.abs(vals - self._sigma), kind="stable")[:p]
+
+    def _start(self, model, dofs, Muu, q):
+        """
+        Starting vectors of the subspace iteration: last modes of the domain
+        (warm start) completed with random vectors
+        :return: (n, q) starting vectors
+        """
+        n = dofs.shape[0]
+        X = np.random.default_rng(self._ID if self._ID >= 0 else 0).standard_normal((n, q))
+        X[:, 0] = Muu.diagonal()
+        last = model._getLastModes()
+        if last is not None and last["modes"].shape[0] == model.nDOF:
+            warm = last["modes"][dofs][:, :q]
+            X[:, :warm.shape[1]] = warm
+        return X
+
+    def _subspace(self, model, dofs, system, Kuu, Muu):
+        """
+        Block subspace iteration
+        :return: (nModes,) eigenvalues nearest to sigma, (n, nModes) M-normalized
+                 modes of the free d.o.f.s
+        """
+        p = self._nModes
+        n = Kuu.shape[0]
+        q = min(max(2*p, p + 8), n)
+        tol = self._tol if self._tol > 0.0 else 1e-10
+        maxIter = self._maxIter if self._maxIter is not None else 50
+
+        self._shift(system, Kuu, Muu, self._sigma, keep=True)
+        vals, X = self._ritz(self._start(model, dofs, Muu, q), Kuu, Muu)
+        keep = self._nearest(vals, p)
+        self._nIter = 0
+        self._change = np.full(p, np.inf)
+        while self._nIter < maxIter:
+            if self._nIter == self._refresh:
+                # safeguard: factorize the current K (no-op if it did not change)
+                self._shift(system, Kuu, Muu, self._sigma)
+            R = Kuu @ X - (Muu @ X)*vals
+            X = X - np.asarray(system._solve(R)).reshape(n, q)
+            new, X = self._ritz(X, Kuu, Muu)
+            self._nIter += 1
+
+            # compare the p Ritz values nearest to sigma (by distance rank)
+            near = self._nearest(new, p)
+            scale = np.maximum(np.abs(new[near]), np.finfo(float).tiny)
+            self._change = np.abs(new[near] - vals[keep])/scale
+            vals, keep = new, near
+            if np.all(self._change <= tol):
+                break
+
+        self._converged = self._change <= tol
+        return vals[keep], X[:, keep]
+
+    def solve(self, model, dofs=None, system=None):
+        """
+        Compute (or fetch from the domain cache) the modes
+        :param model: Domain object (assembled, see Domain._assemble)
+        :param dofs: (Optional) free d.o.f.s (default: Domain.getDOFPartition())
+        :param system: System object factorizing K - sigma M (default: UmfPack)
+        :return: (nModes,) eigenvalues, (nDOF, nModes) M-normalized mode shapes
+        """
+        dofs = model.getDOFPartition()[0] if dofs is None else np.asarray(dofs, dtype=np.int64)
+        modes = self._cached(model, dofs)
+        if modes is None:
+            if system is None:
+                if self._system is None:
+                    self._system = UmfPack()
+                system = self._system
+
+            Kuu, Muu = self._matrices(model, dofs)
+            if self._method == "subspace":
+                vals, vecs = self._subspace(model, dofs, system, Kuu, Muu)
+            else:
+                OPinv = self._shift(system, Kuu, Muu, self._sigma)
+                vals, vecs = eigsh(Kuu, k=self._nModes, M=Muu, sigma=self._sigma, which="LM",
+                                   OPinv=OPinv, tol=self._tol, maxiter=self._maxIter)
+
+            order = np.argsort(vals)
+            phi = np.zeros((model.nDOF, order.shape[0]))
+            phi[dofs] = vecs[:, order]
+            modes = {"eigenvalues": vals[order], "modes": phi, "dofs": dofs, "sigma": self._sigma}
+            model._setModes(modes)
+
+        self._eigenvalues = modes["eigenvalues"][:self._nModes]
+        self._modes = modes["modes"][:, :self._nModes]
+        return self._eigenvalues, self._modes
+
+    def getIterations(self):
+        """Return the number of iterations of the last subspace iteration."""
+        return self._nIter
+
+    def getConvergence(self):
+        """Return the relative eigenvalue change and the convergence flag of every mode (subspace)."""
+        return self._change, self._converged
+
+    def getEigenvalues(self):
+        """Return the eigenvalues (omega^2) of the last solution."""
+        return self._eigenvalues
+
+    def getModes(self):
+        """Return the (nDOF, nModes) mode shapes of the last solution."""
+        return self._modes
+
+    def getFrequencies(self):
+        """Return the circular frequencies omega of the last solution."""
+        return np.sqrt(np.maximum(self._eigenvalues, 0.0))
+
+    def getPeriods(self):
+        """Return the periods 2 pi / omega of the last solution."""
+        omega = self.getFrequencies()
+        return np.where(omega > 0.0, 2.0*np.pi/np.where(omega > 0.0, omega, 1.0), np.inf)
@@ -0,0 +1,136 @@
+##-----------------------------------------------------------------------##
+#                                                                         #
+#        #--oneFEM--#: One FEM software in a galaxy far far away          #
+#                                                                         #
+#                   Computational Mechanics 2025                          #
+#                   University of Chieti-Pescara                          #
+#                 Written by: Onur Deniz AKAN, Ud'A                       #
+#                         9 February 2025                                 #
+#                                                                         #
+##-----------------------------------------------------------------------##
+#RESPONSESPECTRUM object definition
+#   response spectrum analysis on the modes of an Eigen object. the
+#   spectral acceleration Sa(T) is read from a time series (ex: Path with
+#   time = period) for the periods of all modes at once; periods outside a
+#   tabulated spectrum (Path) take the value of the nearest end point, so
+#   short-period modes are not dropped with Sa = 0. with the influence
+#   vector i of the direction:
+#       L = Phi^T M i,  m = diag(Phi^T M Phi),  Gamma = L / m
+#       peak modal displacements  D = Gamma Sa / w^2,  U = Phi D
+#   every response quantity (rows) of every mode (columns) is a matrix R
+#   (nResp, nModes) and the modal peaks are combined for all the
+#   quantities at once:
+#     - SRSS: sqrt(sum_n R_n^2)
+#     - CQC:  sqrt(sum_ij R_i rho_ij R_j) = sqrt(rowsum((R rho) * R)), with
+#       the (nModes, nModes) correlation matrix rho (Der Kiureghian)
+
+import numpy as np
+from ...model.pattern.uniform_excitation import UniformExcitation
+
+class ResponseSpectrum(object):
+    def __init__(self, ID=-1, tseries=None, dof=1, damping=0.05, combination="CQC", factor=1.0):
+        """
+        Response spectrum analysis
+        :param ID: analysis ID
+        :param tseries: spectral acceleration as a function of the period (ex: Path)
+        :param dof: direction of the excitation (node d.o.f. e.g.: 1, 2, 3)
+        :param damping: modal damping ratio (float or one per mode)
+        :param combination: "CQC" or "SRSS"
+        :param factor: scale factor of the spectral accelerations
+        """
+        if tseries is None:
+            raise ValueError("oneFEM.ResponseSpectrum() - Spectrum time series is required!")
+        if combination not in ("CQC", "SRSS"):
+            raise ValueError("oneFEM.ResponseSpectrum() - Unknown combination {}!".format(combination))
+
+        self._ID = ID
+        self._excitation = UniformExcitation(ID, dof, tseries)
+        self._damping = damping
+        self._combination = combination
+        self._factor = float(factor)
+
+        self._omega = np.zeros(0)       # circular frequencies of the modes
+        self._zeta = np.zeros(0)        # damping ratios of the modes
+        self._gamma = np.zeros(0)       # participation factors
+        self._mass = np.zeros(0)        # effective modal masses
+        self._Sa = np.zeros(0)          # spectral accelerations of the modes
+        self._U = None                  # (nDOF, nModes) peak modal displacements
+        self._rho = None                # (nModes, nModes) CQC correlation matrix
+
+    @staticmethod
+    def _correlation(omega, zeta):
+        """
+        CQC correlation coefficients (Der Kiureghian 1981)
+        :return: (nModes, nModes) correlation matrix
+        """
+        r = omega[None, :]/omega[:, None]
+        zi, zj = zeta[:, None], zeta[None, :]
+        num = 8.0*np.sqrt(zi*zj)*(zi + r*zj)*r**1.5
+        den = (1.0 - r**2)**2 + 4.0*zi*zj*r*(1.0 + r**2) + 4.0*(zi**2 + zj**2)*r**2
+        return num/den
+
+    def _spectrum(self, T):
+        # Spectral accelerations of the periods T (clamped to the spectrum table)
+        tseries = self._excitation.getTSeries()
+        if hasattr(tseries, "getTime") and tseries.getTime().shape[0] > 0:
+            table = tseries.getTime()
+            T = np.clip(T, table[0], table[-1])
+        return np.asarray(tseries.getFactor(T), dtype=float)
+
+    def combine(self, R):
+        """
+        Combine modal peak responses
+        :param R: (..., nModes) peak responses of every mode (last axis)
+        :return: (...) combined peak responses
+        """
+        R = np.asarray(R, dtype=float)
+        if self._combination == "SRSS":
+            return np.sqrt(np.einsum('...n,...n->...', R, R))
+        return np.sqrt(np.maximum(np.einsum('...n,...n->...', R @ self._rho, R), 0.0))
+
+    def analyze(self, model, eigen, dofs=None):
+        """
+        Compute the participation factors, the peak modal responses and their combination
+        :param model: Domain object (assembled, see Domain._assemble)
+        :param eigen: Eigen object (its modes are computed or taken from the domain cache)
+        :param dofs: (Optional) free d.o.f.s (default: Domain.getDOFPartition())
+        :return: dict {"disp": (nDOF,), "reactions": (nDOF,), "element": (nElem, nMaxEDOF)} of combined peaks
+        """
+        lam, phi = eigen.solve(model, dofs)
+        if np.any(lam <= 0.0):
+            raise ValueError("oneFEM.ResponseSpectrum.analyze() - Modes must have positive eigenvalues!")
+
+        # participation factors and spectral values of all modes
+        Mi = -self._excitation._spatialLoad(model)                      # M i
+        L = phi.T @ Mi
+        m = np.einsum('ij,ij->j', phi, model.M @ phi)
+        self._omega = np.sqrt(lam)
+        self._zeta = np.broadcast_to(np.asarray(self._damping, dtype=float), lam.shape).copy()
+        self._gamma = L/m
+        self._mass = L**2/m
+        self._Sa = self._factor*self._spectrum(2.0*np.pi/self._omega)
+        self._rho = self._correlation(self._omega, self._zeta)
+
+        # peak modal responses (one column per mode)
+        self._U = phi*(self._gamma*self._Sa/lam)
+        F = model.K @ self._U
+        F[model.getDOFPartition()[0]] = 0.0         # reactions only
+        E = model._elementForces(self._U)
+
+        return {"disp": self.combine(self._U), "reactions": self.combine(F), "element": self.combine(E)}
+
+    def getParticipation(self):
+        """Return the participation factors and the effective modal masses."""
+        return self._gamma, self._mass
+
+    def getSpectralAccelerations(self):
+        """Return the spectral accelerations of the modes."""
+        return self._Sa
+
+    def getModalResponse(self):
+        """Return the (nDOF, nModes) peak modal displacements."""
+        return self._U
+
+    def getCorrelation(self):
+        """Return the (nModes, nModes) CQC correlation matrix."""
+        return self._rho
@@ -5,6 +5,7 @@ from .main import Integrator
 # dynamic integrators
 from .dynamic.central_difference import CDiff
 from .dynamic.newmark import Newmark
+from .dynamic.modal_superposition import ModalSuperposition
 
 # static integrators
 from .static.displacement_control import DispControl
@@ -21,6 +22,7 @@ __all__ = [
     "Integrator",
     "CDiff",
     "Newmark",
+    "ModalSuperposition",
     "DispControl",
     "LoadControl"
 ]
\ No newline at end of file
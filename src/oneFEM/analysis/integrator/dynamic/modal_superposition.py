@@ -0,0 +1,190 @@
+##-----------------------------------------------------------------------##
+#                                                                         #
+#        #--oneFEM--#: One FEM software in a galaxy far far away          #
+#                                                                         #
+#                   Computational Mechanics 2025                          #
+#                   University of Chieti-Pescara                          #
+#                 Written by: Onur Deniz AKAN, Ud'A                       #
+#                         9 February 2025                                 #
+#                                                                         #
+##-----------------------------------------------------------------------##
+#MODALSUPERPOSITION integrator sub-object definition
+#   linear transient analysis in modal coordinates u(t) = Phi q(t) with the
+#   first modes of an Eigen object. the loads of all patterns, F(t) =
+#   sum_p load_p factor_p(t) (UniformExcitation: -M i a_g(t)), are projected
+#   once for all the time steps: P = Phi^T [load_p] [factor_p(t_k)]. the
+#   uncoupled equations
+#       q'' + 2 zeta w q' + w^2 q = P(t) / m
+#   are integrated for all modes at once (numpy arrays over the modes):
+#     - "exact": piecewise linear load, exact recurrence (Nigam-Jennings)
+#     - "newmark": average acceleration (gamma = 1/2, beta = 1/4)
+#   the integration starts from the current u, v of the domain projected
+#   on the modes (q0 = Phi^T M u / m, ex: after a gravity preload); the part
+#   of u, v outside the retained modes is dropped. the response is expanded
+#   only on the d.o.f.s requested by the node recorders (relative response
+#   for support excitation).
+
+import numpy as np
+from scipy.sparse import issparse
+from ..main import Integrator
+
+class ModalSuperposition(Integrator):
+    def __init__(self, iID=-1, damping=0.05, method="exact"):
+        """
+        Modal superposition integrator
+        :param iID: integrator ID
+        :param damping: modal damping ratio (float or one per mode); None: from
+                        the domain damping matrix, zeta = phi^T C phi / (2 w m)
+        :param method: "exact" or "newmark"
+        """
+        super().__init__(iID)
+        if method not in ("exact", "newmark"):
+            raise ValueError("oneFEM.ModalSuperposition() - Unknown method {}!".format(method))
+
+        self._damping = damping
+        self._method = method
+        self._q = None          # (nModes, nSteps+1) modal displacements
+        self._qd = None         # (nModes, nSteps+1) modal velocities
+        self._qdd = None        # (nModes, nSteps+1) modal accelerations
+
+    def _modalLoads(self, model, phi, times):
+        """
+        Project the loads of all patterns on the modes for all time steps
+        :return: (nModes, nSteps+1) modal loads
+        """
+        patterns = model.getPatterns()
+        P = np.zeros((phi.shape[1], times.shape[0]))
+        if patterns:
+            S = np.column_stack([pattern._spatialLoad(model) for pattern in patterns])
+            factors = np.vstack([pattern.getTSeries().getFactor(times) for pattern in patterns])
+            P = (phi.T @ S) @ factors
+        return P
+
+    def _modalDamping(self, model, phi, omega, mass):
+        # Modal damping ratios (given, or projected from the domain damping matrix)
+        if self._damping is not None:
+            return np.broadcast_to(np.asarray(self._damping, dtype=float), omega.shape).copy()
+        if not issparse(model.C) and np.ndim(model.C) != 2:
+            raise ValueError("oneFEM.ModalSuperposition() - Damping matrix of the domain is not set!")
+        c = np.einsum('ij,ij->j', phi, model.C @ phi)
+        return c/(2.0*omega*mass)
+
+    @staticmethod
+    def _project(model, phi, x, mass):
+        # Modal coordinates Phi^T M x / m of a state vector (zero if unset)
+        if np.shape(x) != (model.nDOF,):
+            return np.zeros(phi.shape[1])
+        return (phi.T @ (model.M @ x))/mass
+
+    @staticmethod
+    def _exact(omega, zeta, dt, P, q0=0.0, qd0=0.0):
+        """
+        Exact recurrence for piecewise linear loads (underdamped modes)
+        :param omega: (nModes,) circular frequencies (> 0)
+        :param zeta: (nModes,) damping ratios (< 1)
+        :param P: (nModes, nSteps+1) modal loads per unit modal mass
+        :param q0: (nModes,) initial modal displacements
+        :param qd0: (nModes,) initial modal velocities
+        :return: q, q', q'' (nModes, nSteps+1)
+        """
+        s1 = np.sqrt(1.0 - zeta**2)
+        wd = omega*s1
+        e = np.exp(-zeta*omega*dt)
+        s = np.sin(wd*dt)
+        c = np.cos(wd*dt)
+        k = omega**2
+        zw = 2.0*zeta/(omega*dt)
+
+        A = e*(zeta/s1*s + c)
+        B = e*s/wd
+        C = (zw + e*(((1.0 - 2.0*zeta**2)/(wd*dt) - zeta/s1)*s - (1.0 + zw)*c))/k
+        D = (1.0 - zw + e*((2.0*zeta**2 - 1.0)/(wd*dt)*s + zw*c))/k
+        Ad = -e*omega/s1*s
+        Bd = e*(c - zeta/s1*s)
+        Cd = (-1.0/dt + e*((omega/s1 + zeta/(dt*s1))*s + c/dt))/k
+        Dd = (1.0 - e*(zeta/s1*s + c))/(k*dt)
+
+        q = np.zeros_like(P)
+        qd = np.zeros_like(P)
+        q[:, 0], qd[:, 0] = q0, qd0
+        for i in range(P.shape[1] - 1):
+            q[:, i + 1] = A*q[:, i] + B*qd[:, i] + C*P[:, i] + D*P[:, i + 1]
+            qd[:, i + 1] = Ad*q[:, i] + Bd*qd[:, i] + Cd*P[:, i] + Dd*P[:, i + 1]
+
+        qdd = P - 2.0*(zeta*omega)[:, None]*qd - k[:, None]*q
+        return q, qd, qdd
+
+    @staticmethod
+    def _newmark(omega, zeta, dt, P, q0=0.0, qd0=0.0, gamma=0.5, beta=0.25):
+        """
+        Newmark recurrence (average acceleration)
+        :param q0: (nModes,) initial modal displacements
+        :param qd0: (nModes,) initial modal velocities
+        :return: q, q', q'' (nModes, nSteps+1)
+        """
+        k = omega**2
+        c = 2.0*zeta*omega
+        kh = k + gamma/(beta*dt)*c + 1.0/(beta*dt**2)
+        a = 1.0/(beta*dt) + gamma/beta*c
+        b = 0.5/beta + dt*(0.5*gamma/beta - 1.0)*c
+
+        q = np.zeros_like(P)
+        qd = np.zeros_like(P)
+        qdd = np.zeros_like(P)
+        q[:, 0], qd[:, 0] = q0, qd0
+        qdd[:, 0] = P[:, 0] - c*qd[:, 0] - k*q[:, 0]
+        for i in range(P.shape[1] - 1):
+            dq = (P[:, i + 1] - P[:, i] + a*qd[:, i] + b*qdd[:, i])/kh
+            dqd = gamma/(beta*dt)*dq - gamma/beta*qd[:, i] + dt*(1.0 - 0.5*gamma/beta)*qdd[:, i]
+            q[:, i + 1] = q[:, i] + dq
+            qd[:, i + 1] = qd[:, i] + dqd
+            qdd[:, i + 1] = P[:, i + 1] - c*qd[:, i + 1] - k*q[:, i + 1]
+        return q, qd, qdd
+
+    def analyze(self, model, eigen, dt, nSteps, dofs=None):
+        """
+        Run the modal time history and fill the node recorders of the domain
+        :param model: Domain object (assembled, see Domain._assemble)
+        :param eigen: Eigen object (its modes are computed or taken from the domain cache)
+        :param dt: time step
+        :param nSteps: number of time steps
+        :param dofs: (Optional) free d.o.f.s (default: Domain.getDOFPartition())
+        :return: (nSteps+1,) time
+        """
+        if float(dt) <= 0.0:
+            raise ValueError("oneFEM.ModalSuperposition.analyze() - Time step must be positive!")
+        lam, phi = eigen.solve(model, dofs)
+        if np.any(lam <= 0.0):
+            raise ValueError("oneFEM.ModalSuperposition.analyze() - Modes must have positive eigenvalues!")
+        omega = np.sqrt(lam)
+        mass = np.einsum('ij,ij->j', phi, model.M @ phi)
+        zeta = self._modalDamping(model, phi, omega, mass)
+        if np.any(zeta >= 1.0) and self._method == "exact":
+            raise ValueError("oneFEM.ModalSuperposition.analyze() - Exact recurrence requires underdamped modes!")
+
+        # initial conditions: current state of the domain on the modes
+        q0, qd0 = (self._project(model, phi, x, mass) for x in (model.u, model.v))
+
+        times = float(dt)*np.arange(int(nSteps) + 1)
+        P = self._modalLoads(model, phi, times)/mass[:, None]
+        integrate = self._exact if self._method == "exact" else self._newmark
+        self._q, self._qd, self._qdd = integrate(omega, zeta, float(dt), P, q0, qd0)
+
+        # expand on the recorded d.o.f.s only
+        history = {"disp": self._q, "vel": self._qd, "accel": self._qdd}
+        for recorder in model.getRecorders():
+            if not hasattr(recorder, "getDOFs"):
+                continue
+            gd = np.asarray(recorder.getDOFs(), dtype=np.int64)
+            for result, kind in recorder._getKinematics():
+                recorder._setHistory(result, (phi[gd] @ history[kind]).T)
+
+        # final state of the domain
+        model.u = phi @ self._q[:, -1]
+        model.v = phi @ self._qd[:, -1]
+        model.a = phi @ self._qdd[:, -1]
+        return times
+
+    def getModalResponse(self):
+        """Return the modal displacements, velocities and accelerations (nModes, nSteps+1)."""
+        return self._q, self._qd, self._qdd
@@ -1,5 +1,310 @@
+##-----------------------------------------------------------------------##
+#                                                                         #
+#        #--oneFEM--#: One FEM software in a galaxy far far away          #
+#                                                                         #
+#                   Computational Mechanics 2025                          #
+#                   University of Chieti-Pescara                          #
+#                 Written by: Onur Deniz AKAN, Ud'A                       #
+#                         9 February 2025                                 #
+#                                                                         #
+##-----------------------------------------------------------------------##
+#NEWMARK integrator sub-object definition
+#   Newmark (gamma, beta) time integration of M a + C v + Fint(u) = F(t) on
+#   the free d.o.f.s. the effective stiffness
+#       K_eff = K + a0 M + a1 C,    a0 = 1/(beta dt^2), a1 = gamma/(beta dt)
+#   is formed and set on the System only when dt or the tangent K change, so
+#   a linear run costs one factorization and one back substitution per step
+#   (nonlinear runs refactorize according to the tangent policy, see
+#   Algorithm._tangent_policies). the predictor and the corrector update
+#   the preallocated u, v, a arrays of the domain in place. the initial
+#   acceleration solves M a = F - C v - Fint(u) on the d.o.f.s with mass;
+#   massless d.o.f.s (ex: frame rotations with translational nodal masses)
+#   are condensed statically.
+
+import numpy as np
+from scipy.sparse import csr_matrix, issparse
+from scipy.sparse.linalg import spsolve, splu
 from ..main import Integrator
+from ...system.umfpack import UmfPack
+from ...test.unbalanced_load import NormUnbalance
 
 class Newmark(Integrator):
-    def __init__(self):
-        pass
\ No newline at end of file
+    def __init__(self, iID=-1, gamma=0.5, beta=0.25, tangent="initial"):
+        """
+        Newmark integrator
+        :param iID: integrator ID
+        :param gamma: Newmark gamma (0.5: no numerical damping)
+        :param beta: Newmark beta (0.25: average acceleration, 1/6: linear acceleration)
+        :param tangent: tangent policy of nonlinear runs: "iteration", "step" or "initial"
+        """
+        super().__init__(iID)
+        if gamma < 0.5 or beta <= 0.0:
+            raise ValueError("oneFEM.Newmark() - gamma must be >= 0.5 and beta > 0!")
+        if tangent not in ("iteration", "step", "initial"):
+            raise ValueError("oneFEM.Newmark() - Unknown tangent policy {}!".format(tangent))
+
+        self._gamma = float(gamma)
+        self._beta = float(beta)
+        self._tangent_policy = tangent
+        self._dt = 0.0
+        self._c = np.zeros(6)           # Newmark coefficients a0..a5 of dt
+        self._dofs = None               # free d.o.f.s
+        self._Muu = None                # free blocks of M and C
+        self._Cuu = None
+        self._version = None            # stiffness version K_eff was formed with (Domain)
+        self._Keff = None               # effective stiffness (free d.o.f.s)
+        self._is_stale = True           # True if K_eff must be formed again
+        self._system = None             # default System object
+        self._work = None               # (3, nFree) preallocated work arrays
+        self._nForm = 0                 # number of K_eff formations
+
+    def _setDeltaT(self, dt):
+        """
+        Set the time step (K_eff is formed again only if dt changes)
+        :param dt: time step
+        """
+        dt = float(dt)
+        if dt <= 0.0:
+            raise ValueError("oneFEM.Newmark() - Time step must be positive!")
+        if dt != self._dt:
+            g, b = self._gamma, self._beta
+            self._dt = dt
+            self._c = np.array([1.0/(b*dt**2), g/(b*dt), 1.0/(b*dt),
+                                0.5/b - 1.0, g/b - 1.0, 0.5*dt*(g/b - 2.0)])
+            self._is_stale = True
+
+    def _setup(self, model, dofs):
+        """
+        Allocate u, v, a and the work arrays, and take the free blocks of M and C
+        :param model: Domain object (assembled, see Domain._assemble)
+        :param dofs: free d.o.f.s
+        """
+        n = model.nDOF
+        for name in ("u", "v", "a"):
+            if np.shape(getattr(model, name)) != (n,):
+                setattr(model, name, np.zeros(n))
+
+        if not hasattr(model.M, "shape") or model.M.shape != (n, n):
+            model._assembleMass()
+        self._dofs = dofs
+        self._Muu = csr_matrix(model.M)[dofs][:, dofs].tocsr()
+        self._Cuu = csr_matrix(model.C)[dofs][:, dofs].tocsr() if issparse(model.C) or np.ndim(model.C) == 2 else None
+        self._work = np.zeros((3, dofs.shape[0]))
+        self._version = None
+        self._is_stale = True
+
+    def _effective(self, model, system):
+        """
+        Set K_eff on the system, forming it only if dt or K (stiffness version of the domain) changed
+        :param model: Domain object
+        :param system: System object
+        """
+        version = model._getStiffnessVersion()
+        if not self._is_stale and version == self._version:
+            return
+
+        dofs = self._dofs
+        a0, a1 = self._c[0], self._c[1]
+        Keff = csr_matrix(model.K)[dofs][:, dofs] + a0*self._Muu
+        if self._Cuu is not None:
+            Keff = Keff + a1*self._Cuu
+        self._Keff = Keff.tocsr()
+        self._version = version
+        self._is_stale = False
+        self._nForm += 1
+        system._setA(self._Keff)
+
+    def _damping(self, x, out):
+        # out = C x on the free d.o.f.s (zero without damping matrix)
+        if self._Cuu is None:
+            out[:] = 0.0
+        else:
+            out[:] = self._Cuu @ x
+        return out
+
+    def _predict(self, model, un):
+        """
+        Newmark predictor/corrector for the trial displacements of the free d.o.f.s
+        (in place: v, a of the domain are updated from the last committed u, v, a)
+        :param un: last committed displacements of the free d.o.f.s
+        """
+        a0, _, a2, a3, _, _ = self._c
+        g, dt = self._gamma, self._dt
+        dofs = self._dofs
+        w = self._work[2]
+        an = self._work[1]
+
+        # a = a0 (u - un) - a2 vn - a3 an ;  v = vn + dt ((1 - g) an + g a)
+        an[:] = model.a[dofs]
+        np.subtract(model.u[dofs], un, out=w)
+        w *= a0
+        w -= a2*model.v[dofs]
+        w -= a3*an
+        model.a[dofs] = w
+        an *= (1.0 - g)*dt
+        an += (g*dt)*w
+        model.v[dofs] += an
+
+    def _inertia(self, model, out):
+        """
+        Effective load of the last committed state, in place:
+        out = M (a0 un + a2 vn + a3 an) + C (a1 un + a4 vn + a5 an)
+        """
+        a0, a1, a2, a3, a4, a5 = self._c
+        dofs = self._dofs
+        u, v, a = model.u[dofs], model.v[dofs], model.a[dofs]
+        w = self._work[0]
+
+        np.multiply(u, a0, out=w)
+        w += a2*v
+        w += a3*a
+        out[:] = self._Muu @ w
+        if self._Cuu is not None:
+            np.multiply(u, a1, out=w)
+            w += a4*v
+            w += a5*a
+            out += self._Cuu @ w
+        return out
+
+    def _initial(self, model, r):
+        """
+        Initial accelerations of the free d.o.f.s, M a = r. the massless
+        d.o.f.s o are condensed statically on the d.o.f.s with mass m:
+            M_mm a_m = r_m - K_mo K_oo^-1 r_o,    a_o = -K_oo^-1 K_om a_m
+        :param model: Domain object (K: current tangent)
+        :param r: (nFree,) unbalanced load F - C v - Fint(u) at the start
+        :return: (nFree,) initial accelerations
+        """
+        Muu = self._Muu
+        mass = np.asarray(abs(Muu).sum(axis=1)).ravel() > 0.0
+        if not np.any(mass):
+            raise ValueError("oneFEM.Newmark.analyze() - Free d.o.f.s have no mass!")
+
+        a = np.zeros(r.shape[0])
+        m = np.flatnonzero(mass)
+        o = np.flatnonzero(~mass)
+        with np.errstate(all="ignore"):
+            try:
+                if o.shape[0] == 0:
+                    a[:] = spsolve(Muu.tocsc(), r)
+                else:
+                    K = csr_matrix(model.K)[self._dofs][:, self._dofs]
+                    Koo = splu(K[o][:, o].tocsc())
+                    rm = r[m] - K[m][:, o] @ Koo.solve(r[o])
+                    a[m] = spsolve(Muu[m][:, m].tocsc(), rm)
+                    a[o] = -Koo.solve(K[o][:, m] @ a[m])
+            except RuntimeError:
+                a[:] = np.nan
+
+        if not np.all(np.isfinite(a)):
+            raise ValueError("oneFEM.Newmark.analyze() - Initial accelerations are not finite (singular mass or massless stiffness block)!")
+        return a
+
+    def _record(self, model, recorders, k):
+        # Store the response of step k in the recorder histories
+        state = {"disp": model.u, "vel": model.v, "accel": model.a}
+        for recorder, gd, history in recorders:
+            for kind, H in history.values():
+                H[k] = state[kind][gd]
+
+    def analyze(self, model, dt, nSteps, system=None, dofs=None, nonlinear=False, test=None):
+        """
+        Integrate the equations of motion from the current state of the domain
+        :param model: Domain object (assembled, see Domain._assemble)
+        :param dt: time step
+        :param nSteps: number of time steps
+        :param system: System object (default: UmfPack)
+        :param dofs: (Optional) free d.o.f.s (default: Domain.getDOFPartition())
+        :param nonlinear: iterate on the resisting force of the elements (Newton)
+        :param test: convergence test of nonlinear runs (default: NormUnbalance)
+        :return: (nSteps+1,) time
+        """
+        if system is None:
+            if self._system is None:
+                self._system = UmfPack()
+            system = self._system
+        test = NormUnbalance() if test is None else test
+        dofs = model.getDOFPartition()[0] if dofs is None else np.asarray(dofs, dtype=np.int64)
+
+        self._setDeltaT(dt)
+        self._setup(model, dofs)
+        times = self._dt*np.arange(int(nSteps) + 1)
+
+        # loads: spatial distributions and time factors of all patterns
+        patterns = model.getPatterns()
+        S = np.column_stack([pattern._spatialLoad(model)[dofs] for pattern in patterns]) if patterns else np.zeros((dofs.shape[0], 0))
+        factors = np.vstack([pattern.getTSeries().getFactor(times) for pattern in patterns]) if patterns else np.zeros((0, times.shape[0]))
+
+        # recorder histories (preallocated)
+        recorders = []
+        for recorder in model.getRecorders():
+            if hasattr(recorder, "getDOFs"):
+                gd = np.asarray(recorder.getDOFs(), dtype=np.int64)
+                history = {r: (kind, np.zeros((times.shape[0], gd.shape[0]))) for r, kind in recorder._getKinematics()}
+                recorders.append((recorder, gd, history))
+
+        # initial acceleration: M a = F - C v - Fint(u)
+        model._update()
+        p = self._work[1]
+        r = S @ factors[:, 0] - self._damping(model.v[dofs], p) - model._resistingForce()[dofs]
+        if np.any(r != 0.0):
+            model.a[dofs] = self._initial(model, r)
+        self._record(model, recorders, 0)
+
+        un = np.zeros(dofs.shape[0])
+        rhs = np.zeros(dofs.shape[0])
+        Fk = np.zeros(dofs.shape[0])
+        for k in range(1, times.shape[0]):
+            np.dot(S, factors[:, k], out=Fk)
+            un[:] = model.u[dofs]
+            if not nonlinear:
+                self._effective(model, system)
+                self._inertia(model, rhs)
+                rhs += Fk
+                model.u[dofs] = system._solve(rhs)
+                self._predict(model, un)
+            else:
+                self._iterate(model, system, test, Fk, un)
+
+            model._commit()
+            self._record(model, recorders, k)
+
+        for recorder, gd, history in recorders:
+            for result, (_, H) in history.items():
+                recorder._setHistory(result, H)
+        return times
+
+    def _iterate(self, model, system, test, Fk, un):
+        """
+        Newton iterations of a nonlinear step (constant displacement predictor)
+        :param Fk: external load of the free d.o.f.s at the end of the step
+        :param un: committed displacements of the free d.o.f.s
+        """
+        dofs = self._dofs
+        vn = model.v[dofs].copy()
+        an = model.a[dofs].copy()
+        w = self._work[2]
+        test._start()
+        iteration = 0
+        while True:
+            # dynamic residual of the trial state
+            model.v[dofs], model.a[dofs] = vn, an
+            self._predict(model, un)
+            model._update()
+            R = Fk - model._resistingForce()[dofs] - self._Muu @ model.a[dofs] - self._damping(model.v[dofs], w)
+            if iteration > 0 and test._test(R, du):
+                return
+            if iteration > 0 and test._exhausted():
+                raise ValueError("oneFEM.Newmark.analyze() - Step did not converge!")
+
+            # tangent: K_eff is formed again only if the tangent policy asks for it
+            if self._tangent_policy == "iteration" or (self._tangent_policy == "step" and iteration == 0) or self._version is None:
+                model._assembleTangent()
+                self._effective(model, system)
+            du = system._solve(R)
+            model.u[dofs] += du
+            iteration += 1
+
+    def getFormations(self):
+        """Return the number of effective stiffness formations."""
+        return self._nForm
@@ -38,6 +38,10 @@ class Analysis(object):
         # Initialize convergence-related properties
         self.__norm = None
         self.__nIter = None
+        self.__nFactor = 0                     # factorizations of the current step
+        self.__nSolve = 0                      # solves of the current step
+        self.__nFactor0 = 0
+        self.__nSolve0 = 0
         self.__verbosity = 0
         self.__is_converged = False
 
@@ -50,53 +54,69 @@ class Analysis(object):
                             numberer, system, test)
 
 
-    def __add_analysis(self, alg=None, const=None, integ=None 
+    def __add_analysis(self, alg=None, const=None, integ=None
                        , numb=None, syst=None, test=None):
-        # do some chekcs
-        if alg != None:
-            pass
-        
-        elif const != None:
-            pass
+        # store the analysis components (None keeps the current one)
+        if alg is not None:
+            self._solution_algorithm = alg
 
-        elif integ != None:
-            pass
+        if const is not None:
+            self._constraint_handler = const
 
-        elif numb != None:
-            pass
+        if integ is not None:
+            self._solution_integrator = integ
 
-        elif syst != None:
-            pass
+        if numb is not None:
+            self._dof_numberer = numb
 
-        elif test != None:
-            pass
+        if syst is not None:
+            self._system_of_equations = syst
+
+        if test is not None:
+            self._convergence_test = test
 
 
     def _organize(self, model):
-        # Identify and separate free and fixed DOFs
-        self.pp = []  # Fixed DOFs
-        self.uu = []  # Free DOFs
-        for node in model.nodes:
-            for j in range(node.nDOF):
-                if node.fix[j] == 1:  # Fixed node
-                    self.pp.append(node.dofs[j])
-                else:  # Free node
-                    self.uu.append(node.dofs[j])
-
-
-    def _test(self):
-        # update the norm and increment the number of iterations
+        # Identify and separate free and fixed DOFs (in d.o.f. number order) and
+        # pass them to the algorithm, which splits K into free/fixed blocks
+        self.uu, self.pp = model.getDOFPartition()     # Free and fixed DOFs
+        if self._solution_algorithm is not None:
+            self._solution_algorithm._setDOFs(self.uu, self.pp)
+        if self._system_of_equations is not None and self._dof_numberer is not None:
+            self._system_of_equations._setOrdering(self._dof_numberer, self.uu)
+        if hasattr(self._system_of_equations, "_setBlocks"):
+            self._system_of_equations._setBlocks(model.getDOFNodes(self.uu))
+
+
+    def _start(self):
+        # start the iterations of a step: reset the convergence test and
+        # the factorization and solve counters of the step
         self.__is_converged = False
+        self.__nIter = 0
+        self._convergence_test._start()
+        self.__nFactor0 = self._system_of_equations._nFactor
+        self.__nSolve0 = self._system_of_equations._nSolve
+
 
-        # compute the norm
-        self__norm = self._convergence_test.norm()
+    def _test(self, R, du):
+        # test the convergence of an iteration (called by the algorithms in
+        # place of the Test object) and count the factorizations and solves
+        self.__is_converged = self._convergence_test._test(R, du)
 
-        # check for convergence
-        if self.__norm < self._convergence_tolerance:
-            self.__is_converged = True
+        # store the norm, the iterations and the solver counts of the step
+        self.__norm = self._convergence_test.norm()
+        self.__nIter = self._convergence_test.getIterations()
+        self.__nFactor = self._system_of_equations._nFactor - self.__nFactor0
+        self.__nSolve = self._system_of_equations._nSolve - self.__nSolve0
 
         # print some stats if requested
-        self.convergence()  
+        self._convergence()
+        return self.__is_converged
+
+
+    def _exhausted(self):
+        # True if the maximum number of iterations of the test is reached
+        return self._convergence_test._exhausted()
 
 
     # ANALYSIS API (called upon by the SimManager)
@@ -105,8 +125,15 @@ class Analysis(object):
         # verbose:  0 print now and nothing later
         #           1 print now and keep printing after each converge
         #           2 print now and keep printing after each test
-        __current_convergence_info = "{:8.6f}  {:d}".format(self.__norm, self.__nIter)
-        __step_convergence_info = "{:8.6f}  {:d}".format(self.__norm, self.__nIter)
+        __current_convergence_info = "{:8.6f}  {:d}  {:d}/{:d}".format(self.__norm, self.__nIter, self.__nFactor, self.__nSolve)
+        __step_convergence_info = "{:8.6f}  {:d}  {:d}/{:d}".format(self.__norm, self.__nIter, self.__nFactor, self.__nSolve)
+
+        # append the linear solver statistics (ex: Krylov iterations, residual)
+        if self._system_of_equations is not None:
+            __solver_info = self._system_of_equations._report()
+            if __solver_info:
+                __current_convergence_info += "  " + __solver_info
+                __step_convergence_info += "  " + __solver_info
         if verbose == -1:
             if self.__verbosity == 1 and self.__is_converged:
                 print(__step_convergence_info)
@@ -118,3 +145,8 @@ class Analysis(object):
     def _analyze(self, model, nSteps=None, dt=None):
         # Trigger a step of analysis
         pass
+
+
+    def getCounts(self):
+        # return the (factorizations, solves) of the current step
+        return self.__nFactor, self.__nSolve
@@ -3,14 +3,17 @@
 from .main import Numberer
 from .plain import Plain
 from .reverse_cuthill_mckee import RevCuthillMcKee
+from .nested_dissection import NestedDissection
 
 # delete modules imported from .py directories
 del main
 del plain
 del reverse_cuthill_mckee
+del nested_dissection
 
 __all__ = [
     "Numberer",
     "Plain",
-    "RevCuthillMcKee"
+    "RevCuthillMcKee",
+    "NestedDissection"
 ]
\ No newline at end of file
@@ -1,3 +1,210 @@
+##-----------------------------------------------------------------------##
+#                                                                         #
+#        #--oneFEM--#: One FEM software in a galaxy far far away          #
+#                                                                         #
+#                   Computational Mechanics 2025                          #
+#                   University of Chieti-Pescara                          #
+#                 Written by: Onur Deniz AKAN, Ud'A                       #
+#                         9 February 2025                                 #
+#                                                                         #
+##-----------------------------------------------------------------------##
+#NUMBERER main object definition
+#   assigns the global d.o.f.s of the domain nodes. a numberer computes a
+#   node ordering (subclasses override _order()), the d.o.f.s of the nodes
+#   are then numbered consecutively in that order through Node._setDOF.
+#   bandwidth and profile of the stiffness matrix before and after the
+#   numbering are computed from the node graph of the domain adjacency; the
+#   predicted factor nonzeros (symbolic factorization, costly on large
+#   meshes) only when they are asked for (report() or getFactorNNZ()).
+
+import numpy as np
+
+
+def _neighbours(graph, frontier):
+    # Gather the neighbours of a set of nodes
+    # :return: neighbours and the position of their parent in the set
+    indptr, indices = graph
+    counts = indptr[frontier + 1] - indptr[frontier]
+    total = int(np.sum(counts))
+    parent = np.repeat(np.arange(frontier.shape[0]), counts)
+    offset = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+    return indices[np.repeat(indptr[frontier], counts) + offset], parent
+
+
 class Numberer(object):
-    def __init__(self, ID=-1):
-        self._ID = ID
\ No newline at end of file
+    # True if the ordering reduces the fill of a sparse factorization
+    # (Systems then factorize in the given order, see System._setOrdering)
+    _fill_reducing = False
+
+    def __init__(self, ID=-1, verbose=False):
+        self._ID = ID
+        self._verbose = verbose     # print the bandwidth/profile report
+        self._permutation = None    # node permutation (rows of the node store)
+        self._report = {}           # bandwidth/profile/factor nnz before and after
+        self._symbolic = None       # (graph, first before, first after, ndof) of the factor prediction
+
+    def _order(self, model, graph):
+        """
+        Compute the node ordering (default: node store row order)
+        :param model: Domain object
+        :param graph: indptr, indices of the node graph (node store rows)
+        :return: (nNodes,) array of node store rows in the new order
+        """
+        return np.arange(graph[0].shape[0] - 1)
+
+    @staticmethod
+    def _first(order, ndof):
+        """
+        Compute the first global d.o.f. of every node for a node ordering
+        :param order: (nNodes,) node store rows in numbering order
+        :param ndof: (nNodes,) number of d.o.f.s of each node (row order)
+        :return: (nNodes,) first d.o.f. of each node (row order)
+        """
+        first = np.empty(order.shape[0], dtype=np.int64)
+        first[order] = np.cumsum(ndof[order]) - ndof[order]
+        return first
+
+    @staticmethod
+    def _bandwidthProfile(graph, first, ndof):
+        """
+        Compute the half bandwidth and the profile (envelope size) of K
+        :param graph: indptr, indices of the node graph
+        :param first: (nNodes,) first d.o.f. of each node
+        :param ndof: (nNodes,) number of d.o.f.s of each node
+        :return: bandwidth (int), profile (int)
+        """
+        indptr, indices = graph
+        nNodes = first.shape[0]
+        if nNodes == 0:
+            return 0, 0
+
+        # lowest/highest first d.o.f. among each node and its neighbours
+        low = first.copy()
+        high = first + ndof - 1
+        has = np.diff(indptr) > 0
+        if indices.shape[0] > 0:
+            starts = indptr[:-1][has]
+            low[has] = np.minimum(low[has], np.minimum.reduceat(first[indices], starts))
+            high[has] = np.maximum(high[has], np.maximum.reduceat((first + ndof - 1)[indices], starts))
+
+        bandwidth = int(np.max(high - first))
+
+        # every row r of a node spans the columns low..r of the lower triangle
+        profile = int(np.sum(ndof*(first - low) + ndof*(ndof - 1)//2))
+        return bandwidth, profile
+
+    @staticmethod
+    def _factorNNZ(graph, first, ndof):
+        """
+        Predict the nonzeros of the Cholesky factor L of K (symbolic factorization
+        of the node graph: elimination tree and row subtrees, nodal blocks)
+        :param graph: indptr, indices of the node graph
+        :param first: (nNodes,) first d.o.f. of each node
+        :param ndof: (nNodes,) number of d.o.f.s of each node
+        :return: number of nonzeros of L (int)
+        """
+        indptr, indices = graph
+        nNodes = first.shape[0]
+        order = np.argsort(first, kind="stable")
+        pos = np.empty(nNodes, dtype=np.int64)
+        pos[order] = np.arange(nNodes)
+
+        # lower neighbours (in elimination order) of every eliminated node
+        ptr = indptr.tolist()
+        nbr = pos[indices].tolist()
+        size = ndof[order].tolist()
+        rows = [[j for j in nbr[ptr[v]:ptr[v + 1]] if j < k] for k, v in enumerate(order.tolist())]
+
+        # elimination tree (Liu's algorithm with path compression)
+        parent = [-1]*nNodes
+        ancestor = [-1]*nNodes
+        for k in range(nNodes):
+            for j in rows[k]:
+                while ancestor[j] != -1 and ancestor[j] != k:
+                    next_j = ancestor[j]
+                    ancestor[j] = k
+                    j = next_j
+                if ancestor[j] == -1:
+                    ancestor[j], parent[j] = k, k
+
+        # row k of L: union of the etree paths from its lower neighbours to k
+        mark = [-1]*nNodes
+        nnz = sum(n*(n + 1)//2 for n in size)
+        for k in range(nNodes):
+            mark[k] = k
+            for j in rows[k]:
+                while mark[j] != k:
+                    mark[j] = k
+                    nnz += size[k]*size[j]
+                    j = parent[j]
+
+        return nnz
+
+    # NUMBERER API
+    def number(self, model):
+        """
+        Number the d.o.f.s of the domain nodes
+        :param model: Domain object
+        :return: total number of d.o.f.s
+        """
+        store = model.getNodeStore()
+        nodes = store.getNodes()
+        ndof = np.array(store.getNDOF(), dtype=np.int64)
+        graph = model.getAdjacency().getNodeGraph(nodes)
+
+        # bandwidth/profile of the current numbering (row order if unnumbered)
+        dofs = store.getDOFs()
+        if nodes and np.all(dofs[:, 0] >= 0):
+            first = dofs[:, 0].copy()
+        else:
+            first = self._first(np.arange(len(nodes)), ndof)
+        before_first = first
+        before = self._bandwidthProfile(graph, first, ndof)
+
+        order = np.asarray(self._order(model, graph), dtype=np.int64)
+        if order.shape[0] != len(nodes):
+            raise ValueError("oneFEM.{}.number() - Node ordering does not cover all nodes!".format(type(self).__name__))
+
+        first = self._first(order, ndof)
+        for row, node in enumerate(nodes):
+            node._setDOF(list(range(first[row], first[row] + ndof[row])))
+
+        after = self._bandwidthProfile(graph, first, ndof)
+        self._permutation = order
+        self._symbolic = (graph, before_first, first, ndof)
+        self._report = {"bandwidth": (before[0], after[0]), "profile": (before[1], after[1])}
+        if self._verbose:
+            self.report()
+
+        return int(np.sum(ndof))
+
+    def _factor(self):
+        # Predict the factor nonzeros (before, after) on first request
+        if "factor" not in self._report and self._symbolic is not None:
+            graph, before, after, ndof = self._symbolic
+            self._report["factor"] = (self._factorNNZ(graph, before, ndof), self._factorNNZ(graph, after, ndof))
+            self._symbolic = None
+        return self._report.get("factor")
+
+    def report(self):
+        """Print the bandwidth, profile and factor nonzeros before and after the numbering."""
+        if self._report:
+            self._factor()
+            print("{}: bandwidth {} -> {}, profile {} -> {}, factor nnz {} -> {}".format(type(self).__name__,
+                  *self._report["bandwidth"], *self._report["profile"], *self._report["factor"]))
+
+    def getOrder(self):
+        """Return the node permutation (node store rows in numbering order)."""
+        return self._permutation
+
+    def getBandwidth(self):
+        """Return the half bandwidth of K (before, after) the numbering."""
+        return self._report.get("bandwidth")
+
+    def getProfile(self):
+        """Return the profile of K (before, after) the numbering."""
+        return self._report.get("profile")
+
+    def getFactorNNZ(self):
+        """Return the predicted nonzeros of the factor of K (before, after) the numbering (computed on first call)."""
+        return self._factor()
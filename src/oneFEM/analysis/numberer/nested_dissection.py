@@ -0,0 +1,75 @@
+##-----------------------------------------------------------------------##
+#                                                                         #
+#        #--oneFEM--#: One FEM software in a galaxy far far away          #
+#                                                                         #
+#                   Computational Mechanics 2025                          #
+#                   University of Chieti-Pescara                          #
+#                 Written by: Onur Deniz AKAN, Ud'A                       #
+#                         9 February 2025                                 #
+#                                                                         #
+##-----------------------------------------------------------------------##
+#NESTEDDISSECTION numberer sub-object definition
+#   geometric nested dissection: fill-reducing ordering for 2D/3D solid
+#   meshes. the nodes are split at the median coordinate of their longest
+#   extent; the nodes of one side that touch the other side form a vertex
+#   separator. both halves are ordered recursively and the separator is
+#   numbered last, so eliminating one half never fills the other. small
+#   parts are left in their input order.
+
+import numpy as np
+from .main import Numberer, _neighbours
+
+
+class NestedDissection(Numberer):
+    # Systems keep this ordering when factorizing (see System._setOrdering)
+    _fill_reducing = True
+
+    def __init__(self, nID=-1, leaf=16, verbose=False):
+        """
+        Geometric nested dissection numberer
+        :param nID: numberer ID
+        :param leaf: size of the parts that are not dissected further
+        :param verbose: print the bandwidth/profile/factor report
+        """
+        super().__init__(nID, verbose)
+        self._leaf = max(int(leaf), 2)
+
+    def _order(self, model, graph):
+        """
+        Compute the nested dissection ordering of the node graph
+        :param model: Domain object (node coordinates)
+        :param graph: indptr, indices of the node graph (node store rows)
+        :return: (nNodes,) array of node store rows in the new order
+        """
+        coords = np.asarray(model.getNodeStore().getCoordinates(), dtype=float)
+        side = np.zeros(coords.shape[0], dtype=np.int8)  # 1/2: halves of the current part
+
+        def dissect(part):
+            if part.shape[0] <= self._leaf or coords.shape[1] == 0:
+                return [part]
+
+            # median split along the longest extent of the part
+            x = coords[part]
+            axis = int(np.argmax(np.ptp(x, axis=0)))
+            split = np.argsort(x[:, axis], kind="stable")
+            half = part.shape[0] // 2
+            left, right = part[split[:half]], part[split[half:]]
+
+            # separator: boundary of the side with the fewer boundary nodes
+            side[left], side[right] = 1, 2
+            nbrs, parent = _neighbours(graph, part)
+            cut = (side[part][parent] == 1) & (side[nbrs] == 2)
+            left_boundary = np.unique(part[parent[cut]])
+            right_boundary = np.unique(nbrs[cut])
+            side[part] = 0
+
+            separator = left_boundary if left_boundary.shape[0] <= right_boundary.shape[0] else right_boundary
+            if separator.shape[0] >= part.shape[0] - 1:
+                return [part]
+
+            # halves first, separator last
+            left = np.setdiff1d(left, separator, assume_unique=True)
+            right = np.setdiff1d(right, separator, assume_unique=True)
+            return dissect(left) + dissect(right) + [separator]
+
+        return np.concatenate(dissect(np.arange(coords.shape[0])))
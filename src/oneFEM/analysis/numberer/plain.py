@@ -1,6 +1,10 @@
 from .main import Numberer
 
 class Plain(Numberer):
-    def __init__(self, nID):
-        super().__init__(nID)
-        
\ No newline at end of file
+    def __init__(self, nID=-1, verbose=False):
+        """
+        Plain numberer: d.o.f.s are numbered in the order the nodes were added
+        :param nID: numberer ID
+        :param verbose: print the bandwidth/profile report
+        """
+        super().__init__(nID, verbose)
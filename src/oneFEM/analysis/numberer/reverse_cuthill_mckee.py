@@ -1,5 +1,94 @@
-from .main import Numberer
+##-----------------------------------------------------------------------##
+#                                                                         #
+#        #--oneFEM--#: One FEM software in a galaxy far far away          #
+#                                                                         #
+#                   Computational Mechanics 2025                          #
+#                   University of Chieti-Pescara                          #
+#                 Written by: Onur Deniz AKAN, Ud'A                       #
+#                         9 February 2025                                 #
+#                                                                         #
+##-----------------------------------------------------------------------##
+#REVCUTHILLMCKEE numberer sub-object definition
+#   reverse Cuthill-McKee ordering of the node graph. every connected
+#   component is started from a pseudo-peripheral node (George-Liu search
+#   over rooted level structures) and traversed breadth first, visiting
+#   the neighbours of each node by increasing degree. the traversal is
+#   processed level by level with numpy gathers; the final order is
+#   reversed, which keeps the bandwidth and reduces the profile.
+
+import numpy as np
+from .main import Numberer, _neighbours
+
+
+def _levels(graph, root, visited):
+    # Rooted level structure (breadth first levels) of the component of root
+    visited = visited.copy()
+    visited[root] = True
+    levels = [np.array([root], dtype=np.int64)]
+    while True:
+        nbrs, _ = _neighbours(graph, levels[-1])
+        nbrs = np.unique(nbrs[~visited[nbrs]])
+        if nbrs.shape[0] == 0:
+            return levels
+        visited[nbrs] = True
+        levels.append(nbrs)
+
+
+def _pseudo_peripheral(graph, degree, root, visited):
+    # George-Liu pseudo-peripheral node search starting at root
+    levels = _levels(graph, root, visited)
+    while True:
+        last = levels[-1]
+        candidate = last[np.argmin(degree[last])]
+        candidate_levels = _levels(graph, candidate, visited)
+        if len(candidate_levels) <= len(levels):
+            return root
+        root, levels = candidate, candidate_levels
+
 
 class RevCuthillMcKee(Numberer):
-    def __init__(self):
-        pass
\ No newline at end of file
+    def __init__(self, nID=-1, verbose=False):
+        """
+        Reverse Cuthill-McKee numberer
+        :param nID: numberer ID
+        :param verbose: print the bandwidth/profile report
+        """
+        super().__init__(nID, verbose)
+
+    def _order(self, model, graph):
+        """
+        Compute the reverse Cuthill-McKee ordering of the node graph
+        :param model: Domain object
+        :param graph: indptr, indices of the node graph (node store rows)
+        :return: (nNodes,) array of node store rows in the new order
+        """
+        indptr = graph[0]
+        nNodes = indptr.shape[0] - 1
+        degree = np.diff(indptr)
+        visited = np.zeros(nNodes, dtype=bool)
+        order = []
+
+        # components are started from their lowest degree unvisited node
+        for seed in np.argsort(degree, kind="stable"):
+            if visited[seed]:
+                continue
+
+            start = _pseudo_peripheral(graph, degree, seed, visited)
+            visited[start] = True
+            frontier = np.array([start], dtype=np.int64)
+            while frontier.shape[0] > 0:
+                order.append(frontier)
+                nbrs, parent = _neighbours(graph, frontier)
+                keep = ~visited[nbrs]
+                nbrs, parent = nbrs[keep], parent[keep]
+
+                # visit by parent order, then by increasing degree;
+                # a node reached by several parents is taken at the first one
+                sort = np.lexsort((degree[nbrs], parent))
+                nbrs = nbrs[sort]
+                _, first = np.unique(nbrs, return_index=True)
+                frontier = nbrs[np.sort(first)]
+                visited[frontier] = True
+
+        order = np.concatenate(order) if order else np.array([], dtype=np.int64)
+        return order[::-1]
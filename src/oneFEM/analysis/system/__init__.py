@@ -3,14 +3,26 @@
 from .main import System
 from .umfpack import UmfPack
 from .fullgeneral import FullGeneral
+from .band_spd import BandSPD
+from .iterative import Iterative
+from .amg import SmoothedAggregation
+from .schwarz import AdditiveSchwarz
 
 # delete modules imported from .py directories
 del main
 del umfpack
 del fullgeneral
+del band_spd
+del iterative
+del amg
+del schwarz
 
 __all__ = [
     "System",
     "FullGeneral",
-    "UmfPack"
+    "UmfPack",
+    "BandSPD",
+    "Iterative",
+    "SmoothedAggregation",
+    "AdditiveSchwarz"
 ]
\ No newline at end of file
@@ -0,0 +1,227 @@
+##-----------------------------------------------------------------------##
+#                                                                         #
+#        #--oneFEM--#: One FEM software in a galaxy far far away          #
+#                                                                         #
+#                   Computational Mechanics 2025                          #
+#                   University of Chieti-Pescara                          #
+#                 Written by: Onur Deniz AKAN, Ud'A                       #
+#                         9 February 2025                                 #
+#                                                                         #
+##-----------------------------------------------------------------------##
+#SMOOTHEDAGGREGATION preconditioner object definition
+#   smoothed aggregation algebraic multigrid (Vanek, Mandel, Brezina) with
+#   numpy and scipy.sparse only. the d.o.f.s are grouped in blocks (nodes)
+#   and the block graph of strong connections is aggregated; the near
+#   nullspace B (rigid body modes, see Domain.getRigidBodyModes) is
+#   orthonormalized per aggregate to give the tentative prolongator, which
+#   is smoothed by one damped jacobi step. the preconditioner applies one
+#   symmetric V-cycle (jacobi smoothing, direct coarsest solve).
+#   setup is split like the System factorization:
+#     - _setup: aggregates, tentative prolongators and coarse nullspaces
+#       (kept while the sparsity pattern of A does not change)
+#     - _update: smoothed prolongators and Galerkin coarse matrices
+#       (recomputed when the values of A change, ex: Newton iterations)
+
+import numpy as np
+from scipy.sparse import csr_matrix, diags
+from scipy.sparse.linalg import LinearOperator, splu
+
+class SmoothedAggregation(object):
+    def __init__(self, theta=0.0, max_levels=10, coarse_size=500, sweeps=2, omega=4.0/3.0):
+        """
+        Smoothed aggregation AMG preconditioner
+        :param theta: strength of connection threshold
+        :param max_levels: maximum number of levels
+        :param coarse_size: size below which the system is solved directly
+        :param sweeps: number of jacobi pre- and post-smoothing sweeps
+        :param omega: jacobi weight of the smoothers and of the prolongator
+                      smoothing (scaled by 1/rho(D^-1 A))
+        """
+        self._theta = theta
+        self._max_levels = int(max_levels)
+        self._coarse_size = int(coarse_size)
+        self._sweeps = int(sweeps)
+        self._omega = omega
+        self._levels = []           # list of dicts {"T", "A", "Dinv", "omega", "P"}
+        self._coarse = None         # direct factorization of the coarsest matrix
+
+    @staticmethod
+    def _strength(A, label, nBlocks, theta):
+        """
+        Block graph of strong connections
+        :return: indptr, indices of the strong block neighbours (no self loops)
+        """
+        A = A.tocoo()
+        S = csr_matrix((A.data**2, (label[A.row], label[A.col])), shape=(nBlocks, nBlocks))
+        S.sum_duplicates()
+        d = np.sqrt(np.abs(S.diagonal()))
+        rows = np.repeat(np.arange(nBlocks), np.diff(S.indptr))
+        keep = (rows != S.indices) & (np.sqrt(S.data) >= theta*d[rows]*d[S.indices]) & (S.data > 0.0)
+        S = csr_matrix((np.ones(np.count_nonzero(keep)), (rows[keep], S.indices[keep])), shape=(nBlocks, nBlocks))
+        return S.indptr, S.indices
+
+    @staticmethod
+    def _aggregate(indptr, indices):
+        """
+        Greedy aggregation of the strong block graph
+        :return: (nBlocks,) aggregate of each block, number of aggregates
+        """
+        nBlocks = indptr.shape[0] - 1
+        ptr = indptr.tolist()
+        nbr = indices.tolist()
+        agg = [-1]*nBlocks
+        nAgg = 0
+
+        # pass 1: root blocks whose neighbours are all free
+        for i in range(nBlocks):
+            if agg[i] != -1:
+                continue
+            neighbours = nbr[ptr[i]:ptr[i + 1]]
+            if all(agg[j] == -1 for j in neighbours):
+                agg[i] = nAgg
+                for j in neighbours:
+                    agg[j] = nAgg
+                nAgg += 1
+
+        # pass 2: attach the remaining blocks to a neighbouring aggregate
+        pending = [i for i in range(nBlocks) if agg[i] == -1]
+        attach = {}
+        for i in pending:
+            for j in nbr[ptr[i]:ptr[i + 1]]:
+                if agg[j] != -1:
+                    attach[i] = agg[j]
+                    break
+        for i, a in attach.items():
+            agg[i] = a
+
+        # pass 3: isolated leftovers form their own aggregates
+        for i in range(nBlocks):
+            if agg[i] == -1:
+                agg[i] = nAgg
+                for j in nbr[ptr[i]:ptr[i + 1]]:
+                    if agg[j] == -1:
+                        agg[j] = nAgg
+                nAgg += 1
+
+        return np.array(agg, dtype=np.int64), nAgg
+
+    @staticmethod
+    def _tentative(B, dof_agg, nAgg):
+        """
+        Tentative prolongator: per aggregate QR of the nullspace rows
+        :param B: (n, k) near nullspace
+        :param dof_agg: (n,) aggregate of each d.o.f.
+        :return: T (n, nAgg*k) sparse, coarse nullspace (nAgg*k, k)
+        """
+        n, k = B.shape
+        order = np.argsort(dof_agg, kind="stable")
+        counts = np.bincount(dof_agg, minlength=nAgg)
+        pos = np.empty(n, dtype=np.int64)
+        pos[order] = np.arange(n) - np.repeat(np.cumsum(counts) - counts, counts)
+
+        # padded stack of aggregate nullspaces: (nAgg, m, k), m >= k
+        m = max(int(counts.max()), k)
+        Bagg = np.zeros((nAgg, m, k))
+        Bagg[dof_agg, pos] = B
+        Q, R = np.linalg.qr(Bagg)
+
+        # fix the sign so that R has a non-negative diagonal
+        sign = np.where(np.einsum('aii->ai', R) < 0.0, -1.0, 1.0)
+        Q *= sign[:, None, :]
+        R *= sign[:, :, None]
+
+        rows = np.repeat(np.arange(n), k)
+        cols = (dof_agg[:, None]*k + np.arange(k)).ravel()
+        T = csr_matrix((Q[dof_agg, pos].ravel(), (rows, cols)), shape=(n, nAgg*k))
+        return T, R.reshape(nAgg*k, k)
+
+    @staticmethod
+    def _rho(A, Dinv, iterations=15):
+        # Spectral radius estimate of D^-1 A (power iterations)
+        x = np.random.default_rng(0).random(A.shape[0])
+        rho = 1.0
+        for _ in range(iterations):
+            y = Dinv*(A @ x)
+            norm = np.linalg.norm(y)
+            if norm == 0.0:
+                break
+            rho = norm/np.linalg.norm(x)
+            x = y/norm
+        return rho
+
+    def _setup(self, A, B, label=None):
+        """
+        Build the aggregation hierarchy (symbolic setup) and the coarse matrices
+        :param A: coefficient matrix (scipy.sparse)
+        :param B: (n, k) near nullspace (ex: rigid body modes)
+        :param label: (Optional) (n,) block (node) of each d.o.f. (default: blocks of k d.o.f.s)
+        """
+        A = csr_matrix(A)
+        B = np.asarray(B, dtype=float).reshape(A.shape[0], -1)
+        k = B.shape[1]
+        if label is None:
+            label = np.arange(A.shape[0]) // k
+        else:
+            _, label = np.unique(label, return_inverse=True)
+
+        self._levels = []
+        while A.shape[0] > self._coarse_size and len(self._levels) < self._max_levels - 1:
+            nBlocks = int(label.max()) + 1
+            agg, nAgg = self._aggregate(*self._strength(A, label, nBlocks, self._theta))
+            if nAgg*k >= A.shape[0]:
+                break
+
+            T, B = self._tentative(B, agg[label], nAgg)
+            level = {"T": T}
+            self._levels.append(level)
+            A = self._smooth(level, A)
+            label = np.repeat(np.arange(nAgg), k)
+
+        self._coarse = splu(A.tocsc())
+
+    def _smooth(self, level, A):
+        # Smoothed prolongator and Galerkin coarse matrix of a level
+        d = A.diagonal()
+        Dinv = np.where(d != 0.0, 1.0/np.where(d != 0.0, d, 1.0), 0.0)
+        omega = self._omega/self._rho(A, Dinv)
+        P = level["T"] - omega*(diags(Dinv) @ (A @ level["T"]))
+        level.update({"A": A, "Dinv": Dinv, "omega": omega, "P": P.tocsr()})
+        return (P.T @ A @ P).tocsr()
+
+    def _update(self, A):
+        """
+        Recompute the prolongators and coarse matrices for new values of A
+        (the aggregates and tentative prolongators are kept)
+        :param A: coefficient matrix with the same sparsity pattern
+        """
+        A = csr_matrix(A)
+        for level in self._levels:
+            A = self._smooth(level, A)
+        self._coarse = splu(A.tocsc())
+
+    def _cycle(self, i, b):
+        # V-cycle on level i
+        if i == len(self._levels):
+            return self._coarse.solve(b)
+
+        level = self._levels[i]
+        A, Dinv, omega = level["A"], level["Dinv"], level["omega"]
+
+        x = omega*Dinv*b
+        for _ in range(self._sweeps - 1):
+            x += omega*Dinv*(b - A @ x)
+
+        x += level["P"] @ self._cycle(i + 1, level["P"].T @ (b - A @ x))
+
+        for _ in range(self._sweeps):
+            x += omega*Dinv*(b - A @ x)
+        return x
+
+    def getOperator(self):
+        """Return the preconditioner as a scipy LinearOperator."""
+        n = self._levels[0]["A"].shape[0] if self._levels else self._coarse.shape[0]
+        return LinearOperator((n, n), matvec=lambda r: self._cycle(0, np.ravel(r)), dtype=float)
+
+    def getLevels(self):
+        """Return the number of levels of the hierarchy."""
+        return len(self._levels) + 1
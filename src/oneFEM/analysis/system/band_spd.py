@@ -0,0 +1,44 @@
+import numpy as np
+from scipy.linalg import cholesky_banded, cho_solve_banded
+from .main import System
+
+class BandSPD(System):
+    def __init__(self, sID=-1):
+        """
+        Banded symmetric positive definite solver (LAPACK band storage)
+        memory scales with nDOF*bandwidth: number the d.o.f.s with a
+        bandwidth-reducing numberer (ex: RevCuthillMcKee)
+        :param sID: system ID
+        """
+        super().__init__(sID)
+        self._bandwidth = 0     # half bandwidth of A
+        self._band_index = None # position in the band storage of the lower entries of A
+        self._lower = None      # mask of the lower triangle entries of A.data
+        self._cb = None         # Cholesky factor in lower band storage (bandwidth+1, n)
+
+    def _factorize(self):
+        """Scatter A into lower band storage and compute its Cholesky factor."""
+        A = self._A
+        n = A.shape[0]
+        if not self._is_analyzed:
+            # band map of the pattern: entry (r, c), r >= c -> ab[r - c, c]
+            rows = np.repeat(np.arange(n), np.diff(A.indptr))
+            self._lower = rows >= A.indices
+            offset = rows[self._lower] - A.indices[self._lower]
+            self._bandwidth = int(offset.max()) if offset.size else 0
+            self._band_index = offset*n + A.indices[self._lower]
+
+        ab = np.zeros((self._bandwidth + 1, n))
+        ab.flat[self._band_index] = A.data[self._lower]
+        try:
+            self._cb = cholesky_banded(ab, overwrite_ab=True, lower=True)
+        except np.linalg.LinAlgError:
+            raise ValueError("oneFEM.BandSPD._factorize() - Coefficient matrix is not positive definite!")
+
+    def _backsolve(self, b):
+        """Solve A x = b with the banded Cholesky factor of A."""
+        return cho_solve_banded((self._cb, True), b)
+
+    def getBandwidth(self):
+        """Return the half bandwidth of the coefficient matrix."""
+        return self._bandwidth
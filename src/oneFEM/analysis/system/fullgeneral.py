@@ -1,6 +1,15 @@
+from scipy.linalg import lu_factor, lu_solve
 from .main import System
 
 class FullGeneral(System):
-    def __init__(self, sID):
+    def __init__(self, sID=-1):
         super().__init__(sID)
-        
\ No newline at end of file
+        self._lu = None     # dense LU factorization (lu, piv)
+
+    def _factorize(self):
+        """Factorize A with a dense LU factorization."""
+        self._lu = lu_factor(self._A.toarray())
+
+    def _backsolve(self, b):
+        """Solve A x = b with the dense LU factorization of A."""
+        return lu_solve(self._lu, b)
@@ -0,0 +1,218 @@
+import numpy as np
+from inspect import signature
+from scipy.sparse.linalg import LinearOperator, cg, gmres, bicgstab, spilu
+from .main import System
+from .amg import SmoothedAggregation
+from .schwarz import AdditiveSchwarz
+
+# relative tolerance keyword of the Krylov solvers (tol before scipy 1.12)
+_RTOL = "rtol" if "rtol" in signature(cg).parameters else "tol"
+
+class Iterative(System):
+    # Krylov solvers (scipy.sparse.linalg)
+    _methods = {"cg": cg, "gmres": gmres, "bicgstab": bicgstab}
+    # multilevel preconditioner objects (_setup(A, B, label), _update(A), getOperator())
+    _multilevel = (SmoothedAggregation, AdditiveSchwarz)
+
+    def __init__(self, sID=-1, method="cg", preconditioner="jacobi", tol=1e-8, maxiter=None, block=6,
+                 drop_tol=1e-4, fill_factor=10, strict=True):
+        """
+        Preconditioned Krylov solver for large systems
+        :param sID: system ID
+        :param method: "cg" (SPD), "gmres" or "bicgstab" (general)
+        :param preconditioner: None, "jacobi", "block-jacobi", "ilu", "amg",
+                               a SmoothedAggregation or an AdditiveSchwarz object
+        :param tol: relative residual tolerance
+        :param maxiter: maximum number of iterations (None: solver default)
+        :param block: block size of block-jacobi if no node map is set (see _setBlocks,
+                      set by Analysis from Domain.getDOFNodes())
+        :param drop_tol: drop tolerance of the incomplete LU factorization
+        :param fill_factor: fill ratio upper bound of the incomplete LU factorization
+        :param strict: raise if a solve does not converge within maxiter
+                       (False: return the last iterate, see getHistory())
+        """
+        super().__init__(sID)
+        if method not in self._methods:
+            raise ValueError("oneFEM.Iterative() - Unknown method {}!".format(method))
+        if preconditioner == "amg":
+            preconditioner = SmoothedAggregation()
+        if not isinstance(preconditioner, self._multilevel) and preconditioner not in (None, "jacobi", "block-jacobi", "ilu"):
+            raise ValueError("oneFEM.Iterative() - Unknown preconditioner {}!".format(preconditioner))
+
+        self._method = method
+        self._preconditioner = preconditioner
+        self._tol = tol
+        self._maxiter = maxiter
+        self._block = int(block)
+        self._blocks = None         # block label of each row (None: contiguous blocks of size block)
+        self._drop_tol = drop_tol
+        self._fill_factor = fill_factor
+        self._strict = strict
+
+        self._nullspace = None      # near nullspace of A for AMG (ex: rigid body modes)
+        self._M = None              # preconditioner (LinearOperator)
+        self._x0 = None             # initial guess (last solution)
+        self._nIter = 0             # iterations of the last solve
+        self._residual = 0.0        # relative residual of the last solve
+        self._is_converged = True   # False if the last solve reached maxiter
+        self._history = []          # (iterations, relative residual) of every solve
+
+    def _setA(self, A):
+        """Set the coefficient matrix (sparse, dense or scipy LinearOperator)."""
+        if isinstance(A, LinearOperator):
+            # matrix-free operator: the preconditioner is rebuilt on every change
+            self._A = A
+            self._is_analyzed = False
+            self._is_factored = False
+        else:
+            if isinstance(self._A, LinearOperator):
+                self._A = None
+            super()._setA(A)
+
+    def _setBlocks(self, blocks):
+        """
+        Set the blocks of block-jacobi (ex: node of each free d.o.f.)
+        :param blocks: (n,) block label of each row of A
+        """
+        blocks = None if blocks is None else np.asarray(blocks, dtype=np.int64)
+        if blocks is None and self._blocks is None or (
+                blocks is not None and self._blocks is not None and np.array_equal(blocks, self._blocks)):
+            return
+        self._blocks = blocks
+        self._is_analyzed = False   # AMG aggregates follow the blocks
+        self._is_factored = False
+
+    def _setNullspace(self, B):
+        """
+        Set the near nullspace used by the AMG preconditioner
+        :param B: (n, k) near nullspace vectors (ex: Domain.getRigidBodyModes())
+        """
+        self._nullspace = None if B is None else np.asarray(B, dtype=float)
+        self._is_analyzed = False
+        self._is_factored = False
+
+    def _diagonalBlocks(self, n):
+        """
+        Extract the diagonal blocks of A (operators add them with addDiagonalBlocks())
+        :return: (nBlocks, m, m) blocks (identity padded), block label and position of each row
+        """
+        A = self._A
+        if self._blocks is None:
+            label = np.arange(n) // self._block
+        else:
+            _, label = np.unique(self._blocks, return_inverse=True)
+
+        # position of each row inside its block
+        order = np.argsort(label, kind="stable")
+        counts = np.bincount(label)
+        pos = np.empty(n, dtype=np.int64)
+        pos[order] = np.arange(n) - np.repeat(np.cumsum(counts) - counts, counts)
+
+        m = int(counts.max()) if counts.size else 0
+        blocks = np.zeros((counts.shape[0], m, m))
+        blocks[:, np.arange(m), np.arange(m)] = 1.0
+        blocks[label, pos, pos] = 0.0
+
+        if isinstance(A, LinearOperator):
+            if not hasattr(A, "addDiagonalBlocks"):
+                raise ValueError("oneFEM.Iterative._factorize() - Operator does not provide its diagonal blocks!")
+            A.addDiagonalBlocks(blocks, label, pos)
+        else:
+            rows = np.repeat(np.arange(n), np.diff(A.indptr))
+            keep = label[rows] == label[A.indices]
+            np.add.at(blocks, (label[rows[keep]], pos[rows[keep]], pos[A.indices[keep]]), A.data[keep])
+
+        return blocks, label, pos
+
+    def _factorize(self):
+        """Set up the preconditioner of A."""
+        A = self._A
+        n = A.shape[0]
+        if self._preconditioner is None:
+            self._M = None
+
+        elif self._preconditioner == "jacobi":
+            if isinstance(A, LinearOperator):
+                if not hasattr(A, "diagonal"):
+                    raise ValueError("oneFEM.Iterative._factorize() - Operator does not provide its diagonal!")
+                d = np.asarray(A.diagonal(), dtype=float)
+            else:
+                d = A.diagonal()
+            if np.any(d == 0.0):
+                raise ValueError("oneFEM.Iterative._factorize() - Zero on the diagonal, jacobi preconditioner is not defined!")
+            inv = 1.0/d
+            self._M = LinearOperator((n, n), matvec=lambda r: inv*r.ravel(), dtype=float)
+
+        elif self._preconditioner == "block-jacobi":
+            blocks, label, pos = self._diagonalBlocks(n)
+            inv = np.linalg.inv(blocks)
+            m = blocks.shape[1]
+
+            def apply(r):
+                rb = np.zeros((inv.shape[0], m))
+                rb[label, pos] = r.ravel()
+                return np.einsum('bij,bj->bi', inv, rb)[label, pos]
+
+            self._M = LinearOperator((n, n), matvec=apply, dtype=float)
+
+        elif isinstance(self._preconditioner, self._multilevel):
+            if isinstance(A, LinearOperator):
+                raise ValueError("oneFEM.Iterative._factorize() - {} requires an assembled matrix!".format(type(self._preconditioner).__name__))
+            precond = self._preconditioner
+            if not self._is_analyzed:
+                B = self._nullspace if self._nullspace is not None else np.ones((n, 1))
+                precond._setup(A, B, self._blocks if self._blocks is not None else np.arange(n) // self._block)
+            else:
+                precond._update(A)
+            self._M = precond.getOperator()
+
+        else:
+            if isinstance(A, LinearOperator):
+                raise ValueError("oneFEM.Iterative._factorize() - Incomplete LU requires an assembled matrix!")
+            ilu = spilu(A.tocsc(), drop_tol=self._drop_tol, fill_factor=self._fill_factor)
+            self._M = LinearOperator((n, n), matvec=ilu.solve, dtype=float)
+
+    def _backsolve(self, b):
+        """Solve A x = b with the Krylov method for one or several right-hand sides."""
+        if b.ndim == 2:
+            return np.column_stack([self._backsolve(b[:, i]) for i in range(b.shape[1])])
+
+        count = [0]
+        def callback(*args):
+            count[0] += 1
+
+        kwargs = {_RTOL: self._tol, "atol": 0.0, "maxiter": self._maxiter, "M": self._M, "callback": callback}
+        if self._method == "gmres":
+            kwargs["callback_type"] = "pr_norm"
+
+        x0 = self._x0 if self._x0 is not None and self._x0.shape == b.shape else None
+        x, info = self._methods[self._method](self._A, b, x0=x0, **kwargs)
+        if info < 0:
+            raise ValueError("oneFEM.Iterative._solve() - Illegal input or breakdown in {}!".format(self._method))
+
+        norm = np.linalg.norm(b)
+        self._nIter = count[0]
+        self._is_converged = info == 0
+        self._residual = np.linalg.norm(b - self._A @ x)/norm if norm > 0.0 else 0.0
+        self._history.append((self._nIter, self._residual))
+        if not self._is_converged and self._strict:
+            raise ValueError("oneFEM.Iterative._solve() - {} did not converge in {} iterations (residual {:.3e})!".format(
+                self._method, self._nIter, self._residual))
+        self._x0 = x
+        return x
+
+    def _report(self):
+        """Return the iteration count and residual of the last solve."""
+        return "{:d} it  {:.3e}{}".format(self._nIter, self._residual, "" if self._is_converged else "  (not converged)")
+
+    def getIterations(self):
+        """Return the number of iterations of the last solve."""
+        return self._nIter
+
+    def getResidual(self):
+        """Return the relative residual of the last solve."""
+        return self._residual
+
+    def getHistory(self):
+        """Return the (iterations, relative residual) of every solve."""
+        return self._history
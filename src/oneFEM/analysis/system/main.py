@@ -1,3 +1,95 @@
+##-----------------------------------------------------------------------##
+#                                                                         #
+#        #--oneFEM--#: One FEM software in a galaxy far far away          #
+#                                                                         #
+#                   Computational Mechanics 2025                          #
+#                   University of Chieti-Pescara                          #
+#                 Written by: Onur Deniz AKAN, Ud'A                       #
+#                         9 February 2025                                 #
+#                                                                         #
+##-----------------------------------------------------------------------##
+#SYSTEM main object definition
+#   holds the coefficient matrix A of the system of equations A x = b and
+#   its factorization. subclasses implement _factorize() and _backsolve().
+#   the factorization is cached: _setA() compares the new matrix with the
+#   current one and only discards what changed
+#     - same pattern and values: the numeric factorization is reused
+#     - same pattern, new values: the symbolic analysis is reused
+#     - new pattern: both are recomputed on the next solve
+
+import numpy as np
+from scipy.sparse import csr_matrix
+
 class System(object):
     def __init__(self, ID=-1):
-        self._ID = ID
\ No newline at end of file
+        self._ID = ID
+        self._A = None              # coefficient matrix (scipy.sparse.csr_matrix)
+        self._permc_spec = "COLAMD" # column ordering of sparse factorizations
+        self._is_analyzed = False   # True if the symbolic analysis matches the pattern of A
+        self._is_factored = False   # True if the numeric factorization matches A
+        self._nFactor = 0           # number of numeric factorizations
+        self._nSolve = 0            # number of solves
+
+    def _setA(self, A):
+        """Set the coefficient matrix of the system (sparse or dense)."""
+        A = csr_matrix(A)
+        A.sort_indices()
+        old = self._A
+        if old is None or old.shape != A.shape or not (
+                (old.indptr is A.indptr or np.array_equal(old.indptr, A.indptr)) and
+                (old.indices is A.indices or np.array_equal(old.indices, A.indices))):
+            self._is_analyzed = False
+            self._is_factored = False
+        elif not np.array_equal(old.data, A.data):
+            self._is_factored = False
+
+        self._A = A
+
+    def _setOrdering(self, numberer, dofs=None):
+        """
+        Consume the d.o.f. ordering of a numberer: a fill-reducing numbering
+        is kept as is (NATURAL) if the rows of A follow it, otherwise the
+        factorization reorders (COLAMD)
+        :param numberer: Numberer object that numbered the domain
+        :param dofs: global d.o.f. of every row of A (ex: free d.o.f.s of Kuu);
+                     A follows the numbering only if they are increasing
+        """
+        ordered = dofs is not None and bool(np.all(np.diff(np.asarray(dofs)) > 0))
+        permc_spec = "NATURAL" if numberer._fill_reducing and ordered else "COLAMD"
+        if permc_spec != self._permc_spec:
+            self._permc_spec = permc_spec
+            self._is_analyzed = False
+            self._is_factored = False
+
+    def _factorize(self):
+        """Factorize A (reusing the symbolic analysis if _is_analyzed)."""
+        raise NotImplementedError("SYSTEM._factorize(): method must be implemented by subclasses.")
+
+    def _backsolve(self, b):
+        """Solve A x = b with the current factorization of A."""
+        raise NotImplementedError("SYSTEM._backsolve(): method must be implemented by subclasses.")
+
+    def _solve(self, b):
+        """
+        Solve the system A x = b and return x
+        :param b: right-hand side (n,) or right-hand sides (n, nRHS)
+        """
+        if self._A is None:
+            raise ValueError("oneFEM.{}._solve() - Coefficient matrix is not set!".format(type(self).__name__))
+
+        if not self._is_factored:
+            self._factorize()
+            self._is_analyzed = True
+            self._is_factored = True
+            self._nFactor += 1
+
+        self._nSolve += 1
+        return self._backsolve(np.asarray(b, dtype=float))
+
+    def _report(self):
+        """Return the solver statistics of the last solve (for the convergence printout)."""
+        return ""
+
+    def getA(self):
+        """Return the coefficient matrix of the system."""
+        return self._A
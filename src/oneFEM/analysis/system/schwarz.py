@@ -0,0 +1,131 @@
+##-----------------------------------------------------------------------##
+#                                                                         #
+#        #--oneFEM--#: One FEM software in a galaxy far far away          #
+#                                                                         #
+#                   Computational Mechanics 2025                          #
+#                   University of Chieti-Pescara                          #
+#                 Written by: Onur Deniz AKAN, Ud'A                       #
+#                         9 February 2025                                 #
+#                                                                         #
+##-----------------------------------------------------------------------##
+#ADDITIVESCHWARZ preconditioner object definition
+#   two-level overlapping additive Schwarz domain decomposition
+#       M^-1 r = sum_i R_i^T A_i^-1 R_i r + Z (Z^T A Z)^-1 Z^T r
+#   A_i are the subdomain matrices (see CoordinateBisection) and Z is the
+#   coarse space: the near nullspace (ex: rigid body modes) restricted to
+#   every non-overlapping subdomain. the subdomain matrices are factorized
+#   in parallel, each one in its own worker process (concurrent.futures),
+#   where the factor stays to apply the local solves of every iteration.
+#   with parallel=False the factors are kept in the calling process.
+
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from scipy.sparse import csr_matrix
+from scipy.sparse.linalg import LinearOperator, splu
+
+# subdomain factor of a worker process (one subdomain per worker)
+_FACTOR = None
+
+def _factorize_subdomain(A):
+    # Factorize the subdomain matrix in the worker process
+    global _FACTOR
+    _FACTOR = splu(A.tocsc())
+    return A.shape[0]
+
+def _solve_subdomain(r):
+    # Solve with the subdomain factor of the worker process
+    return _FACTOR.solve(r)
+
+
+class AdditiveSchwarz(object):
+    def __init__(self, subdomains, owner=None, parallel=True):
+        """
+        Overlapping additive Schwarz preconditioner with coarse correction
+        :param subdomains: list of d.o.f. arrays of the subdomains (see CoordinateBisection.partition)
+        :param owner: (Optional) (n,) non-overlapping subdomain of each d.o.f. (None: no coarse correction)
+        :param parallel: factorize and solve the subdomains in worker processes
+        """
+        self._workers = []          # one single-process executor per subdomain (set first, see _close)
+        self._subdomains = [np.asarray(dofs, dtype=np.int64) for dofs in subdomains]
+        self._owner = None if owner is None else np.asarray(owner, dtype=np.int64)
+        self._parallel = parallel
+        self._factors = []          # subdomain factors (parallel=False)
+        self._B = None              # near nullspace of the coarse space
+        self._Z = None              # coarse space basis (n, nParts*k)
+        self._A0inv = None          # inverse of the coarse matrix Z^T A Z
+
+    def _setup(self, A, B=None, label=None):
+        """
+        Factorize the subdomain and coarse matrices
+        :param A: coefficient matrix (scipy.sparse)
+        :param B: (Optional) (n, k) near nullspace of the coarse space (default: constant)
+        :param label: unused (block labels, see SmoothedAggregation._setup)
+        """
+        A = csr_matrix(A)
+        n = A.shape[0]
+        self._B = np.ones((n, 1)) if B is None else np.asarray(B, dtype=float).reshape(n, -1)
+
+        # coarse space: nullspace restricted to each non-overlapping subdomain
+        if self._owner is not None:
+            k = self._B.shape[1]
+            rows = np.repeat(np.arange(n), k)
+            cols = (self._owner[:, None]*k + np.arange(k)).ravel()
+            self._Z = csr_matrix((self._B.ravel(), (rows, cols)), shape=(n, len(self._subdomains)*k))
+
+        self._update(A)
+
+    def _update(self, A):
+        """
+        Refactorize the subdomain and coarse matrices for new values of A
+        :param A: coefficient matrix (same subdomains)
+        """
+        A = csr_matrix(A)
+        local = [A[dofs][:, dofs].tocsc() for dofs in self._subdomains]
+
+        if self._parallel:
+            if len(self._workers) != len(local):
+                self._close()
+                self._workers = [ProcessPoolExecutor(max_workers=1) for _ in local]
+            futures = [worker.submit(_factorize_subdomain, Ai) for worker, Ai in zip(self._workers, local)]
+            for future in futures:
+                future.result()
+        else:
+            self._factors = [splu(Ai) for Ai in local]
+
+        if self._Z is not None:
+            A0 = (self._Z.T @ A @ self._Z).toarray()
+            self._A0inv = np.linalg.pinv(A0, hermitian=True)
+
+    def _apply(self, r):
+        # M^-1 r: sum of the subdomain corrections and of the coarse correction
+        r = np.ravel(r)
+        z = np.zeros_like(r, dtype=float)
+        if self._parallel:
+            futures = [worker.submit(_solve_subdomain, r[dofs]) for worker, dofs in zip(self._workers, self._subdomains)]
+            for future, dofs in zip(futures, self._subdomains):
+                z[dofs] += future.result()
+        else:
+            for factor, dofs in zip(self._factors, self._subdomains):
+                z[dofs] += factor.solve(r[dofs])
+
+        if self._Z is not None:
+            z += self._Z @ (self._A0inv @ (self._Z.T @ r))
+        return z
+
+    def _close(self):
+        """Shut down the worker processes."""
+        for worker in getattr(self, "_workers", []):
+            worker.shutdown(wait=True)
+        self._workers = []
+
+    def __del__(self):
+        self._close()
+
+    def getOperator(self):
+        """Return the preconditioner as a scipy LinearOperator."""
+        n = self._B.shape[0]
+        return LinearOperator((n, n), matvec=self._apply, dtype=float)
+
+    def getSubdomains(self):
+        """Return the number of subdomains."""
+        return len(self._subdomains)
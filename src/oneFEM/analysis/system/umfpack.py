@@ -1,12 +1,60 @@
-from scipy.sparse.linalg import use_solver
+import numpy as np
+from scipy.sparse.linalg import splu
 from .main import System
 
+# scikit-umfpack is optional: SuperLU (scipy) is used when it is missing
+try:
+    from scikits.umfpack import UmfpackContext, UMFPACK_A
+except ImportError:
+    UmfpackContext = None
+
 class UmfPack(System):
-    def __init__(self):
-        # Check if UMFPACK is enabled
-        use_solver(useUmfpack=True)
+    def __init__(self, sID=-1):
+        """
+        Sparse direct solver (UMFPACK, or SuperLU if scikit-umfpack is missing)
+        with cached symbolic analysis and numeric factorization
+        :param sID: system ID
+        """
+        super().__init__(sID)
+        self._context = None    # UmfpackContext (symbolic + numeric objects)
+        self._csc = None        # A in CSC storage (UMFPACK solves)
+        self._lu = None         # SuperLU factorization
+        self._perm = None       # inverse of the SuperLU column ordering (symmetric permutation)
+        self._is_permuted = False
+
+    def _factorize(self):
+        """Factorize A, reusing the symbolic analysis (ordering) if possible."""
+        A = self._A.tocsc()
+        if UmfpackContext is not None:
+            if not self._is_analyzed:
+                self._context = UmfpackContext("di")
+                self._context.symbolic(A)
+            self._context.numeric(A)
+            self._csc = A
 
+        elif not self._is_analyzed:
+            # first factorization: SuperLU computes the column ordering
+            self._lu = splu(A, permc_spec=self._permc_spec)
+            # perm_c maps column i to position perm_c[i]: A[ip][:, ip] is the reordered matrix
+            self._perm = np.argsort(self._lu.perm_c)
+            self._is_permuted = False
 
+        else:
+            # refactorization: keep the ordering, factorize P A P^T as is
+            ip = self._perm
+            self._lu = splu(A[ip][:, ip].tocsc(), permc_spec="NATURAL")
+            self._is_permuted = True
 
+    def _backsolve(self, b):
+        """Solve A x = b for one or several right-hand sides (columns of b)."""
+        if UmfpackContext is not None:
+            if b.ndim == 1:
+                return self._context.solve(UMFPACK_A, self._csc, b)
+            return np.column_stack([self._context.solve(UMFPACK_A, self._csc, b[:, i]) for i in range(b.shape[1])])
 
+        if not self._is_permuted:
+            return self._lu.solve(b)
 
+        x = np.empty_like(b)
+        x[self._perm] = self._lu.solve(b[self._perm])
+        return x
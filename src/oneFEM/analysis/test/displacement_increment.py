@@ -1,5 +1,10 @@
+import numpy as np
 from .main import Test
 
 class NormDispIncr(Test):
-    def __init__(self):
-        pass
\ No newline at end of file
+    def __init__(self, tID=-1, tol=1e-8, maxIter=25):
+        super().__init__(tID, tol, maxIter)
+
+    def _norm_of(self, R, du):
+        """Norm of the displacement increment (infinite before the first solve)."""
+        return np.inf if du is None else np.linalg.norm(du)
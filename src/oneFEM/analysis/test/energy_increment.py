@@ -1,5 +1,10 @@
+import numpy as np
 from .main import Test
 
 class EnergyIncr(Test):
-    def __init__(self):
-        pass
\ No newline at end of file
+    def __init__(self, tID=-1, tol=1e-8, maxIter=25):
+        super().__init__(tID, tol, maxIter)
+
+    def _norm_of(self, R, du):
+        """Energy increment 0.5|du.R| (infinite before the first solve)."""
+        return np.inf if du is None else 0.5*abs(np.dot(du, R))
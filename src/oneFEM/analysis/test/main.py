@@ -1,3 +1,53 @@
+import numpy as np
+
 class Test(object):
-    def __init__(self, ID=-1):
-        self._ID = ID
\ No newline at end of file
+    def __init__(self, ID=-1, tol=1e-8, maxIter=25):
+        """
+        Convergence test of the nonlinear algorithms
+        :param ID: test ID
+        :param tol: convergence tolerance
+        :param maxIter: maximum number of iterations per step
+        """
+        self._ID = ID
+        self._tol = tol
+        self._maxIter = int(maxIter)
+        self._norm = 0.0        # norm of the last iteration
+        self._norms = []        # norms of the current step
+        self._nIter = 0         # iterations of the current step
+
+    def _norm_of(self, R, du):
+        """Compute the test norm from the residual R and the increment du."""
+        raise NotImplementedError("TEST._norm_of(): method must be implemented by subclasses.")
+
+    def _start(self):
+        """Reset the iteration counter at the start of a step."""
+        self._nIter = 0
+        self._norms = []
+
+    def _test(self, R, du):
+        """
+        Record an iteration and check for convergence
+        :param R: residual (unbalanced force) of the free d.o.f.s
+        :param du: last displacement increment of the free d.o.f.s (None before the first solve)
+        :return: True if converged
+        """
+        self._nIter += 1
+        self._norm = float(self._norm_of(np.asarray(R), None if du is None else np.asarray(du)))
+        self._norms.append(self._norm)
+        return self._norm <= self._tol
+
+    def _exhausted(self):
+        """Return True if the maximum number of iterations is reached."""
+        return self._nIter >= self._maxIter
+
+    def norm(self):
+        """Return the norm of the last iteration."""
+        return self._norm
+
+    def getNorms(self):
+        """Return the norms of the iterations of the current step."""
+        return self._norms
+
+    def getIterations(self):
+        """Return the number of iterations of the current step."""
+        return self._nIter
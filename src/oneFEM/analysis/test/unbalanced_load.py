@@ -1,5 +1,10 @@
+import numpy as np
 from .main import Test
 
 class NormUnbalance(Test):
-    def __init__(self, tID):
-        super().__init__(tID)
\ No newline at end of file
+    def __init__(self, tID=-1, tol=1e-8, maxIter=25):
+        super().__init__(tID, tol, maxIter)
+
+    def _norm_of(self, R, du):
+        """Norm of the unbalanced force."""
+        return np.linalg.norm(R)
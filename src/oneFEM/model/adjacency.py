@@ -0,0 +1,170 @@
+##-----------------------------------------------------------------------##
+#                                                                         #
+#        #--oneFEM--#: One FEM software in a galaxy far far away          #
+#                                                                         #
+#                   Computational Mechanics 2025                          #
+#                   University of Chieti-Pescara                          #
+#                 Written by: Onur Deniz AKAN, Ud'A                       #
+#                         9 February 2025                                 #
+#                                                                         #
+##-----------------------------------------------------------------------##
+#
+# Author: Onur Deniz Akan
+# Date: 14/02/2025
+# Version: 0.1
+#
+#ADJACENCY object definition
+#   inverse connectivity of the domain: node -> elements, constraints,
+#   patterns (nodal loads) and recorders, plus element -> recorders.
+#   the index is maintained incrementally when objects are added/removed,
+#   so the objects connected to a node are found in O(degree). compressed
+#   (CSR-style) arrays over the node store rows are compiled on demand and
+#   cached until the next change; the numberers use them (and the node
+#   graph built from them) instead of rebuilding the connectivity.
+
+import numpy as np
+from scipy.sparse import csr_matrix
+
+class Adjacency(object):
+    # kinds of objects connected to nodes
+    _kinds = ("element", "constraint", "pattern", "recorder")
+
+    def __init__(self):
+        """
+        Adjacency Constructor
+        """
+        # kind -> node ID -> {object ID: object}
+        self._incidence = {kind: {} for kind in self._kinds}
+        # element ID -> {recorder ID: recorder}
+        self._element_recorders = {}
+
+        self._cache = {}        # compiled CSR arrays (until the next change)
+
+    def _invalidate(self):
+        """
+        Discard the compiled arrays (call when the objects or the node rows change)
+        """
+        self._cache = {}
+
+    # Adjacency API (for internal use)
+    def _add(self, kind, obj):
+        """
+        Register the node connections of an object
+        :param kind: "element", "constraint", "pattern" or "recorder"
+        :param obj: object with an _ID attribute and a getNodes() method
+        """
+        incidence = self._incidence[kind]
+        for node in obj.getNodes():
+            incidence.setdefault(node._ID, {})[obj._ID] = obj
+
+        if kind == "recorder":
+            for element in obj.getElements():
+                self._element_recorders.setdefault(element._ID, {})[obj._ID] = obj
+
+        self._invalidate()
+
+    def _remove(self, kind, obj):
+        """
+        Unregister the node connections of an object
+        :param kind: "element", "constraint", "pattern" or "recorder"
+        :param obj: registered object
+        """
+        incidence = self._incidence[kind]
+        for node in obj.getNodes():
+            self._unlink(incidence, node._ID, obj._ID)
+
+        if kind == "recorder":
+            for element in obj.getElements():
+                self._unlink(self._element_recorders, element._ID, obj._ID)
+
+        self._invalidate()
+
+    def _removeLink(self, kind, obj, node):
+        """
+        Unregister a single node connection of an object
+        :param kind: "element", "constraint", "pattern" or "recorder"
+        :param obj: registered object
+        :param node: Node object
+        """
+        self._unlink(self._incidence[kind], node._ID, obj._ID)
+        self._invalidate()
+
+    @staticmethod
+    def _unlink(incidence, key, ID):
+        connected = incidence.get(key)
+        if connected is not None:
+            connected.pop(ID, None)
+            if not connected:
+                del incidence[key]
+
+    # Adjacency API (public)
+    def getConnected(self, kind, node):
+        """
+        Return the objects of a kind connected to a node
+        :param kind: "element", "constraint", "pattern" or "recorder"
+        :param node: Node object
+        """
+        return list(self._incidence[kind].get(node._ID, {}).values())
+
+    def getDegree(self, kind, node):
+        """
+        Return the number of objects of a kind connected to a node
+        :param kind: "element", "constraint", "pattern" or "recorder"
+        :param node: Node object
+        """
+        return len(self._incidence[kind].get(node._ID, ()))
+
+    def getRecorders(self, element):
+        """
+        Return the recorders connected to an element
+        :param element: Element object
+        """
+        return list(self._element_recorders.get(element._ID, {}).values())
+
+    def getCSR(self, kind, nodes):
+        """
+        Return the node -> object incidence in compressed (CSR-style) arrays
+        :param kind: "element", "constraint", "pattern" or "recorder"
+        :param nodes: list of Node objects (row order, ex: NodeStore.getNodes())
+        :return: indptr (nNodes+1,), indices (nnz,) into objects, objects (list)
+        """
+        key = (kind, len(nodes))
+        cached = self._cache.get(key)
+        if cached is not None and cached[0] is nodes:
+            return cached[1]
+
+        incidence = self._incidence[kind]
+        objects = {}
+        counts = np.zeros(len(nodes) + 1, dtype=np.int64)
+        indices = []
+        for i, node in enumerate(nodes):
+            connected = incidence.get(node._ID, {})
+            counts[i + 1] = len(connected)
+            for ID, obj in connected.items():
+                indices.append(objects.setdefault(ID, (len(objects), obj))[0])
+
+        csr = (np.cumsum(counts), np.array(indices, dtype=np.int64), [obj for _, obj in objects.values()])
+        self._cache[key] = (nodes, csr)
+        return csr
+
+    def getNodeGraph(self, nodes):
+        """
+        Return the node graph (nodes sharing an element are adjacent)
+        :param nodes: list of Node objects (row order, ex: NodeStore.getNodes())
+        :return: indptr (nNodes+1,), indices (nnz,) of the symmetric graph without self loops
+        """
+        key = ("graph", len(nodes))
+        cached = self._cache.get(key)
+        if cached is not None and cached[0] is nodes:
+            return cached[1]
+
+        indptr, indices, elements = self.getCSR("element", nodes)
+        B = csr_matrix((np.ones(indices.shape[0]), indices, indptr), shape=(len(nodes), len(elements)))
+        G = (B @ B.T).tocsr()
+        G.setdiag(0)
+        G.eliminate_zeros()
+        G.sort_indices()
+
+        graph = (G.indptr.astype(np.int64), G.indices.astype(np.int64))
+        self._cache[key] = (nodes, graph)
+        return graph
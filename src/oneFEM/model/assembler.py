@@ -0,0 +1,258 @@
+##-----------------------------------------------------------------------##
+#                                                                         #
+#        #--oneFEM--#: One FEM software in a galaxy far far away          #
+#                                                                         #
+#                   Computational Mechanics 2025                          #
+#                   University of Chieti-Pescara                          #
+#                 Written by: Onur Deniz AKAN, Ud'A                       #
+#                         9 February 2025                                 #
+#                                                                         #
+##-----------------------------------------------------------------------##
+#
+# Author: Onur Deniz Akan
+# Date: 14/02/2025
+# Version: 0.1
+#
+#ASSEMBLER object definition
+#   sparse assembly of the global stiffness matrix and force vector.
+#   elements are grouped by class (and number of d.o.f.s) and every group
+#   is processed by the vectorized kernels of its class, which return the
+#   stacked (nElem, nEDOF, nEDOF) stiffness matrices of the whole group.
+#   assembly is split in two phases:
+#     - symbolic: run once per topology/numbering, computes the element
+#       group domains, the CSR pattern of K and a scatter map from every
+#       element stiffness entry to its position in the CSR data array
+#     - numeric: run on every assembly, only sums the group stiffness
+#       entries into the CSR data array through the cached scatter map
+#   the element groups (and their domains) are prepared separately, so
+#   the matrix-free operator (see StiffnessOperator) can use them without
+#   building the CSR pattern.
+
+import numpy as np
+from scipy.sparse import csr_matrix
+
+class Assembler(object):
+    def __init__(self):
+        """
+        Assembler Constructor
+        """
+        self._nDOF = 0                          # size of the global system
+        self._nElems = 0                        # number of assembled elements
+        self._nnz = 0                           # number of nonzeros of K
+        self._is_prepared = False               # True if the cached groups are valid
+        self._is_symbolic_ready = False         # True if the cached pattern is valid
+
+        # cached symbolic data
+        self._groups = []                       # element groups (see _group)
+        self._indices = np.array([], dtype=np.int32) # CSR column indices of K
+        self._indptr = np.zeros(1, dtype=np.int32)   # CSR row pointers of K
+
+    def _invalidate(self):
+        """
+        Discard the cached pattern (call when the topology or numbering changes)
+        """
+        self._is_prepared = False
+        self._is_symbolic_ready = False
+
+    @staticmethod
+    def _group(elements):
+        """
+        Split the elements into groups of the same class and number of d.o.f.s
+        :param elements: list of Element objects
+        :return: list of dicts {"cls", "elements", "dofs": (nElem, nEDOF) array}
+        """
+        groups = {}
+        for element in elements:
+            dofs = np.asarray(element.getDOFs(), dtype=np.int64)
+            key = (type(element), dofs.shape[0])
+            if key not in groups:
+                groups[key] = {"cls": key[0], "elements": [], "dofs": []}
+            groups[key]["elements"].append(element)
+            groups[key]["dofs"].append(dofs)
+
+        for group in groups.values():
+            group["dofs"] = np.array(group["dofs"], dtype=np.int64).reshape(len(group["elements"]), -1)
+
+        return list(groups.values())
+
+    def _prepare(self, elements, nDOF):
+        """
+        Group the elements and compute the group domains
+        :param elements: list of Element objects
+        :param nDOF: total number of d.o.f.s of the domain
+        :return: list of element groups (see _group) with their "state"
+        """
+        if self._is_prepared and int(nDOF) == self._nDOF and len(elements) == self._nElems:
+            return self._groups
+
+        self._nDOF = int(nDOF)
+        self._nElems = len(elements)
+        self._groups = self._group(elements)
+        for group in self._groups:
+            group["state"] = group["cls"]._batchDomain(group["elements"])
+
+        self._is_prepared = True
+        self._is_symbolic_ready = False
+        return self._groups
+
+    def _symbolic(self, elements, nDOF):
+        """
+        Compute the group domains, the CSR pattern of K and the scatter map
+        :param elements: list of Element objects
+        :param nDOF: total number of d.o.f.s of the domain
+        """
+        self._prepare(elements, nDOF)
+
+        # (row, col) of every element stiffness entry, group by group
+        rows = []
+        cols = []
+        for group in self._groups:
+            dofs = group["dofs"]
+            n = dofs.shape[1]
+            rows.append(np.repeat(dofs, n, axis=1).ravel())
+            cols.append(np.tile(dofs, (1, n)).ravel())
+
+        rows = np.concatenate(rows) if rows else np.array([], dtype=np.int64)
+        cols = np.concatenate(cols) if cols else np.array([], dtype=np.int64)
+
+        # sorted unique (row, col) keys are the CSR data order
+        keys, scatter = np.unique(rows*self._nDOF + cols, return_inverse=True)
+        scatter = scatter.ravel()
+        self._nnz = keys.shape[0]
+        self._indices = (keys % self._nDOF).astype(np.int32)
+        self._indptr = np.zeros(self._nDOF + 1, dtype=np.int32)
+        np.cumsum(np.bincount(keys // self._nDOF, minlength=self._nDOF), out=self._indptr[1:])
+
+        # split the scatter map per group: (nElem, nEDOF*nEDOF)
+        start = 0
+        for group in self._groups:
+            end = start + group["dofs"].shape[0]*group["dofs"].shape[1]**2
+            group["scatter"] = scatter[start:end]
+            start = end
+
+        self._is_symbolic_ready = True
+
+    def _numeric(self, elements):
+        """
+        Sum the group stiffness and force into the cached CSR pattern
+        :param elements: list of Element objects (same as in _symbolic)
+        :return: K data array (numpy.ndarray) and F (numpy.ndarray)
+        """
+        if len(elements) != self._nElems:
+            raise ValueError("oneFEM.Assembler._numeric() - Number of elements does not match the symbolic pattern!")
+
+        data = np.zeros(self._nnz, dtype=float)
+        F = np.zeros(self._nDOF, dtype=float)
+        for group in self._groups:
+            cls = group["cls"]
+            dofs = group["dofs"]
+            nE, n = dofs.shape
+
+            ke = np.asarray(cls._batchStiffness(group["elements"], group["state"]), dtype=float)
+            if ke.shape != (nE, n, n):
+                raise ValueError("oneFEM.Assembler._numeric() - Stiffness matrices of {} elements do not match their number of d.o.f.s!".format(cls.__name__))
+
+            # data[scatter] += ke (repeated positions are summed)
+            data += np.bincount(group["scatter"], weights=ke.ravel(), minlength=self._nnz)
+
+            fe = cls._batchForce(group["elements"], group["state"])
+            if fe is not None:
+                fe = np.asarray(fe, dtype=float)
+                if fe.shape != (nE, n):
+                    raise ValueError("oneFEM.Assembler._numeric() - Force vectors of {} elements do not match their number of d.o.f.s!".format(cls.__name__))
+                F += np.bincount(dofs.ravel(), weights=fe.ravel(), minlength=self._nDOF)
+
+        return data, F
+
+    def _mass(self, elements, nDOF):
+        """
+        Sum the element mass matrices into the cached CSR pattern of K
+        (element mass and stiffness share the element d.o.f.s)
+        :param elements: list of Element objects
+        :param nDOF: total number of d.o.f.s of the domain
+        :return: M data array (numpy.ndarray) or None if all elements are massless
+        """
+        if not self._is_symbolic_ready or int(nDOF) != self._nDOF:
+            self._symbolic(elements, nDOF)
+
+        data = None
+        for group in self._groups:
+            me = group["cls"]._batchMass(group["elements"], group["state"])
+            if me is None:
+                continue
+            me = np.asarray(me, dtype=float)
+            nE, n = group["dofs"].shape
+            if me.shape != (nE, n, n):
+                raise ValueError("oneFEM.Assembler._mass() - Mass matrices of {} elements do not match their number of d.o.f.s!".format(group["cls"].__name__))
+            if data is None:
+                data = np.zeros(self._nnz, dtype=float)
+            data += np.bincount(group["scatter"], weights=me.ravel(), minlength=self._nnz)
+
+        return data
+
+    def _pattern(self):
+        """Return the cached CSR pattern (indices, indptr) of K."""
+        return self._indices, self._indptr
+
+    def _resisting(self, elements, nDOF, u):
+        """
+        Assemble the global resisting force vector of the elements
+        :param elements: list of Element objects
+        :param nDOF: total number of d.o.f.s of the domain
+        :param u: global trial displacement vector
+        :return: resisting force vector (numpy.ndarray)
+        """
+        self._prepare(elements, nDOF)
+
+        u = np.asarray(u, dtype=float)
+        R = np.zeros(self._nDOF, dtype=float)
+        for group in self._groups:
+            cls = group["cls"]
+            dofs = group["dofs"]
+            fe = np.asarray(cls._batchResistingForce(group["elements"], group["state"], u[dofs]), dtype=float)
+            if fe.shape != dofs.shape:
+                raise ValueError("oneFEM.Assembler._resisting() - Resisting forces of {} elements do not match their number of d.o.f.s!".format(cls.__name__))
+            R += np.bincount(dofs.ravel(), weights=fe.ravel(), minlength=self._nDOF)
+
+        return R
+
+    def _elementForces(self, elements, nDOF, U):
+        """
+        Compute the linear element forces k_e u_e of several displacement fields
+        :param elements: list of Element objects
+        :param nDOF: total number of d.o.f.s of the domain
+        :param U: (nDOF, nCases) global displacements
+        :return: (nElem, nMaxEDOF, nCases) element forces in the order of elements
+                 (zero padded for elements with fewer d.o.f.s)
+        """
+        groups = self._prepare(elements, nDOF)
+
+        U = np.asarray(U, dtype=float).reshape(self._nDOF, -1)
+        row = {id(element): i for i, element in enumerate(elements)}
+        nMax = max((group["dofs"].shape[1] for group in groups), default=0)
+        forces = np.zeros((len(elements), nMax, U.shape[1]))
+        for group in groups:
+            dofs = group["dofs"]
+            ke = np.asarray(group["cls"]._batchStiffness(group["elements"], group["state"]), dtype=float)
+            rows = np.fromiter((row[id(element)] for element in group["elements"]), dtype=np.int64, count=dofs.shape[0])
+            forces[rows, :dofs.shape[1]] = np.einsum('eij,ejc->eic', ke, U[dofs])
+
+        return forces
+
+    def _assemble(self, elements, nDOF):
+        """
+        Assemble the global stiffness matrix and force vector
+        :param elements: list of Element objects
+        :param nDOF: total number of d.o.f.s of the domain
+        :return: K (scipy.sparse.csr_matrix) and F (numpy.ndarray)
+        """
+        if not self._is_symbolic_ready or int(nDOF) != self._nDOF:
+            self._symbolic(elements, nDOF)
+
+        data, F = self._numeric(elements)
+
+        # the pattern arrays are shared between successive assemblies
+        K = csr_matrix((data, self._indices, self._indptr), shape=(self._nDOF, self._nDOF), copy=False)
+        K.has_sorted_indices = True
+
+        return K, F
@@ -1,3 +1,8 @@
 class Constraint(object):
-    def __init__(self):
-        pass
\ No newline at end of file
+    def __init__(self, ID=-1):
+        self._ID = ID
+        self._nodes = []    # constrained nodes
+
+    def getNodes(self):
+        """Return the list of constrained nodes."""
+        return self._nodes
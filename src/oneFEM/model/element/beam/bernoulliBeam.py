@@ -10,9 +10,51 @@
 ##-----------------------------------------------------------------------##
 #bernoulliBeam element sub-object definition
 #   use bending and axial elastica to compute element stiffness matrix
+#   2D (3 dofs per node) and 3D (6 dofs per node) frame elements.
+#   geometry and stiffness are computed by vectorized group kernels
+#   (see Element._batchDomain and Element._batchStiffness)
 
 import numpy as np
 from ..main import Element
+from ..main import Node
+from ...._systools.data import Vector, Matrix
+from ...._systools.math_tools import _is_zero, _local_axes
+
+
+def _stiffness_templates(nD):
+    # Unit local stiffness matrices of the Bernoulli beam, one per stiffness
+    # coefficient. The local stiffness of an element is the sum of the
+    # templates scaled by its coefficients (see BernoulliBeam._coefficients)
+    # 2D dofs: [ux, uy, rz]             coefficients: EA/L, EI/L^3, EI/L^2, EI/L
+    # 3D dofs: [ux, uy, uz, rx, ry, rz] coefficients: EA/L, GJ/L,
+    #          EIz/L^3, EIz/L^2, EIz/L, EIy/L^3, EIy/L^2, EIy/L
+    if nD == 2:
+        entries = [
+            {(0, 0): 1, (3, 3): 1, (0, 3): -1},
+            {(1, 1): 12, (4, 4): 12, (1, 4): -12},
+            {(1, 2): 6, (1, 5): 6, (2, 4): -6, (4, 5): -6},
+            {(2, 2): 4, (5, 5): 4, (2, 5): 2},
+        ]
+        n = 6
+    else:
+        entries = [
+            {(0, 0): 1, (6, 6): 1, (0, 6): -1},
+            {(3, 3): 1, (9, 9): 1, (3, 9): -1},
+            {(1, 1): 12, (7, 7): 12, (1, 7): -12},
+            {(1, 5): 6, (1, 11): 6, (5, 7): -6, (7, 11): -6},
+            {(5, 5): 4, (11, 11): 4, (5, 11): 2},
+            {(2, 2): 12, (8, 8): 12, (2, 8): -12},
+            {(2, 4): -6, (2, 10): -6, (4, 8): 6, (8, 10): 6},
+            {(4, 4): 4, (10, 10): 4, (4, 10): 2},
+        ]
+        n = 12
+
+    templates = np.zeros((len(entries), n, n))
+    for c, entry in enumerate(entries):
+        for (i, j), val in entry.items():
+            templates[c, i, j] = val
+            templates[c, j, i] = val
+    return templates
 
 
 class BernoulliBeam(Element):
@@ -21,61 +63,162 @@ class BernoulliBeam(Element):
     Uses bending and axial elastica to compute element stiffness matrix.
     """
 
-    def __init__(self, E, A, I, L):
+    # unit local stiffness matrices (see _stiffness_templates)
+    _templates = {2: _stiffness_templates(2), 3: _stiffness_templates(3)}
+
+    def __init__(self, ele_id, nodes=[Node(), Node()], E=0.0, A=0.0, Iz=0.0, Iy=0.0, G=0.0, J=0.0):
         """
         Initialize BernoulliBeam properties.
 
         Parameters:
+        ele_id : int - Element ID
+        nodes : list - i and j Node objects (3 dofs per node in 2D, 6 dofs per node in 3D)
         E : float - Young's modulus
         A : float - Cross-sectional area
-        I : float - Moment of inertia
-        L : float - Element length
+        Iz : float - Moment of inertia about the local z axis (in-plane bending in 2D)
+        Iy : float - Moment of inertia about the local y axis (3D only)
+        G : float - Shear modulus (3D only)
+        J : float - Torsional constant (3D only)
         """
+        super().__init__(ele_id)
+
+        # check if the nodes are defined
+        if len(nodes) != 2:
+            raise ValueError("BernoulliBeam: 2 Nodes must be defined for element {}".format(self._ID))
+
+        if not isinstance(nodes[0], Node) or not isinstance(nodes[1], Node):
+            raise ValueError("BernoulliBeam: Nodes are not defined for element {}".format(self._ID))
+
+        self._nodes = nodes
+
+        # check the node dimensions and dofs
+        nD = self._nodes[0].getND()
+        if nD != self._nodes[1].getND():
+            raise ValueError("BernoulliBeam: Nodes do not have the same number of dimensions for element {}".format(self._ID))
+
+        if (nD, self._nodes[0].getNDOF(), self._nodes[1].getNDOF()) not in ((2, 3, 3), (3, 6, 6)):
+            raise ValueError("BernoulliBeam: 3 dofs (2D) or 6 dofs (3D) per node are required for element {}".format(self._ID))
+
+        self._nD = nD
+        self._nDOF = Vector([self._nodes[0].getNDOF(), self._nodes[1].getNDOF()], dtype=int)
+
+        # section properties
         self.E = E
         self.A = A
-        self.I = I
-        self.L = L
+        self.Iz = Iz
+        self.Iy = Iy
+        self.G = G
+        self.J = J
+        self.L = None
+
+    def _domain(self):
+        """
+        Compute the element domain
+        """
+        BernoulliBeam._batchDomain([self])
+
+    @classmethod
+    def _batchDomain(cls, elements):
+        """
+        Compute length, rotation matrix and stiffness coefficients of a group of beams
+        :param elements: list of BernoulliBeam elements (same dimension)
+        :return: group state {"nD": int, "L": (nElem,), "R": (nElem, nD, nD), "c": (nElem, nCoef)}
+        """
+        nD = elements[0]._nD
+        coords = np.array([[np.asarray(nd.getCoordinates(), dtype=float) for nd in e._nodes] for e in elements])
+        dx = coords[:, 1, :] - coords[:, 0, :]
+
+        zero = _is_zero(np.sqrt(np.einsum('ei,ei->e', dx, dx)))
+        if np.any(zero):
+            raise ValueError("BernoulliBeam: Element length is zero for element {}".format(elements[int(np.argmax(zero))]._ID))
+
+        L, R = _local_axes(dx)
+        for i, element in enumerate(elements):
+            element.L = L[i]
+
+        props = np.array([[e.E, e.A, e.Iz, e.Iy, e.G, e.J] for e in elements], dtype=float)
+        return {"nD": nD, "L": L, "R": R, "c": cls._coefficients(props, L, nD)}
+
+    @staticmethod
+    def _coefficients(props, L, nD):
+        """
+        Compute the stiffness coefficients that scale the unit templates
+        :param props: (nElem, 6) array of [E, A, Iz, Iy, G, J]
+        :param L: (nElem,) array of element lengths
+        :param nD: problem dimension (2 or 3)
+        :return: (nElem, nCoef) array of coefficients
+        """
+        E, A, Iz, Iy, G, J = props.T
+        if nD == 2:
+            return np.stack((E*A/L, E*Iz/L**3, E*Iz/L**2, E*Iz/L), axis=1)
+        return np.stack((E*A/L, G*J/L, E*Iz/L**3, E*Iz/L**2, E*Iz/L,
+                         E*Iy/L**3, E*Iy/L**2, E*Iy/L), axis=1)
+
+    @classmethod
+    def _batchStiffness(cls, elements, state=None):
+        """
+        Compute the global stiffness matrices of a group of beams
+        :param elements: list of BernoulliBeam elements (same dimension)
+        :param state: group state returned by _batchDomain()
+        :return: stacked stiffness matrices (nElem, 6, 6) in 2D or (nElem, 12, 12) in 3D
+        """
+        if state is None:
+            state = cls._batchDomain(elements)
+
+        nD = state["nD"]
+        nE = len(elements)
+
+        # local stiffness: sum of coefficient-scaled templates
+        k = np.einsum('ec,cij->eij', state["c"], cls._templates[nD])
+
+        # 3-by-3 nodal transformation blocks (translations + rotations)
+        if nD == 2:
+            T = np.zeros((nE, 3, 3))
+            T[:, :2, :2] = state["R"]
+            T[:, 2, 2] = 1.0
+        else:
+            T = state["R"]
+
+        # global stiffness: T^T k T with T block diagonal
+        nb = k.shape[1] // 3
+        k = np.einsum('eia,eIiJj,ejb->eIaJb', T, k.reshape(nE, nb, 3, nb, 3), T)
+
+        return k.reshape(nE, 3*nb, 3*nb)
 
     def compute_stiffness_matrix(self):
         """
         Compute the stiffness matrix for the beam element.
 
         Returns:
-        K : numpy.ndarray - Element stiffness matrix
+        K : numpy.ndarray - Element stiffness matrix in local coordinates
         """
-        # Compute the local stiffness matrix for a Bernoulli beam element
-        L = self.L
-        E = self.E
-        I = self.I
-        A = self.A
-
-        # Stiffness coefficients for axial and bending
-        axial = E * A / L
-        bending = E * I / (L**3)
-
-        # Local stiffness matrix
-        K = np.array([
-            [ axial,     0,           0, -axial,     0,           0],
-            [     0,  12*bending,  6*L*bending,      0, -12*bending,  6*L*bending],
-            [     0,   6*L*bending,  4*L**2*bending, 0,  -6*L*bending,  2*L**2*bending],
-            [-axial,     0,           0,  axial,     0,           0],
-            [     0, -12*bending, -6*L*bending,      0,  12*bending, -6*L*bending],
-            [     0,   6*L*bending,  2*L**2*bending, 0,  -6*L*bending,  4*L**2*bending]
-        ])
-
-        return K
+        state = BernoulliBeam._batchDomain([self])
+        return np.einsum('c,cij->ij', state["c"][0], BernoulliBeam._templates[self._nD])
+
+    def getStiffness(self):
+        """Return the global stiffness matrix of the element."""
+        return Matrix(BernoulliBeam._batchStiffness([self])[0])
 
     def add_element(self, data):
         """
         Add a BernoulliBeam element based on input data.
 
         Parameters:
-        data : list - Element parameters
+        data : list - Element parameters [E, A, Iz] (2D) or [E, A, Iz, Iy, G, J] (3D)
         """
-        if len(data) != 4:
-            raise ValueError("BernoulliBeam: Incorrect input length, expected 4 parameters.")
+        if len(data) not in (3, 6):
+            raise ValueError("BernoulliBeam: Incorrect input length, expected 3 (2D) or 6 (3D) parameters.")
 
         self.E = data[0]
         self.A = data[1]
-        self.I = data[2]
-        self.L = data[3]
+        self.Iz = data[2]
+        if len(data) == 6:
+            self.Iy = data[3]
+            self.G = data[4]
+            self.J = data[5]
+
+    def __str__(self):
+        return "BernoulliBeam element {}".format(self._ID)
+
+    def __repr__(self):
+        return "BernoulliBeam element {}".format(self._ID)
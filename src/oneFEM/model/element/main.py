@@ -15,7 +15,13 @@
 #
 #ELEMENT main object definition
 #   definition of the element object
+#   elements of the same class are processed in groups by the Domain: the
+#   _batch*() class methods compute the domain, stiffness and force of all
+#   elements of a group at once as stacked (nElem, ...) numpy arrays.
+#   Subclasses override them with vectorized kernels, the defaults below
+#   fall back to the per-element methods.
 
+import numpy as np
 from ..node.main import Node
 from .section.main import Section
 from ..material.main import Material
@@ -48,6 +54,66 @@ class Element(object):
     def _update(self):
         """Update the element state."""
         raise NotImplementedError("ELEMENT._update(): method  must be implemented by subclasses.")
+
+    @classmethod
+    def _batchDomain(cls, elements):
+        """
+        Compute the domain of a group of elements of this class
+        :param elements: list of elements (instances of cls)
+        :return: group state passed on to _batchStiffness() and _batchForce()
+        """
+        for element in elements:
+            element._domain()
+        return None
+
+    @classmethod
+    def _batchStiffness(cls, elements, state=None):
+        """
+        Compute the global stiffness matrices of a group of elements of this class
+        :param elements: list of elements (instances of cls)
+        :param state: group state returned by _batchDomain()
+        :return: stacked stiffness matrices (nElem, nEDOF, nEDOF)
+        """
+        return np.stack([np.asarray(element.getStiffness(), dtype=float) for element in elements])
+
+    @classmethod
+    def _batchForce(cls, elements, state=None):
+        """
+        Compute the global force vectors of a group of elements of this class
+        :param elements: list of elements (instances of cls)
+        :param state: group state returned by _batchDomain()
+        :return: stacked force vectors (nElem, nEDOF) or None if no element has a force
+        """
+        forces = [np.asarray(element.getForce(), dtype=float) for element in elements]
+        if all(f.size == 0 for f in forces):
+            return None
+        n = max(f.size for f in forces)
+        return np.stack([f if f.size else np.zeros(n) for f in forces])
+    
+
+    @classmethod
+    def _batchMass(cls, elements, state=None):
+        """
+        Compute the global (consistent) mass matrices of a group of elements of this class
+        :param elements: list of elements (instances of cls)
+        :param state: group state returned by _batchDomain()
+        :return: stacked mass matrices (nElem, nEDOF, nEDOF) or None if the elements are massless
+                 (nodal masses are set on the nodes, see Node.setMass())
+        """
+        return None
+
+    @classmethod
+    def _batchResistingForce(cls, elements, state=None, ue=None):
+        """
+        Compute the global resisting force vectors of a group of elements of this class
+        (default: linear elastic, k ue; nonlinear elements override it)
+        :param elements: list of elements (instances of cls)
+        :param state: group state returned by _batchDomain()
+        :param ue: (nElem, nEDOF) trial displacements of the element d.o.f.s
+        :return: stacked resisting force vectors (nElem, nEDOF)
+        """
+        ke = np.asarray(cls._batchStiffness(elements, state), dtype=float)
+        return np.einsum('eij,ej->ei', ke, ue)
     
 
     # ELEMENT API
@@ -15,8 +15,8 @@ class Rectangular(Section):
         self.__EIx_commit = 0.0
         self.__EIy = 0.0
         self.__EIy_commit = 0.0
-        self.__EA = 0.0
-        self.__EA_commit = 0.0
+        self.__EA = mat.getInitialTangent()*w*h if isinstance(mat, uniaxialMaterial) else 0.0
+        self.__EA_commit = self.__EA
         self.__eps = 0.0
         self.__eps_commit = 0.0
 
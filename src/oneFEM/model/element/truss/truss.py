@@ -15,14 +15,17 @@
 #
 #Truss main object definition
 #   definition of the truss element object
+#   geometry and stiffness are computed by vectorized group kernels
+#   (see Element._batchDomain and Element._batchStiffness)
 
+import numpy as np
 from ..main import Element
 from ..main import Section
 from ..main import Node
 # import data structures
 from ...._systools.data import Vector, Matrix
 # import precision math tools
-from ...._systools.math_tools import _is_close
+from ...._systools.math_tools import _is_zero, _local_axes
 
 class Truss(Element):
     """
@@ -81,37 +84,60 @@ class Truss(Element):
         """
         Compute the element domain
         """
+        Truss._batchDomain([self])
 
-        # Compute the element length
-        self.__L = ((self._nodes[1]._coords[0] - self._nodes[0]._coords[0])**2 + 
-                    (self._nodes[1]._coords[1] - self._nodes[0]._coords[1])**2 +
-                    (self._nodes[1]._coords[2] - self._nodes[0]._coords[2])**2)**0.5
-        
-        if _is_close(self.__L, 0.0):
-            raise ValueError("Truss._domain(): Element length is zero for element {}".format(self.__ID))
-        
-        # Compute the local axis of the element
-        dx = self._nodes[1]._coords[0] - self._nodes[0]._coords[0]
-        dy = self._nodes[1]._coords[1] - self._nodes[0]._coords[1]
-        dz = self._nodes[1]._coords[2] - self._nodes[0]._coords[2]
-        self.__n = Vector([dx, dy, dz], dtype=float) / self.__L
-
-        # Compute the rotation matrix
-        Y_orient = Vector([0, 1, 0])
-        Z_orient = Vector([0, 0, 1])
-        if  self.__n._is_parallel(Y_orient): # use global Y
-            Z_orient =  self.__n._cross(Y_orient)
-            Z_orient._normalize()
-            Y_orient = self.__n._cross(Z_orient)
-            Y_orient._normalize()
-        else:
-            Y_orient =  self.__n._cross(Z_orient)
-            Y_orient._normalize()
-            Z_orient = self.__n._cross(Y_orient)
-            Z_orient._normalize()
-        
-        self.__R3 = Matrix([self.__n, Y_orient, Z_orient])
-        
+    @classmethod
+    def _batchDomain(cls, elements):
+        """
+        Compute length, local axis and rotation matrix of a group of truss elements
+        :param elements: list of Truss elements
+        :return: group state {"L": (nElem,), "n": (nElem, nD), "R": (nElem, nD, nD)}
+        """
+        coords = np.array([[np.asarray(nd.getCoordinates(), dtype=float) for nd in e._nodes] for e in elements])
+        dx = coords[:, 1, :] - coords[:, 0, :]
+
+        zero = _is_zero(np.sqrt(np.einsum('ei,ei->e', dx, dx)))
+        if np.any(zero):
+            raise ValueError("Truss._domain(): Element length is zero for element {}".format(elements[int(np.argmax(zero))]._ID))
+
+        L, R = _local_axes(dx)
+
+        # store the geometry on the elements
+        for i, element in enumerate(elements):
+            element.__L = L[i]
+            element.__n = Vector(R[i, 0])
+            element.__R3 = Matrix(R[i])
+
+        return {"L": L, "n": R[:, 0, :], "R": R}
+
+    @classmethod
+    def _batchStiffness(cls, elements, state=None):
+        """
+        Compute the global stiffness matrices of a group of truss elements
+        :param elements: list of Truss elements (same node types)
+        :param state: group state returned by _batchDomain()
+        :return: stacked stiffness matrices (nElem, nEDOF, nEDOF)
+        """
+        if state is None:
+            state = cls._batchDomain(elements)
+
+        nD = elements[0]._nD
+        nDOF = np.asarray(elements[0]._nDOF, dtype=int)
+        EA = np.array([e._section.getTangent() for e in elements], dtype=float)
+
+        # axial stiffness along the local axis: EA/L * n n^T
+        knn = np.einsum('e,ei,ej->eij', EA / state["L"], state["n"], state["n"])
+
+        # scatter the translational blocks into the element dofs
+        ti = np.arange(nD)
+        tj = nDOF[0] + np.arange(nD)
+        k = np.zeros((len(elements), nDOF.sum(), nDOF.sum()))
+        k[:, ti[:, None], ti] = knn
+        k[:, tj[:, None], tj] = knn
+        k[:, ti[:, None], tj] = -knn
+        k[:, tj[:, None], ti] = -knn
+
+        return k
 
     def _update(self):
         return super()._update()
@@ -132,6 +158,10 @@ class Truss(Element):
 
     # ELEMENT API
     def copy(self):
-        return Truss()
+        return Truss(self._ID, nodes=self._nodes, section=self._section)
+
+    def getStiffness(self):
+        """Return the stiffness matrix of the element."""
+        return Matrix(Truss._batchStiffness([self])[0])
 
 
@@ -11,25 +11,40 @@
 #DOMAIN main object definition
 #   Domain holds the model objects and the functions operate over them
 
+import numpy as np
+from scipy.sparse import csr_matrix, diags, issparse
+from .assembler import Assembler
+from .operator import StiffnessOperator
+from .partitioner import CoordinateBisection
+from .superposition import Superposition
+from .registry import Registry
+from .adjacency import Adjacency
 from .node.main import Node
+from .node.store import NodeStore
 from .tseries.main import TSeries
 from .pattern.main import Pattern
 from .element.main import Element
 from .material.main import Material
 from .constraint.main import Constraint
 from ..output.recorder.main import Recorder
+from ..analysis.numberer.main import Numberer
 
 class Domain(object):
     def __init__(self, nD=0):
-        # Model objects 
+        # Model objects (ID-indexed registries)
         # (features name mangling due to __name -> ex: obj._Model__nodes)
-        self.__nodes = []       # Nodes (list)
-        self.__patterns = []    # Load Pattern (list)
-        self.__elements = []    # Elements (list)
-        #self.__materials = []   # Materials (list)
-        #self.__time_series = [] # Load time series (list)
-        self.__constraints = [] # Constraints (list)
-        self.__recorders = []   # Recorders (list)
+        self.__nodes = Registry("Node")             # Nodes
+        self.__patterns = Registry("Pattern")       # Load Patterns
+        self.__elements = Registry("Element")       # Elements
+        #self.__materials = Registry("Material")    # Materials
+        #self.__time_series = Registry("TSeries")   # Load time series
+        self.__constraints = Registry("Constraint") # Constraints
+        self.__recorders = Registry("Recorder")     # Recorders
+
+        # Inverse connectivity (node -> elements, constraints, patterns, recorders)
+        self.__adjacency = Adjacency()
+        self.__kinds = {id(self.__elements): "element", id(self.__constraints): "constraint",
+                        id(self.__patterns): "pattern", id(self.__recorders): "recorder"}
 
         # Model variables
         self.__nDim = int(0)  # model dimension 2D or 3D
@@ -54,12 +69,105 @@ class Domain(object):
         self._a = 0  # Acceleration increment vector
         self._F = 0  # Force increment vector
 
+        # Sparse assembly engine (COO triplets -> CSR)
+        self.__assembler = Assembler()
+
+        # Structure-of-arrays storage of the node data
+        self.__node_store = NodeStore(capacity=16)
+
+        # Unit load case results of the linear multi-case solution, dropped
+        # when K changes
+        self.__superposition = None
+
+        # Cached eigen modes (see Eigen), dropped when K or M change; the
+        # last modes are kept as starting vectors (warm start)
+        self.__modes = None
+        self.__last_modes = None
+
+        # Stiffness version, counts the assignments of K (cheap change
+        # stamp for the solvers that keep matrices formed with K)
+        self.__k_version = 0
+
         ## Initialize the DOF counter
         #self._dof_counter(0)
 
 
-    def _domain(self):
+    # Global matrices and vectors
+    @property
+    def K(self):
+        return self._K
+
+    @K.setter
+    def K(self, value):
+        if (self.__modes is not None or self.__superposition is not None) and self.__changed(self._K, value):
+            self.__modes = None
+            self.__superposition = None
+        self._K = value
+        self.__k_version += 1
+
+    @property
+    def C(self):
+        return self._C
+
+    @C.setter
+    def C(self, value):
+        self._C = value
+
+    @property
+    def M(self):
+        return self._M
+
+    @M.setter
+    def M(self, value):
+        if self.__modes is not None and self.__changed(self._M, value):
+            self.__modes = None
+        self._M = value
+
+    @staticmethod
+    def __changed(old, new):
+        # True if a global matrix changes (same values keep the cached results)
+        if old is new:
+            return False
+        return not (issparse(old) and issparse(new) and old.shape == new.shape and
+                    old.nnz == new.nnz and np.array_equal(old.indices, new.indices) and
+                    np.array_equal(old.indptr, new.indptr) and np.array_equal(old.data, new.data))
+
+    @property
+    def u(self):
+        return self._u
+
+    @u.setter
+    def u(self, value):
+        self._u = value
+
+    @property
+    def v(self):
+        return self._v
+
+    @v.setter
+    def v(self, value):
+        self._v = value
+
+    @property
+    def a(self):
+        return self._a
+
+    @a.setter
+    def a(self, value):
+        self._a = value
+
+    @property
+    def F(self):
+        return self._F
+
+    @F.setter
+    def F(self, value):
+        self._F = value
+
+
+    def _domain(self, numberer=None):
         # Compute the initial state of the domain
+        # numberer: Numberer object (default: plain node order)
         self.nNds = len(self.__nodes)
         if self.nNds < 1:
             raise ValueError("Domain: No nodes in the domain!")
@@ -68,60 +176,127 @@ class Domain(object):
         if self.nElems < 1:
             raise ValueError("Domain: No elements in the domain!")
 
-        # Count nDOFs
-        self.nDOF = self.nodes.dof_numberer()
+        # Number the d.o.f.s and count nDOFs
+        if numberer is None:
+            numberer = Numberer()
+        self.nDOF = numberer.number(self)
 
-        # Call domain for all elements
-        for element in self.elements:
-            element.domain()
+        # DOF numbering changed: rebuild the sparsity pattern on next assembly
+        # (element domains are computed per class group in the symbolic phase)
+        self.__assembler._invalidate()
+        self.__superposition = None
+        self.__modes = None
+        self.__last_modes = None
+
+        # Initialize the trial displacement vector
+        self.u = np.zeros(self.nDOF)
 
 
     def _assemble(self):
-        # Assemble stiffness matrix and force vector
-        self.K = [[0] * self.nDOF for _ in range(self.nDOF)]
-        self.F = [0] * self.nDOF
-        self.u = [0] * self.nDOF
-
-        # Assemble K and F for each element
-        for element in self.elements:
-            gd = []
-            idx = 0
-            for node in element.nds:
-                ld = list(range(idx, idx + node.nDOF))
-                idx = ld[-1] + 1
-                gd.extend(node.dofs)
-            for i in gd:
-                for j in gd:
-                    self.K[i][j] += element.__k
-            for i in gd:
-                self.F[i] += element.__f
-
-        # Assemble F and u for each node
-        for node in self.nodes:
-            gd = node.dofs
-            for i in gd:
-                self.F[i] += node.force
-                self.u[i] += node.imposed
+        # Assemble stiffness matrix (sparse CSR) and external force vector
+        self.K, self.F = self.__assembler._assemble(self.__elements, self.nDOF)
+        if np.shape(self.u) != (self.nDOF,):
+            self.u = np.zeros(self.nDOF)
+
+        # Add the nodal loads of the load patterns
+        for pattern in self.__patterns:
+            self.F += pattern._loadVector(self.nDOF)
+
+        # Rebuild M if it was assembled (masses may have changed since): the
+        # M setter drops the cached modes only if the values differ
+        if issparse(self.M):
+            self._assembleMass()
+
+
+    def _assembleLoads(self):
+        # Assemble the nodal loads of every load pattern as the columns of
+        # one right-hand-side matrix (for the multi-case linear solution)
+        patterns = self.__patterns.getObjects()
+        P = np.zeros((self.nDOF, len(patterns)))
+        for i, pattern in enumerate(patterns):
+            P[:, i] = pattern._loadVector(self.nDOF)
+        return [pattern.getID() for pattern in patterns], P
+
+
+    def _assembleMass(self):
+        # Assemble the mass matrix (sparse CSR): nodal (lumped) masses of the
+        # node store on the diagonal plus the element (consistent) masses
+        store = self.__node_store
+        dofs = store.getDOFs()
+        active = dofs >= 0
+        lumped = np.zeros(self.nDOF)
+        np.add.at(lumped, dofs[active], store.getMass()[active])
+
+        M = diags(lumped, format="csr")
+        data = self.__assembler._mass(self.__elements, self.nDOF)
+        if data is not None:
+            indices, indptr = self.__assembler._pattern()
+            M = (M + csr_matrix((data, indices, indptr), shape=(self.nDOF, self.nDOF))).tocsr()
+        M.sort_indices()
+        self.M = M
+
+
+    def _setModes(self, modes):
+        # Store the eigen modes (see Eigen) until K or M change
+        self.__modes = modes
+        self.__last_modes = modes
+
+
+    def _getLastModes(self):
+        # Return the last eigen modes, even if K or M changed since (None
+        # after renumbering), as starting vectors of the subspace iteration
+        return self.__last_modes
+
+
+    def _getStiffnessVersion(self):
+        # Return the stiffness version (changes whenever K is set)
+        return self.__k_version
+
+
+    def _assembleTangent(self):
+        # Assemble the tangent stiffness matrix only (F is kept)
+        self.K, _ = self.__assembler._assemble(self.__elements, self.nDOF)
+
+
+    def _elementForces(self, U):
+        # Return the (nElem, nMaxEDOF, nCases) linear element forces of the
+        # displacement fields U (nDOF, nCases), in the order of getElements()
+        return self.__assembler._elementForces(self.getElements(), self.nDOF, U)
+
+
+    def _superpose(self, IDs, U, F):
+        # Store the unit load case results (with their element forces) for
+        # the load combinations and return them (see Superposition)
+        E = self._elementForces(U)
+        self.__superposition = Superposition(IDs, U, F, E, [element.getID() for element in self.getElements()])
+        return self.__superposition
 
 
     def _update(self):
-        # Placeholder for domain state update
-        pass
+        # Update the domain state for the trial displacements u: scatter u
+        # to the node store (elements read their trial state from the nodes)
+        self.__node_store._setTrial(self.u)
+
+
+    def _resistingForce(self):
+        # Return the global resisting force vector of the elements at the
+        # trial state (call _update() after changing u)
+        return self.__assembler._resisting(self.__elements, self.nDOF, self.u)
 
 
     def _commit(self):
-        # Commit domain state
-        for node in self.nodes:
-            d = node.dofs
-            if len(self.v) > 1:  # If transient
-                node.commit(self.u[d], self.v[d], self.a[d])
-            else:  # If static
-                node.commit(self.u[d])
+        # Commit domain state: scatter the global solution to the node
+        # store and commit the kinematics of all nodes at once
+        if np.size(self.v) > 1:  # If transient
+            self.__node_store._setTrial(self.u, self.v, self.a)
+        else:  # If static
+            self.__node_store._setTrial(self.u)
+        self.__node_store._commit()
 
 
     def _revert(self):
-        # Placeholder for reverting domain state
-        pass
+        # Revert the kinematics of all nodes to the last commit
+        self.__node_store._revert()
 
 
     def _record(self):
@@ -130,99 +305,247 @@ class Domain(object):
 
 
     # Domain API methods
+    def getNodeStore(self):
+        # Return the structure-of-arrays node storage of the domain
+        return self.__node_store
+
+
+    def getDOFPartition(self):
+        # Return the free and fixed d.o.f.s (sorted by d.o.f. number, so the
+        # free block of K keeps the ordering of the numberer)
+        store = self.__node_store
+        dofs = store.getDOFs()
+        active = dofs >= 0
+        fixed = store.getFix() & active
+        return np.sort(dofs[active & ~fixed]), np.sort(dofs[fixed])
+
+
+    def getModes(self):
+        # Return the cached eigen modes (dict, see Eigen), None if K or M
+        # changed since the last eigen solution
+        return self.__modes
+
+
+    def getSuperposition(self):
+        # Return the unit load case results (Superposition) of the last
+        # multi-case linear solution (see Linear.solveCases), None if any
+        return self.__superposition
+
+
+    def getOperator(self, dofs=None, store=False):
+        # Return the matrix-free stiffness operator (K @ v without assembling K)
+        # dofs: (Optional) global d.o.f.s the operator is restricted to (ex: free d.o.f.s)
+        # store: keep the element stiffness matrices (default: recompute on every product)
+        groups = self.__assembler._prepare(self.__elements, self.nDOF)
+        return StiffnessOperator(groups, self.nDOF, dofs, store)
+
+
+    def getDOFNodes(self, dofs=None):
+        # Return the node (node store row) of every d.o.f. (ex: blocks of
+        # block-jacobi, see Iterative._setBlocks)
+        # dofs: (Optional) global d.o.f.s to return (ex: free d.o.f.s)
+        nodeDOFs = self.__node_store.getDOFs()
+        has = nodeDOFs >= 0
+        nodes = np.full(self.nDOF, -1, dtype=np.int64)
+        nodes[nodeDOFs[has]] = np.nonzero(has)[0]
+        return nodes if dofs is None else nodes[np.asarray(dofs, dtype=np.int64)]
+
+
+    def getRigidBodyModes(self, dofs=None):
+        # Return the rigid body modes of the domain (near nullspace for AMG)
+        # as a (nDOF, 3) array in 2D or a (nDOF, 6) array in 3D: translations
+        # then rotations about the centroid of the nodes
+        # dofs: (Optional) global d.o.f.s (rows) to return (ex: free d.o.f.s)
+        store = self.__node_store
+        coords = np.asarray(store.getCoordinates(), dtype=float)
+        nodeDOFs = store.getDOFs()
+        nD = coords.shape[1]
+        x = coords - coords.mean(axis=0)
+
+        # nodal value of every mode: columns [ux, uy, (uz), (rx, ry,) rz]
+        if nD == 2:
+            modes = np.zeros((coords.shape[0], 3, 3))
+            modes[:, 0, 0] = modes[:, 1, 1] = 1.0
+            modes[:, 0, 2], modes[:, 1, 2], modes[:, 2, 2] = -x[:, 1], x[:, 0], 1.0
+        else:
+            modes = np.zeros((coords.shape[0], 6, 6))
+            modes[:, 0, 0] = modes[:, 1, 1] = modes[:, 2, 2] = 1.0
+            # rotation about x, y, z: u = e x (x - xc), rotational dof = 1
+            modes[:, 1, 3], modes[:, 2, 3] = -x[:, 2], x[:, 1]
+            modes[:, 0, 4], modes[:, 2, 4] = x[:, 2], -x[:, 0]
+            modes[:, 0, 5], modes[:, 1, 5] = -x[:, 1], x[:, 0]
+            modes[:, 3, 3] = modes[:, 4, 4] = modes[:, 5, 5] = 1.0
+
+        B = np.zeros((self.nDOF, modes.shape[2]))
+        for c in range(min(nodeDOFs.shape[1], modes.shape[1])):
+            has = nodeDOFs[:, c] >= 0
+            B[nodeDOFs[has, c]] = modes[has, c]
+
+        return B if dofs is None else B[np.asarray(dofs, dtype=np.int64)]
+
+
+    def getPartition(self, nParts, overlap=1, dofs=None):
+        # Split the domain into nParts overlapping subdomains (coordinate bisection)
+        # dofs: (Optional) global d.o.f.s of the local numbering (ex: free d.o.f.s)
+        # return: list of subdomain d.o.f. arrays, owner subdomain of each d.o.f.
+        return CoordinateBisection(nParts, overlap).partition(self, dofs)
+
+
+    def getAdjacency(self):
+        # Return the inverse connectivity index of the domain
+        return self.__adjacency
+
+
+    def __contains__(self, obj):
+        # Check if an object is in the domain (O(1))
+        registry = self.__registry(obj)
+        return registry is not None and obj in registry
+
+
+    def __registry(self, obj):
+        # Return the registry that holds objects of the type of obj
+        if isinstance(obj, Element):
+            return self.__elements
+
+        #elif isinstance(obj, Material):
+        #    return self.__materials
+
+        elif isinstance(obj, Node):
+            return self.__nodes
+
+        elif isinstance(obj, Pattern):
+            return self.__patterns
+
+        #elif isinstance(obj, TSeries):
+        #    return self.__time_series
+
+        elif isinstance(obj, Constraint):
+            return self.__constraints
+
+        elif isinstance(obj, Recorder):
+            return self.__recorders
+
+        return None
+
+
     def add(self, *objs):
         # Iterate over all passed objects
-        for obj in objs:
-            if isinstance(obj, Element):
-                self.__elements.append(obj)
+        self.add_many(objs)
 
-            #elif isinstance(obj, Material):
-            #    self.__materials.append(obj)
 
-            elif isinstance(obj, Node):
-                self.__nodes.append(obj)
-
-            elif isinstance(obj, Pattern):
-                self.__patterns.append(obj)
+    def add_many(self, objs):
+        # Add a sequence of objects (bulk insertion grouped by type)
+        groups = {}
+        for obj in objs:
+            registry = self.__registry(obj)
+            if registry is None:
+                print(f"Domain: Unknown object! {obj}")
+            else:
+                groups.setdefault(id(registry), (registry, []))[1].append(obj)
 
-            #elif isinstance(obj, TSeries):
-            #    self.__time_series.append(obj)
+        # nodes first: load patterns may refer to the nodes by ID
+        for registry, group in sorted(groups.values(), key=lambda g: g[0] is not self.__nodes):
+            if registry is self.__patterns:
+                for pattern in group:
+                    pattern._resolve(self)
 
-            elif isinstance(obj, Constraint):
-                self.__constraints.append(obj)
+            registry.add_many(group)
 
-            elif isinstance(obj, Recorder):
-                self.__recorders.append(obj)
+            if registry is self.__nodes:
+                self.__node_store._reserve(len(self.__node_store) + len(group))
+                for node in group:
+                    self.__node_store._attach(node)
 
+                self.__adjacency._invalidate()
             else:
-                print(f"Domain: Unknown object! {obj}")
+                kind = self.__kinds[id(registry)]
+                for obj in group:
+                    self.__adjacency._add(kind, obj)
+
+            if registry is self.__nodes or registry is self.__elements:
+                self.__assembler._invalidate()
 
 
     def remove(self, obj):
-        # Remove an object from the domain based on the command
+        # Remove an object from the domain (O(1) lookup by ID)
+        registry = self.__registry(obj)
+        if registry is None:
+            print("Domain: Unknown object!")
+            return
+
+        if obj not in registry:
+            print("Domain: {} not found!".format(registry._name))
+            return
+
+        if isinstance(obj, Node):
+            # cascade over the objects connected to the node (O(degree)):
+            # connected elements, constraints and recorders are removed,
+            # patterns only lose the nodal load applied to the node
+            for kind in ("element", "constraint", "recorder"):
+                for connected in self.__adjacency.getConnected(kind, obj):
+                    self.remove(connected)
+
+            for pattern in self.__adjacency.getConnected("pattern", obj):
+                pattern._removeNode(obj)
+                self.__adjacency._removeLink("pattern", pattern, obj)
+
+            self.__nodes.remove(obj)
+            self.__node_store._detach(obj)
+            self.__adjacency._invalidate()
+            self.__assembler._invalidate()
+            return
+
         if isinstance(obj, Element):
-            for element in self.__elements:
-                if element == obj:
+            # remove the recorders connected to the element
+            for recorder in self.__adjacency.getRecorders(obj):
+                self.remove(recorder)
 
-                    # check if recorder is connected to element
+            self.__assembler._invalidate()
 
+        registry.remove(obj)
+        self.__adjacency._remove(self.__kinds[id(registry)], obj)
 
-                    self.__elements.remove(element)
-                else:
-                    print("Domain: Element not found!")
 
-        #elif isinstance(obj, Material):
-        #    for material in self.__materials:
-        #        if material == obj:
-        #            self.__materials.remove(material)
-        #        else:
-        #            print("Domain: Material not found!")
+    def getNode(self, ID):
+        # Return the node with ID (None if not found)
+        return self.__nodes.get(ID)
 
-        elif isinstance(obj, Node):
-            for node in self.__nodes:
-                if node == obj:
 
-                    # check if element is connected to the node
+    def getElement(self, ID):
+        # Return the element with ID (None if not found)
+        return self.__elements.get(ID)
 
-                    # check if constraint is connected to the node
 
-                    # check if pattern is connected to the node
+    def getPattern(self, ID):
+        # Return the load pattern with ID (None if not found)
+        return self.__patterns.get(ID)
 
-                    # check if recorder is connected to the node
 
-                    self.__nodes.remove(node)
-                else:
-                    print("Domain: Node not found!")
+    def getConstraint(self, ID):
+        # Return the constraint with ID (None if not found)
+        return self.__constraints.get(ID)
 
-        elif isinstance(obj, Pattern):
-            for pattern in self.__patterns:
-                if pattern == obj:
-                    self.__patterns.remove(pattern)
-                else:
-                    print("Domain: Pattern not found!")
 
-        #elif isinstance(obj, TSeries):
-        #    for tseries in self.__time_series:
-        #        if tseries == obj:
-        #            # check if pattern is connected to the time series
-        #
-        #            self.__time_series.remove(tseries)
-        #        else:
-        #            print("Domain: Time Series not found!")
+    def getRecorder(self, ID):
+        # Return the recorder with ID (None if not found)
+        return self.__recorders.get(ID)
 
-        elif isinstance(obj, Constraint):
-            for constraint in self.__constraints:
-                if constraint == obj:
-                    self.__constraints.remove(constraint)
-                else:
-                    print("Domain: Constraint not found!")
 
-        elif isinstance(obj, Recorder):
-            for recorder in self.__recorders:
-                if recorder == obj:
-                    self.__recorders.remove(recorder)
-                else:
-                    print("Domain: Recorder not found!")
+    def getNodes(self):
+        # Return the list of nodes
+        return self.__nodes.getObjects()
 
-        else:
-            print("Domain: Unknown object!")
\ No newline at end of file
+
+    def getElements(self):
+        # Return the list of elements
+        return self.__elements.getObjects()
+
+
+    def getPatterns(self):
+        # Return the list of load patterns
+        return self.__patterns.getObjects()
+
+
+    def getRecorders(self):
+        # Return the list of recorders
+        return self.__recorders.getObjects()
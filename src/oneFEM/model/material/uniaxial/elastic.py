@@ -22,6 +22,11 @@ from .main import uniaxialMaterial
 class Elastic(uniaxialMaterial):
     def __init__(self, matID, E=0.0):
         super().__init__(matID, E)
+        self.__C = E
+        self.__C0 = E
+        self.__C_commit = E
+        self.__f = 0.0
+        self.__f_commit = 0.0
         self.__eps = 0.0
         self.__eps_commit = 0.0
 
@@ -1,6 +1,7 @@
 # oneFEM/model/node/__init__.py
 
 from .main import Node
+from .store import NodeStore
 from .node_2_2 import Node22
 from .node_2_3 import Node23
 from .node_2_4 import Node24
@@ -11,6 +12,7 @@ from .node_3_7 import Node37
 
 # delete modules imported from .py directories
 del main
+del store
 del node_2_2
 del node_2_3
 del node_2_4
@@ -21,6 +23,7 @@ del node_3_7
 
 __all__ = [
     "Node",
+    "NodeStore",
     "Node22",
     "Node23",
     "Node24",
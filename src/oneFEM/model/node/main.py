@@ -17,30 +17,59 @@
 #   definition of a FE node object and functions operating over a node
 #   object. The node object is defined with the following attributes:
 #   mass, fixity, and coordinate information
+#   the node data is stored in a row of a NodeStore (structure-of-arrays),
+#   the node attributes below are numpy views into that row
 
+import numpy as np
 from ..._systools.data.vector import Vector
+from .store import NodeStore
+
+
+def _row_view(name, size):
+    # property exposing the node row of a NodeStore array as a numpy view
+    # name is the store array name and size the node attribute with the
+    # number of used columns ("_nD" or "_nDOF")
+    def fget(self):
+        return getattr(self._store, name)[self._row, :getattr(self, size)]
+
+    def fset(self, value):
+        getattr(self._store, name)[self._row, :getattr(self, size)] = np.asarray(value)
+
+    return property(fget, fset)
+
 
 class Node(object):
-    def __init__(self, nodeID=-1):
+    # views into the node row of the store
+    _coord = _row_view("_coord", "_nD")
+    _dofs = _row_view("_dofs", "_nDOF")
+    _mass = _row_view("_mass", "_nDOF")
+    _fix = _row_view("_fix", "_nDOF")
+    _u_trial = _row_view("_u_trial", "_nDOF")
+    _v_trial = _row_view("_v_trial", "_nDOF")
+    _a_trial = _row_view("_a_trial", "_nDOF")
+    _u_commit = _row_view("_u_commit", "_nDOF")
+    _v_commit = _row_view("_v_commit", "_nDOF")
+    _a_commit = _row_view("_a_commit", "_nDOF")
+
+    # result queries: alias -> result type ('disp', 'vel' or 'accel')
+    _queries = {"disp": "disp", "displacement": "disp", "d": "disp", "u": "disp",
+                "vel": "vel", "velocity": "vel", "v": "vel",
+                "accel": "accel", "acceleration": "accel", "a": "accel"}
+
+    def __init__(self, nodeID=-1, nD=0, nDOF=0):
         """
         Node Constructor
         :param nodeID: Node ID (integer)
+        :param nD: Number of dimensions (integer)
+        :param nDOF: Number of d.o.f.s (integer)
         """
         self._ID = nodeID
-        self._nD = 0
-        self._nDOF = 0
-        self._dofs = Vector(dtype=int)
-        self._coord = Vector()
-        self._mass = Vector()
-        self._fix = Vector(dtype=bool)
-              
-        # Initialize solution-related variables
-        self._u_trial = Vector()
-        self._v_trial = Vector()
-        self._a_trial = Vector()
-        self._u_commit = Vector()
-        self._v_commit = Vector()
-        self._a_commit = Vector()
+        self._nD = nD
+        self._nDOF = nDOF
+
+        # the node owns a private store row until it is added to a Domain
+        self._store = NodeStore(nD, nDOF)
+        self._row = self._store._add(self, nD, nDOF)
 
     # Node API (for internal use)
     def _setDOF(self, dofs):
@@ -49,9 +78,9 @@ class Node(object):
         :param dofs: global degrees of freedom. list of integers e.g.: [10, 11, 12]
         """
         if len(dofs) == self._nDOF:
-            self._dofs = Vector(dofs, dtype=int)
+            self._dofs = dofs
         else:
-            raise ValueError("oneFEM.Node._setDOF() - Number of DOF entries does not match node number of d.o.f.s!")
+            raise ValueError("oneFEM.{}._setDOF() - Number of DOF entries does not match node number of d.o.f.s!".format(type(self).__name__))
 
     def _update(self, disp, vel=None, accel=None):
         """
@@ -60,9 +89,11 @@ class Node(object):
         :param velocities: (Optional) Velocities to commit
         :param accelerations: (Optional) Accelerations to commit
         """
-        self._u_trial = Vector(disp, dtype=float)
-        self._v_trial = Vector(vel, dtype=float)
-        self._a_trial = Vector(accel, dtype=float)
+        self._u_trial = disp
+        if vel is not None:
+            self._v_trial = vel
+        if accel is not None:
+            self._a_trial = accel
     
     def _commit(self, disp, vel=None, accel=None):
         """
@@ -71,9 +102,11 @@ class Node(object):
         :param velocities: (Optional) Velocities to commit
         :param accelerations: (Optional) Accelerations to commit
         """
-        self._u_commit = Vector(disp, dtype=float)
-        self._v_commit = Vector(vel, dtype=float)
-        self._a_commit = Vector(accel, dtype=float)
+        self._u_commit = disp
+        if vel is not None:
+            self._v_commit = vel
+        if accel is not None:
+            self._a_commit = accel
 
     def _getTrialDisp(self):
         return self._u_trial
@@ -100,9 +133,9 @@ class Node(object):
         :param fix: Fixities. list of bools e.g.: [True, False, False]
         """
         if len(fix) == self._nDOF:
-            self._fix = Vector(fix, dtype=bool)
+            self._fix = fix
         else:
-            raise ValueError("oneFEM.Node.setFix() - Number of fix entries does not match node number of d.o.f.s!")
+            raise ValueError("oneFEM.{}.setFix() - Number of fix entries does not match node number of d.o.f.s!".format(type(self).__name__))
 
     def setMass(self, mass):
         """
@@ -110,9 +143,9 @@ class Node(object):
         :param mass: Masses. list of floats e.g.: [1.0, 2.0, 3.0]
         """
         if len(mass) == self._nDOF:    
-            self._mass = Vector(mass, dtype=float)
+            self._mass = mass
         else:
-            raise ValueError("oneFEM.Node.setMass() - Number of mass entries does not match node number of d.o.f.s!")
+            raise ValueError("oneFEM.{}.setMass() - Number of mass entries does not match node number of d.o.f.s!".format(type(self).__name__))
     
     def getResult(self, query, dofs):
         """
@@ -121,22 +154,32 @@ class Node(object):
         :param dofs: List of DOFs to query e.g. [1, 2, 3]
         :return: List of results for the specified DOFs
         """
-        if query in {"disp", "displacement", "d", "u"}:
-            return [self._u_commit[d-1] for d in dofs]
-        elif query in {"vel", "velocity", "v"}:
-            return [self._v_commit[d-1] for d in dofs]
-        elif query in {"accel", "acceleration", "a"}:
-            return [self._a_commit[d-1] for d in dofs]
+        idx = [d-1 for d in dofs]
+        query = self._queries.get(query)
+        if query == "disp":
+            return Vector(self._u_commit[idx])
+        elif query == "vel":
+            return Vector(self._v_commit[idx])
+        elif query == "accel":
+            return Vector(self._a_commit[idx])
         else:
             raise ValueError("oneFEM.Node.getResult() - Unknown query type!")
 
     def getCoordinates(self):
         """Return a list of coordinates"""
-        return self._coord.data
+        return self._coord
     
     def getDOFs(self):
         """Return a list of nodes"""
-        return self._dofs.data
+        return self._dofs
+
+    def getMass(self):
+        """Return the d.o.f. masses"""
+        return self._mass
+
+    def getFix(self):
+        """Return the d.o.f. fixities"""
+        return self._fix
     
     def getND(self):
         """Return number of dimensions"""
@@ -0,0 +1,226 @@
+##-----------------------------------------------------------------------##
+#                                                                         #
+#        #--oneFEM--#: One FEM software in a galaxy far far away          #
+#                                                                         #
+#                   Computational Mechanics 2025                          #
+#                   University of Chieti-Pescara                          #
+#                 Written by: Onur Deniz AKAN, Ud'A                       #
+#                         9 February 2025                                 #
+#                                                                         #
+##-----------------------------------------------------------------------##
+#
+# Author: Onur Deniz Akan
+# Date: 14/02/2025
+# Version: 0.1
+#
+#NODESTORE object definition
+#   structure-of-arrays storage of the node data. Coordinates, global dofs,
+#   fixities, masses and trial/committed kinematics of all nodes are kept
+#   in contiguous (nNodes, nDOF) numpy arrays. A node owns one row of a
+#   store: a standalone node owns a private single-row store, a node added
+#   to a Domain owns a row of the Domain store. Nodes with fewer dofs (or
+#   dimensions) than the store leave the trailing columns unused (dof -1).
+
+import numpy as np
+
+class NodeStore(object):
+    # names of the (nNodes, nDOF) float arrays
+    _kinematics = ("u_trial", "v_trial", "a_trial", "u_commit", "v_commit", "a_commit")
+
+    def __init__(self, nD=0, nDOF=0, capacity=1):
+        """
+        NodeStore Constructor
+        :param nD: number of dimensions (columns of the coordinate array)
+        :param nDOF: number of dofs per node (columns of the dof arrays)
+        :param capacity: number of preallocated rows
+        """
+        self._nD = int(nD)
+        self._nDOF = int(nDOF)
+        self._nNodes = 0
+        self._nodes = []                    # node object of each row
+
+        self._coord = np.zeros((capacity, self._nD))
+        self._ndof = np.zeros(capacity, dtype=np.int64)
+        self._dofs = np.full((capacity, self._nDOF), -1, dtype=np.int64)
+        self._fix = np.zeros((capacity, self._nDOF), dtype=bool)
+        self._mass = np.zeros((capacity, self._nDOF))
+        for name in self._kinematics:
+            setattr(self, "_" + name, np.zeros((capacity, self._nDOF)))
+
+    def __len__(self):
+        return self._nNodes
+
+    def _resize(self, capacity, nD, nDOF):
+        """
+        Reallocate the arrays (existing rows and columns are kept)
+        :param capacity: new number of rows
+        :param nD: new number of dimensions
+        :param nDOF: new number of dofs per node
+        """
+        n = self._nNodes
+
+        def grow(arr, shape, fill):
+            new = np.full(shape, fill, dtype=arr.dtype)
+            new[(slice(0, n),) + tuple(slice(0, s) for s in arr.shape[1:])] = arr[:n]
+            return new
+
+        self._coord = grow(self._coord, (capacity, nD), 0.0)
+        self._ndof = grow(self._ndof, (capacity,), 0)
+        self._dofs = grow(self._dofs, (capacity, nDOF), -1)
+        self._fix = grow(self._fix, (capacity, nDOF), False)
+        self._mass = grow(self._mass, (capacity, nDOF), 0.0)
+        for name in self._kinematics:
+            setattr(self, "_" + name, grow(getattr(self, "_" + name), (capacity, nDOF), 0.0))
+
+        self._nD, self._nDOF = nD, nDOF
+
+    def _reserve(self, capacity):
+        """
+        Preallocate rows for bulk insertion
+        :param capacity: number of rows to hold without reallocation
+        """
+        if capacity > self._coord.shape[0]:
+            self._resize(capacity, self._nD, self._nDOF)
+
+    def _add(self, node, nD, nDOF):
+        """
+        Append a row for a node
+        :param node: Node object owning the row
+        :param nD: number of dimensions of the node
+        :param nDOF: number of dofs of the node
+        :return: row index of the node
+        """
+        capacity = self._coord.shape[0]
+        if self._nNodes == capacity or nD > self._nD or nDOF > self._nDOF:
+            if self._nNodes == capacity:
+                capacity = max(2*capacity, 1)
+            self._resize(capacity, max(nD, self._nD), max(nDOF, self._nDOF))
+
+        # reset the (possibly released) row
+        row = self._nNodes
+        self._coord[row] = 0.0
+        self._dofs[row] = -1
+        self._fix[row] = False
+        self._mass[row] = 0.0
+        for name in self._kinematics:
+            getattr(self, "_" + name)[row] = 0.0
+
+        self._nNodes += 1
+        self._nodes.append(node)
+        self._ndof[row] = nDOF
+        return row
+
+    def _attach(self, node):
+        """
+        Move a node (and its data) into this store
+        :param node: Node object
+        """
+        if node._store is self:
+            return
+
+        other, src = node._store, node._row
+        nD, nDOF = node._nD, node._nDOF
+        row = self._add(node, nD, nDOF)
+
+        # copy the node row from its previous store
+        self._coord[row, :nD] = other._coord[src, :nD]
+        for name in ("_dofs", "_fix", "_mass") + tuple("_" + k for k in self._kinematics):
+            getattr(self, name)[row, :nDOF] = getattr(other, name)[src, :nDOF]
+
+        other._remove(node)
+        node._store, node._row = self, row
+
+    def _detach(self, node):
+        """
+        Move a node out of this store into a private single-row store
+        :param node: Node object
+        """
+        if node._store is not self:
+            raise ValueError("oneFEM.NodeStore._detach() - Node {} is not in the store!".format(node._ID))
+
+        NodeStore(node._nD, node._nDOF)._attach(node)
+
+    def _remove(self, node):
+        """
+        Release the row of a node (the last row is moved into its place)
+        :param node: Node object
+        """
+        row, last = node._row, self._nNodes - 1
+        if row != last:
+            moved = self._nodes[last]
+            self._coord[row] = self._coord[last]
+            for name in ("_ndof", "_dofs", "_fix", "_mass") + tuple("_" + k for k in self._kinematics):
+                arr = getattr(self, name)
+                arr[row] = arr[last]
+            self._nodes[row] = moved
+            moved._row = row
+
+        self._nodes.pop()
+        self._nNodes = last
+
+    # NodeStore API (for internal use)
+    def _setTrial(self, disp, vel=None, accel=None):
+        """
+        Scatter global solution vectors to the trial kinematics of all nodes
+        :param disp: global displacement vector
+        :param vel: (Optional) global velocity vector
+        :param accel: (Optional) global acceleration vector
+        """
+        dofs = self._dofs[:self._nNodes]
+        mask = dofs >= 0
+        self._u_trial[:self._nNodes][mask] = np.asarray(disp)[dofs[mask]]
+        if vel is not None:
+            self._v_trial[:self._nNodes][mask] = np.asarray(vel)[dofs[mask]]
+        if accel is not None:
+            self._a_trial[:self._nNodes][mask] = np.asarray(accel)[dofs[mask]]
+
+    def _commit(self):
+        """Commit the trial kinematics of all nodes."""
+        n = self._nNodes
+        self._u_commit[:n] = self._u_trial[:n]
+        self._v_commit[:n] = self._v_trial[:n]
+        self._a_commit[:n] = self._a_trial[:n]
+
+    def _revert(self):
+        """Revert the trial kinematics of all nodes to the last commit."""
+        n = self._nNodes
+        self._u_trial[:n] = self._u_commit[:n]
+        self._v_trial[:n] = self._v_commit[:n]
+        self._a_trial[:n] = self._a_commit[:n]
+
+    # NodeStore API (public)
+    def getNodes(self):
+        """Return the list of nodes in row order"""
+        return self._nodes
+
+    def getCoordinates(self):
+        """Return the (nNodes, nD) coordinate array"""
+        return self._coord[:self._nNodes]
+
+    def getDOFs(self):
+        """Return the (nNodes, nDOF) global dof array (-1 for unused columns)"""
+        return self._dofs[:self._nNodes]
+
+    def getNDOF(self):
+        """Return the (nNodes,) number of dofs of each node"""
+        return self._ndof[:self._nNodes]
+
+    def getFix(self):
+        """Return the (nNodes, nDOF) fixity array"""
+        return self._fix[:self._nNodes]
+
+    def getMass(self):
+        """Return the (nNodes, nDOF) mass array"""
+        return self._mass[:self._nNodes]
+
+    def getCommitDisp(self):
+        """Return the (nNodes, nDOF) committed displacement array"""
+        return self._u_commit[:self._nNodes]
+
+    def getCommitVel(self):
+        """Return the (nNodes, nDOF) committed velocity array"""
+        return self._v_commit[:self._nNodes]
+
+    def getCommitAccel(self):
+        """Return the (nNodes, nDOF) committed acceleration array"""
+        return self._a_commit[:self._nNodes]
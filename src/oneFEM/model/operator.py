@@ -0,0 +1,112 @@
+##-----------------------------------------------------------------------##
+#                                                                         #
+#        #--oneFEM--#: One FEM software in a galaxy far far away          #
+#                                                                         #
+#                   Computational Mechanics 2025                          #
+#                   University of Chieti-Pescara                          #
+#                 Written by: Onur Deniz AKAN, Ud'A                       #
+#                         9 February 2025                                 #
+#                                                                         #
+##-----------------------------------------------------------------------##
+#
+# Author: Onur Deniz Akan
+# Date: 14/02/2025
+# Version: 0.1
+#
+#STIFFNESSOPERATOR object definition
+#   matrix-free (element-by-element) product y = K v. the global stiffness
+#   is never assembled: for every element group (see Assembler._group) v is
+#   gathered to the element d.o.f.s, multiplied by the stacked element
+#   stiffness matrices and scatter-added back with the group d.o.f. index
+#   arrays. the operator may be restricted to a subset of the d.o.f.s (ex:
+#   the free d.o.f.s) and plugs into the Iterative system as a scipy
+#   LinearOperator (with its diagonal and diagonal blocks for jacobi and
+#   block-jacobi preconditioning).
+
+import numpy as np
+from scipy.sparse.linalg import LinearOperator
+
+class StiffnessOperator(LinearOperator):
+    def __init__(self, groups, nDOF, dofs=None, store=False):
+        """
+        StiffnessOperator Constructor
+        :param groups: element groups with their state (see Assembler._prepare)
+        :param nDOF: total number of d.o.f.s of the domain
+        :param dofs: (Optional) global d.o.f.s the operator is restricted to
+        :param store: keep the element stiffness matrices (default: recompute on every
+                      product; storing trades memory, up to more than the CSR K, for speed)
+        """
+        nDOF = int(nDOF)
+        dofs = np.arange(nDOF) if dofs is None else np.asarray(dofs, dtype=np.int64)
+        n = dofs.shape[0]
+        super().__init__(dtype=float, shape=(n, n))
+
+        # global -> local d.o.f. map; excluded d.o.f.s point to the padding entry n
+        local = np.full(nDOF, n, dtype=np.int64)
+        local[dofs] = np.arange(n)
+
+        self._n = n
+        self._groups = groups
+        self._store = store
+        self._local = [local[group["dofs"]] for group in groups]     # (nElem, nEDOF) per group
+        self._ke = [self._stiffness(group) for group in groups] if store else None
+
+    @staticmethod
+    def _stiffness(group):
+        # Stacked stiffness matrices of an element group
+        return np.asarray(group["cls"]._batchStiffness(group["elements"], group["state"]), dtype=float)
+
+    def _update(self):
+        """
+        Recompute the stored element stiffness matrices (call when the tangent changes)
+        """
+        if self._store:
+            self._ke = [self._stiffness(group) for group in self._groups]
+
+    def _groupStiffness(self):
+        # Iterate over (local d.o.f.s, stiffness matrices) of every group
+        for i, group in enumerate(self._groups):
+            yield self._local[i], (self._ke[i] if self._store else self._stiffness(group))
+
+    def _matvec(self, v):
+        """Compute K v element by element."""
+        n = self._n
+        vp = np.zeros(n + 1)
+        vp[:n] = np.ravel(v)
+
+        y = np.zeros(n + 1)
+        for local, ke in self._groupStiffness():
+            ye = np.einsum('eij,ej->ei', ke, vp[local])
+            y += np.bincount(local.ravel(), weights=ye.ravel(), minlength=n + 1)
+
+        return y[:n]
+
+    def _rmatvec(self, v):
+        """K is symmetric: K^T v = K v."""
+        return self._matvec(v)
+
+    def diagonal(self):
+        """Return the diagonal of K."""
+        n = self._n
+        d = np.zeros(n + 1)
+        for local, ke in self._groupStiffness():
+            d += np.bincount(local.ravel(), weights=np.einsum('eii->ei', ke).ravel(), minlength=n + 1)
+
+        return d[:n]
+
+    def addDiagonalBlocks(self, blocks, label, pos):
+        """
+        Sum the entries of K that couple d.o.f.s of the same block into blocks
+        :param blocks: (nBlocks, m, m) array of diagonal blocks (modified in place)
+        :param label: (n,) block of each d.o.f.
+        :param pos: (n,) position of each d.o.f. inside its block
+        """
+        n = self._n
+        label = np.append(label, -1)    # the padding entry belongs to no block
+        pos = np.append(pos, 0)
+        for local, ke in self._groupStiffness():
+            nE, m = local.shape
+            rows = np.repeat(local, m, axis=1).ravel()
+            cols = np.tile(local, (1, m)).ravel()
+            keep = (rows < n) & (cols < n) & (label[rows] == label[cols])
+            np.add.at(blocks, (label[rows[keep]], pos[rows[keep]], pos[cols[keep]]), ke.ravel()[keep])
@@ -0,0 +1,129 @@
+##-----------------------------------------------------------------------##
+#                                                                         #
+#        #--oneFEM--#: One FEM software in a galaxy far far away          #
+#                                                                         #
+#                   Computational Mechanics 2025                          #
+#                   University of Chieti-Pescara                          #
+#                 Written by: Onur Deniz AKAN, Ud'A                       #
+#                         9 February 2025                                 #
+#                                                                         #
+##-----------------------------------------------------------------------##
+#
+# Author: Onur Deniz Akan
+# Date: 14/02/2025
+# Version: 0.1
+#
+#COORDINATEBISECTION object definition
+#   recursive coordinate bisection of the elements of a domain into nParts
+#   subdomains. the element centroids are split at the weighted median of
+#   their longest extent (nParts does not need to be a power of 2). each
+#   subdomain is then grown by overlap layers of elements sharing a node
+#   with it. the subdomains are returned as d.o.f. sets, optionally in the
+#   local numbering of a subset of the d.o.f.s (ex: the free d.o.f.s), for
+#   the domain decomposition preconditioners (see AdditiveSchwarz).
+
+import numpy as np
+from scipy.sparse import csr_matrix
+
+class CoordinateBisection(object):
+    def __init__(self, nParts=2, overlap=1):
+        """
+        CoordinateBisection Constructor
+        :param nParts: number of subdomains
+        :param overlap: number of element layers added around each subdomain
+        """
+        if int(nParts) < 1:
+            raise ValueError("oneFEM.CoordinateBisection() - Number of parts must be positive!")
+
+        self._nParts = int(nParts)
+        self._overlap = max(int(overlap), 0)
+        self._parts = []            # element indices of each (non-overlapping) part
+
+    @staticmethod
+    def _connectivity(model):
+        """
+        Node store rows of the element nodes
+        :return: (nElem, nMaxNodes) rows padded with -1
+        """
+        elements = model.getElements()
+        nMax = max((len(e.getNodes()) for e in elements), default=0)
+        rows = np.full((len(elements), nMax), -1, dtype=np.int64)
+        for i, element in enumerate(elements):
+            nodes = element.getNodes()
+            rows[i, :len(nodes)] = [nd._row for nd in nodes]
+        return rows
+
+    def _bisect(self, centroids, elements, nParts):
+        # Split the elements into nParts by recursive coordinate bisection
+        if nParts == 1 or elements.shape[0] <= 1:
+            return [elements]
+
+        x = centroids[elements]
+        axis = int(np.argmax(np.ptp(x, axis=0)))
+        order = elements[np.argsort(x[:, axis], kind="stable")]
+
+        nLeft = nParts // 2
+        split = int(round(elements.shape[0]*nLeft/nParts))
+        return (self._bisect(centroids, order[:split], nLeft) +
+                self._bisect(centroids, order[split:], nParts - nLeft))
+
+    def partition(self, model, dofs=None):
+        """
+        Partition the domain into overlapping subdomains
+        :param model: Domain object (numbered, see Domain._domain)
+        :param dofs: (Optional) global d.o.f.s of the local numbering (ex: free d.o.f.s)
+        :return: list of (local) d.o.f. arrays of the subdomains, (n,) owner
+                 subdomain of each d.o.f. in the non-overlapping partition
+        """
+        store = model.getNodeStore()
+        coords = np.asarray(store.getCoordinates(), dtype=float)
+        nodeDOFs = store.getDOFs()
+        rows = self._connectivity(model)
+        nElem, nNodes = rows.shape[0], coords.shape[0]
+
+        # element centroids
+        valid = rows >= 0
+        centroids = np.einsum('en,end->ed', valid, coords[np.where(valid, rows, 0)])/np.maximum(valid.sum(axis=1), 1)[:, None]
+        self._parts = self._bisect(centroids, np.arange(nElem), self._nParts)
+
+        # element -> node incidence (for the overlap layers)
+        E = csr_matrix((np.ones(np.count_nonzero(valid)), (np.nonzero(valid)[0], rows[valid])), shape=(nElem, nNodes))
+
+        # global -> local d.o.f. map
+        nDOF = int(nodeDOFs.max()) + 1 if nodeDOFs.size else 0
+        if dofs is None:
+            local = np.arange(nDOF)
+            n = nDOF
+        else:
+            dofs = np.asarray(dofs, dtype=np.int64)
+            local = np.full(nDOF, -1, dtype=np.int64)
+            local[dofs] = np.arange(dofs.shape[0])
+            n = dofs.shape[0]
+
+        def part_dofs(node_mask):
+            d = nodeDOFs[node_mask]
+            d = local[d[d >= 0]]
+            return np.unique(d[d >= 0])
+
+        subdomains = []
+        owner = np.full(n, -1, dtype=np.int64)
+        for p, part in enumerate(self._parts):
+            element_mask = np.zeros(nElem, dtype=bool)
+            element_mask[part] = True
+            node_mask = (E.T @ element_mask) > 0
+
+            # the first part holding a d.o.f. owns it
+            own = part_dofs(node_mask)
+            owner[own[owner[own] < 0]] = p
+
+            for _ in range(self._overlap):
+                element_mask = (E @ node_mask) > 0
+                node_mask = (E.T @ element_mask) > 0
+            subdomains.append(part_dofs(node_mask))
+
+        owner[owner < 0] = 0    # d.o.f.s of nodes without elements
+        return subdomains, owner
+
+    def getParts(self):
+        """Return the element indices of every (non-overlapping) part."""
+        return self._parts
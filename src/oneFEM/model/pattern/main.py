@@ -1,4 +1,58 @@
+import numpy as np
+from ..tseries.main import TSeries
 
 class Pattern(object):
-    def __init__(self):
-        pass
\ No newline at end of file
+    def __init__(self, ID=-1):
+        self._ID = ID
+        self._loads = {}            # node ID -> (Node or None until resolved, nodal load values)
+        self._tseries = TSeries()   # time series of the load factor
+
+    def _loadVector(self, nDOF):
+        """
+        Assemble the nodal loads of the pattern
+        :param nDOF: total number of d.o.f.s of the domain
+        :return: (nDOF,) global load vector
+        """
+        F = np.zeros(nDOF)
+        for node, load in self._loads.values():
+            if node is None:
+                continue
+            gd = np.asarray(node.getDOFs())[:load.shape[0]]
+            F[gd] += load[:gd.shape[0]]
+        return F
+
+    def _spatialLoad(self, model):
+        """
+        Spatial distribution of the pattern load, F(t) = load * factor(t)
+        :param model: Domain object (numbered)
+        :return: (nDOF,) global load vector
+        """
+        return self._loadVector(model.nDOF)
+
+    def _resolve(self, model):
+        """
+        Replace the node IDs given for the nodal loads by the Node objects of the domain
+        :param model: Domain object the pattern is added to
+        """
+        for ID, (node, load) in self._loads.items():
+            if node is None:
+                node = model.getNode(ID)
+                if node is None:
+                    raise ValueError(f"oneFEM.Pattern._resolve() - node {ID} is not in the domain!")
+                self._loads[ID] = (node, load)
+
+    def _removeNode(self, node):
+        """Drop the nodal load applied to a node (if any)."""
+        self._loads.pop(node._ID, None)
+
+    def getID(self):
+        """Return the pattern ID."""
+        return self._ID
+
+    def getTSeries(self):
+        """Return the load time series."""
+        return self._tseries
+
+    def getNodes(self):
+        """Return the list of loaded nodes of the pattern."""
+        return [nd for nd, _ in self._loads.values() if nd is not None]
@@ -1,6 +1,21 @@
+import numpy as np
+from ..node.main import Node
 from ..pattern.main import Pattern
 from ..tseries.main import TSeries
 
 class Plain(Pattern):
     def __init__(self, pID, tseries=TSeries(), load=[[]]):
-        pass
\ No newline at end of file
+        """
+        Plain load pattern
+        :param pID: pattern ID
+        :param tseries: load time series
+        :param load: list of nodal loads [[Node or node ID, value_1, value_2, ...], ...]
+                     (node IDs are resolved when the pattern is added to the domain)
+        """
+        super().__init__(pID)
+        self._tseries = tseries
+        for entry in load:
+            if len(entry) > 0:
+                node = entry[0] if isinstance(entry[0], Node) else None
+                ID = entry[0]._ID if node is not None else int(entry[0])
+                self._loads[ID] = (node, np.asarray(entry[1:], dtype=float))
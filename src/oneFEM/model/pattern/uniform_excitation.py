@@ -1,5 +1,46 @@
+import numpy as np
 from ..pattern.main import Pattern
+from ..tseries.main import TSeries
 
 class UniformExcitation(Pattern):
-    def __init__(self):
-        pass
\ No newline at end of file
+    def __init__(self, pID=-1, dof=1, tseries=TSeries()):
+        """
+        Uniform (support) excitation pattern: ground acceleration a_g(t) in
+        one direction, applied as the effective load -M i a_g(t)
+        :param pID: pattern ID
+        :param dof: direction of the excitation (node d.o.f. e.g.: 1, 2, 3)
+        :param tseries: ground acceleration time series
+        """
+        super().__init__(pID)
+        if int(dof) < 1:
+            raise ValueError("oneFEM.UniformExcitation() - Direction must be a positive d.o.f. number!")
+        self._dof = int(dof)
+        self._tseries = tseries
+
+    def _influence(self, store, nDOF):
+        """
+        Influence vector i of the excitation (1 on the d.o.f.s of the direction)
+        :param store: NodeStore of the domain
+        :param nDOF: total number of d.o.f.s of the domain
+        :return: (nDOF,) influence vector
+        """
+        r = np.zeros(nDOF)
+        dofs = store.getDOFs()
+        if dofs.shape[1] >= self._dof:
+            d = dofs[:, self._dof - 1]
+            r[d[d >= 0]] = 1.0
+        return r
+
+    def _spatialLoad(self, model):
+        """
+        Effective earthquake load distribution -M i (M assembled if missing)
+        :param model: Domain object (numbered)
+        :return: (nDOF,) global load vector
+        """
+        if not hasattr(model.M, "shape") or model.M.shape != (model.nDOF, model.nDOF):
+            model._assembleMass()
+        return -(model.M @ self._influence(model.getNodeStore(), model.nDOF))
+
+    def getDOF(self):
+        """Return the direction of the excitation."""
+        return self._dof
@@ -0,0 +1,103 @@
+##-----------------------------------------------------------------------##
+#                                                                         #
+#        #--oneFEM--#: One FEM software in a galaxy far far away          #
+#                                                                         #
+#                   Computational Mechanics 2025                          #
+#                   University of Chieti-Pescara                          #
+#                 Written by: Onur Deniz AKAN, Ud'A                       #
+#                         9 February 2025                                 #
+#                                                                         #
+##-----------------------------------------------------------------------##
+#
+# Author: Onur Deniz Akan
+# Date: 14/02/2025
+# Version: 0.1
+#
+#REGISTRY object definition
+#   ID-indexed container of model objects (nodes, elements, patterns,
+#   constraints, recorders). Objects are kept in a dictionary keyed by
+#   their ID, giving O(1) add, get, remove and contains. Iteration follows
+#   the insertion order.
+
+class Registry(object):
+    def __init__(self, name="Object"):
+        """
+        Registry Constructor
+        :param name: name of the registered object type (for messages)
+        """
+        self._name = name
+        self._objects = {}      # ID -> object
+
+    def __len__(self):
+        return len(self._objects)
+
+    def __iter__(self):
+        return iter(self._objects.values())
+
+    def __contains__(self, obj):
+        # obj is either a registered object or an ID
+        if hasattr(obj, "_ID"):
+            return self._objects.get(obj._ID) is obj
+        return obj in self._objects
+
+    # Registry API
+    def add(self, obj):
+        """
+        Register an object
+        :param obj: object with an _ID attribute
+        """
+        if obj._ID in self._objects:
+            if self._objects[obj._ID] is obj:
+                return
+            raise ValueError("oneFEM.Registry.add() - {} with ID {} already exists!".format(self._name, obj._ID))
+
+        self._objects[obj._ID] = obj
+
+    def add_many(self, objs):
+        """
+        Register a sequence of objects at once
+        :param objs: iterable of objects with an _ID attribute
+        """
+        new = {}
+        for obj in objs:
+            old = self._objects.get(obj._ID, new.get(obj._ID))
+            if old is not None and old is not obj:
+                raise ValueError("oneFEM.Registry.add_many() - {} with ID {} already exists!".format(self._name, obj._ID))
+            new[obj._ID] = obj
+
+        self._objects.update(new)
+
+    def get(self, ID):
+        """
+        Return the object registered with ID (None if not found)
+        :param ID: object ID
+        """
+        return self._objects.get(ID)
+
+    def remove(self, obj):
+        """
+        Remove an object
+        :param obj: registered object or its ID
+        :return: removed object (None if not found)
+        """
+        ID = obj._ID if hasattr(obj, "_ID") else obj
+        found = self._objects.get(ID)
+        if found is None or (hasattr(obj, "_ID") and found is not obj):
+            return None
+
+        return self._objects.pop(ID)
+
+    def contains(self, obj):
+        """
+        Check if an object (or ID) is registered
+        :param obj: object or its ID
+        """
+        return obj in self
+
+    def getIDs(self):
+        """Return the list of registered IDs"""
+        return list(self._objects.keys())
+
+    def getObjects(self):
+        """Return the list of registered objects"""
+        return list(self._objects.values())
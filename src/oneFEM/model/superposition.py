@@ -0,0 +1,137 @@
+##-----------------------------------------------------------------------##
+#                                                                         #
+#        #--oneFEM--#: One FEM software in a galaxy far far away          #
+#                                                                         #
+#                   Computational Mechanics 2025                          #
+#                   University of Chieti-Pescara                          #
+#                 Written by: Onur Deniz AKAN, Ud'A                       #
+#                         9 February 2025                                 #
+#                                                                         #
+##-----------------------------------------------------------------------##
+#
+# Author: Onur Deniz Akan
+# Date: 14/02/2025
+# Version: 0.1
+#
+#SUPERPOSITION object definition
+#   results of the linear solution of every load pattern (unit factor)
+#   kept as arrays with one column per load case:
+#       U (nDOF, nCases)  displacements
+#       F (nDOF, nCases)  loads (free d.o.f.s) and reactions (fixed d.o.f.s)
+#       E (nElem, nMaxEDOF, nCases)  element forces k_e u_e
+#   a load combination is a weight vector w over the cases and its results
+#   are the products U w, F w and E w. several combinations are the columns
+#   of a weight matrix W (nCases, nCombos), so all of them are evaluated by
+#   one matrix product per result, without touching the solver. the
+#   envelope is a running max/min over chunks of combinations, so the
+#   (results x combinations) arrays are never held at once.
+
+import numpy as np
+
+class Superposition(object):
+    # maximum number of entries of a (results x combinations) chunk of the envelope
+    _chunk = 2**22
+
+    def __init__(self, IDs, U, F, E, elementIDs):
+        """
+        Superposition Constructor
+        :param IDs: pattern ID of each load case
+        :param U: (nDOF, nCases) displacements of the load cases
+        :param F: (nDOF, nCases) loads and reactions of the load cases
+        :param E: (nElem, nMaxEDOF, nCases) element forces of the load cases
+        :param elementIDs: element ID of each row of E
+        """
+        self._IDs = list(IDs)
+        self._case = {ID: i for i, ID in enumerate(self._IDs)}
+        self._U = np.asarray(U, dtype=float)
+        self._F = np.asarray(F, dtype=float)
+        self._E = np.asarray(E, dtype=float)
+        self._element = {ID: i for i, ID in enumerate(elementIDs)}
+
+    def _weights(self, combinations):
+        """
+        Weight matrix of load combinations
+        :param combinations: dict {pattern ID: factor} (one combination), list of
+                             such dicts, or (nCases, nCombos) array
+        :return: (nCases,) weights for a dict, (nCases, nCombos) weights otherwise
+        """
+        if isinstance(combinations, np.ndarray):
+            W = np.asarray(combinations, dtype=float)
+            if W.shape[0] != len(self._IDs):
+                raise ValueError("oneFEM.Superposition() - Weight matrix must have one row per load case!")
+            return W
+
+        single = isinstance(combinations, dict)
+        combinations = [combinations] if single else list(combinations)
+        W = np.zeros((len(self._IDs), len(combinations)))
+        for j, factors in enumerate(combinations):
+            for pID, factor in factors.items():
+                if pID not in self._case:
+                    raise ValueError("oneFEM.Superposition() - Load case {} not found!".format(pID))
+                W[self._case[pID], j] += factor
+        return W[:, 0] if single else W
+
+    def getCase(self, pID):
+        """
+        Return the results of a load case
+        :param pID: pattern ID
+        :return: (nDOF,) displacements, (nDOF,) loads/reactions
+        """
+        if pID not in self._case:
+            raise ValueError("oneFEM.Superposition.getCase() - Load case {} not found!".format(pID))
+        i = self._case[pID]
+        return self._U[:, i], self._F[:, i]
+
+    def getDisp(self, combinations):
+        """Return the displacements of the combinations ((nDOF,) or (nDOF, nCombos))."""
+        return self._U @ self._weights(combinations)
+
+    def getReactions(self, combinations):
+        """Return the loads/reactions of the combinations ((nDOF,) or (nDOF, nCombos))."""
+        return self._F @ self._weights(combinations)
+
+    def getElementForces(self, combinations, eleID=None):
+        """
+        Return the element forces of the combinations
+        :param combinations: see _weights()
+        :param eleID: (Optional) element ID (None: all elements)
+        :return: (nElem, nMaxEDOF[, nCombos]) or (nMaxEDOF[, nCombos]) element forces
+        """
+        E = self._E
+        if eleID is not None:
+            if eleID not in self._element:
+                raise ValueError("oneFEM.Superposition.getElementForces() - Element {} not found!".format(eleID))
+            E = E[self._element[eleID]]
+        return E @ self._weights(combinations)
+
+    def getEnvelope(self, combinations):
+        """
+        Envelope of the results over the combinations
+        :param combinations: list of dicts {pattern ID: factor} or (nCases, nCombos) array
+        :return: dict {"u", "F", "element"} of (max, min) pairs
+        """
+        W = self._weights(combinations)
+        if W.ndim == 1:
+            W = W[:, None]
+
+        envelope = {}
+        for name, R in (("u", self._U), ("F", self._F), ("element", self._E)):
+            size = max(1, self._chunk // max(1, R.size // max(1, R.shape[-1])))
+            high = low = None
+            for start in range(0, W.shape[1], size):
+                Rc = R @ W[:, start:start + size]
+                if high is None:
+                    high, low = Rc.max(axis=-1), Rc.min(axis=-1)
+                else:
+                    np.maximum(high, Rc.max(axis=-1), out=high)
+                    np.minimum(low, Rc.min(axis=-1), out=low)
+            envelope[name] = (high, low)
+        return envelope
+
+    def getCaseIDs(self):
+        """Return the pattern IDs of the load cases."""
+        return self._IDs
+
+    def getElementIDs(self):
+        """Return the element IDs of the rows of the element forces."""
+        return list(self._element)
@@ -1,5 +1,16 @@
+import numpy as np
 from .main import TSeries
 
 class Constant(TSeries):
-    def __init__(self, tID, factor=1.0):
-        pass
\ No newline at end of file
+    def __init__(self, tID=-1, factor=1.0):
+        """
+        Constant time series
+        :param tID: time series ID
+        :param factor: constant load factor
+        """
+        super().__init__(tID)
+        self._factor = float(factor)
+
+    def getFactor(self, t):
+        """Return the (constant) load factor at time(s) t."""
+        return np.full_like(np.asarray(t, dtype=float), self._factor)
@@ -1,5 +1,16 @@
+import numpy as np
 from .main import TSeries
 
 class Linear(TSeries):
-    def __init__(self):
-        pass
\ No newline at end of file
+    def __init__(self, tID=-1, factor=1.0):
+        """
+        Linear time series: factor*t
+        :param tID: time series ID
+        :param factor: slope of the load factor
+        """
+        super().__init__(tID)
+        self._factor = float(factor)
+
+    def getFactor(self, t):
+        """Return the load factor at time(s) t."""
+        return self._factor*np.asarray(t, dtype=float)
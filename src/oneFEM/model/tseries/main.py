@@ -1,3 +1,20 @@
+import numpy as np
+
 class TSeries(object):
-    def __init__(self):
-        pass
\ No newline at end of file
+    def __init__(self, ID=-1):
+        """
+        Time series: load factor as a function of time (constant 1.0)
+        :param ID: time series ID
+        """
+        self._ID = ID
+
+    def getFactor(self, t):
+        """
+        Return the load factor at time(s) t
+        :param t: time (float or numpy array, evaluated element-wise)
+        """
+        return np.ones_like(np.asarray(t, dtype=float))
+
+    def getID(self):
+        """Return the time series ID."""
+        return self._ID
@@ -1,5 +1,49 @@
+import numpy as np
 from .main import TSeries
 
 class Path(TSeries):
-    def __init__(self):
-        pass
\ No newline at end of file
+    def __init__(self, tID=-1, values=[], time=None, dt=None, factor=1.0, useLast=False, useFirst=False):
+        """
+        Path time series: piecewise linear interpolation of (time, value) points
+        (ex: ground motion records, response spectra with time = period)
+        :param tID: time series ID
+        :param values: load factor values
+        :param time: (Optional) time of each value (increasing)
+        :param dt: (Optional) constant time step of the values (if time is None)
+        :param factor: scale factor of the values
+        :param useLast: keep the last value after the end of the path (default: 0.0)
+        :param useFirst: keep the first value before the start of the path (default: 0.0)
+        """
+        super().__init__(tID)
+        values = np.asarray(values, dtype=float)
+        if time is None:
+            if dt is None:
+                raise ValueError("oneFEM.Path() - Either time or dt must be given!")
+            time = float(dt)*np.arange(values.shape[0])
+        time = np.asarray(time, dtype=float)
+        if time.shape != values.shape:
+            raise ValueError("oneFEM.Path() - Number of time and value entries does not match!")
+        if np.any(np.diff(time) < 0.0):
+            raise ValueError("oneFEM.Path() - Time must be increasing!")
+
+        self._time = time
+        self._values = float(factor)*values
+        self._useLast = useLast
+        self._useFirst = useFirst
+
+    def getFactor(self, t):
+        """Return the interpolated load factor at time(s) t (vectorized)."""
+        t = np.asarray(t, dtype=float)
+        if self._values.shape[0] == 0:
+            return np.zeros_like(t)
+        left = self._values[0] if self._useFirst else 0.0
+        right = self._values[-1] if self._useLast else 0.0
+        return np.interp(t, self._time, self._values, left=left, right=right)
+
+    def getTime(self):
+        """Return the time of the path points."""
+        return self._time
+
+    def getValues(self):
+        """Return the (scaled) values of the path points."""
+        return self._values
@@ -3,4 +3,11 @@ from ...model.element import Element
 
 class ElementRecorder(Recorder):
     def __init__(self, recID, ele=Element(), results=[], file=''):
-        pass
\ No newline at end of file
+        super().__init__(recID)
+        self._element = ele
+        self._results = results
+        self._file = file
+
+    def getElements(self):
+        """Return the list of recorded elements."""
+        return [self._element]
@@ -1,3 +1,11 @@
 class Recorder(object):
-    def __init__(self):
-        pass
\ No newline at end of file
+    def __init__(self, ID=-1):
+        self._ID = ID
+
+    def getNodes(self):
+        """Return the list of recorded nodes."""
+        return []
+
+    def getElements(self):
+        """Return the list of recorded elements."""
+        return []
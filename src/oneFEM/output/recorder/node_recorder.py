@@ -3,4 +3,42 @@ from ...model.node import Node
 
 class NodeRecorder(Recorder):
     def __init__(self, recID, nd=Node(), dofs=[], results=[], file=''):
-        pass
\ No newline at end of file
+        super().__init__(recID)
+        self._node = nd
+        self._dofs = dofs
+        self._results = results
+        self._file = file
+        self._history = {}      # result -> (nSteps, nDOFs) recorded history
+
+    def getNodes(self):
+        """Return the list of recorded nodes."""
+        return [self._node]
+
+    def getDOFs(self):
+        """Return the global d.o.f.s of the recorded node d.o.f.s (e.g.: [1, 2, 3])."""
+        gd = self._node.getDOFs()
+        return [gd[d - 1] for d in self._dofs]
+
+    def getResults(self):
+        """Return the recorded result types ('disp', 'vel', 'accel')."""
+        return self._results
+
+    def _getKinematics(self):
+        """
+        Return the recorded kinematic results with their result type (see
+        Node.getResult), other results (e.g.: 'reaction') are skipped
+        :return: list of (result, 'disp', 'vel' or 'accel')
+        """
+        return [(result, Node._queries[result]) for result in self._results if result in Node._queries]
+
+    def _setHistory(self, result, values):
+        """
+        Store the history of a result
+        :param result: result type
+        :param values: (nSteps, nDOFs) values of the recorded d.o.f.s
+        """
+        self._history[result] = values
+
+    def getHistory(self, result):
+        """Return the (nSteps, nDOFs) history of a result."""
+        return self._history.get(result)
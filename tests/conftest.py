@@ -0,0 +1,74 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from oneFEM.model import Domain
+from oneFEM.model.assembler import Assembler
+from oneFEM.model.node import Node36
+from oneFEM.model.element.beam import BernoulliBeam
+
+SECTION = dict(E=3e7, A=0.09, Iz=6.75e-4, Iy=6.75e-4, G=1.25e7, J=1.1e-3)
+
+
+def build_frame(nx=2, ny=2, nz=3, mass=1.0, rot_mass=0.1):
+    """
+    3D moment frame fixed at the base: nx by ny bays, nz storeys, lumped
+    floor masses (rot_mass: rotational mass ratio, 0 for massless rotations)
+    :return: Domain, {(i, j, k): Node36}
+    """
+    model = Domain()
+    nodes = {}
+    for k in range(nz + 1):
+        for j in range(ny + 1):
+            for i in range(nx + 1):
+                node = Node36(len(nodes), coord=[5.0*i, 4.0*j, 3.0*k])
+                if k == 0:
+                    node.setFix([True]*6)
+                else:
+                    node.setMass([mass]*3 + [rot_mass*mass]*3)
+                nodes[i, j, k] = node
+    model.add(*nodes.values())
+
+    elements = []
+    for (i, j, k), node in nodes.items():
+        if k == 0:
+            continue
+        elements.append(BernoulliBeam(len(elements), [nodes[i, j, k - 1], node], **SECTION))
+        if i < nx:
+            elements.append(BernoulliBeam(len(elements), [node, nodes[i + 1, j, k]], **SECTION))
+        if j < ny:
+            elements.append(BernoulliBeam(len(elements), [node, nodes[i, j + 1, k]], **SECTION))
+    model.add(*elements)
+    return model, nodes
+
+
+def numbered_frame(nx=2, ny=2, nz=3):
+    """
+    Numbered frame, its assembled stiffness and free d.o.f.s (in d.o.f. order)
+    :return: Domain, K (csr), uu
+    """
+    model, _ = build_frame(nx, ny, nz)
+    model._domain()
+    K, _ = Assembler()._assemble(model.getElements(), model.nDOF)
+    store = model.getNodeStore()
+    dofs, fix = store.getDOFs(), store.getFix()
+    uu = np.sort(dofs[(dofs >= 0) & ~fix[:, :dofs.shape[1]]])
+    return model, K.tocsr(), uu
+
+
+def bandwidth(A):
+    """Half bandwidth of a sparse matrix."""
+    A = A.tocoo()
+    return int(np.max(np.abs(A.row - A.col)))
+
+
+@pytest.fixture
+def frame():
+    model, nodes = build_frame()
+    model._domain()
+    model._assemble()
+    return model, nodes
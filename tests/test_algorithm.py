@@ -0,0 +1,140 @@
+import numpy as np
+import pytest
+
+from conftest import SECTION
+from oneFEM.model import Domain
+from oneFEM.model.node import Node36
+from oneFEM.model.element.beam import BernoulliBeam
+from oneFEM.model.pattern import Plain
+from oneFEM.model.tseries import Constant
+from oneFEM.analysis import Analysis
+from oneFEM.analysis.algorithm import Krylov, Newton, Bisection, Secant, RegulaFalsi
+from oneFEM.analysis.test import NormUnbalance
+from oneFEM.analysis.system.umfpack import UmfPack
+
+
+class StiffeningBeam(BernoulliBeam):
+    # beam with a cubic stiffening term in its resisting force: the tangent
+    # is that of the last resisting force evaluation, the linear one is
+    # inexact and modified Newton converges slowly
+    _c = 20.0
+
+    @classmethod
+    def _batchResistingForce(cls, elements, state=None, ue=None):
+        for element, u in zip(elements, ue):
+            element._ue = u.copy()
+        ke = BernoulliBeam._batchStiffness(elements, state)
+        return np.einsum('eij,ej->ei', ke, ue) + cls._c*ue**3
+
+    @classmethod
+    def _batchStiffness(cls, elements, state=None):
+        ke = super()._batchStiffness(elements, state).copy()
+        for k, element in zip(ke, elements):
+            k[np.diag_indices_from(k)] += 3.0*cls._c*getattr(element, "_ue", 0.0)**2
+        return ke
+
+
+class HardeningBeam(StiffeningBeam):
+    # strong stiffening: the linear tangent overshoots the first increments
+    _c = 2000.0
+
+
+def column(n=4, load=10.0, element=StiffeningBeam):
+    # cantilever column with a lateral tip load
+    model = Domain()
+    nodes = [Node36(i, coord=[0.0, 0.0, 3.0*i]) for i in range(n + 1)]
+    nodes[0].setFix([True]*6)
+    model.add(*nodes)
+    model.add(*[element(i, [nodes[i], nodes[i + 1]], **SECTION) for i in range(n)])
+    model.add(Plain(1, tseries=Constant(1, 1.0), load=[[nodes[-1], load, 0.5*load, 0.0, 0.0, 0.0, 0.0]]))
+    model._domain()
+    model._assemble()
+    store = model.getNodeStore()
+    dofs, fix = store.getDOFs(), store.getFix()
+    uu = np.sort(dofs[(dofs >= 0) & ~fix[:, :dofs.shape[1]]])
+    return model, uu
+
+
+def test_krylov_accelerates_modified_newton():
+    solutions, iterations = [], []
+    for maxDim in (0, 3):
+        model, uu = column()
+        algorithm = Krylov(maxDim=maxDim)
+        algorithm.uu = uu
+        test, system = NormUnbalance(tol=1e-8, maxIter=50), UmfPack()
+        assert algorithm.solve(model, system, test)
+        assert system._nFactor == 1
+        solutions.append(model.u[uu].copy())
+        iterations.append(test.getIterations())
+
+    assert np.allclose(solutions[0], solutions[1], rtol=1e-6)
+    assert iterations[1] < iterations[0]
+
+
+def test_krylov_tangent_policy():
+    for tangent, formed in (("step", 2), ("initial", 1)):
+        model, uu = column()
+        calls = []
+        assemble = model._assembleTangent
+        model._assembleTangent = lambda: calls.append(1) or assemble()
+
+        algorithm = Krylov(tangent=tangent)
+        algorithm.uu = uu
+        test, system = NormUnbalance(tol=1e-8, maxIter=50), UmfPack()
+        for step in (1, 2):
+            model.F[uu] *= step
+            assert algorithm.solve(model, system, test)
+        assert len(calls) == formed
+
+
+def test_newton_tangent_policies():
+    solutions, iterations, factors = [], [], []
+    for tangent in ("iteration", "step"):
+        model, uu = column()
+        algorithm = Newton(tangent=tangent)
+        algorithm.uu = uu
+        test, system = NormUnbalance(tol=1e-8, maxIter=50), UmfPack()
+        assert algorithm.solve(model, system, test)
+        solutions.append(model.u[uu].copy())
+        iterations.append(test.getIterations())
+        factors.append(system._nFactor)
+
+    assert np.allclose(solutions[0], solutions[1], rtol=1e-6)
+    assert iterations[0] < iterations[1]
+    # full Newton: a new tangent every iteration but the converged one
+    assert factors == [iterations[0], 1]
+
+
+def test_analysis_counts_factorizations():
+    for tangent, counts in (("step", [1, 1]), ("initial", [1, 0])):
+        model, uu = column()
+        algorithm = Newton(tangent=tangent)
+        algorithm.uu = uu
+        system = UmfPack()
+        analysis = Analysis(algorithm=algorithm, system=system, test=NormUnbalance(tol=1e-8, maxIter=50))
+        for step, nFactor in zip((1, 2), counts):
+            model.F[uu] *= step
+            assert algorithm.solve(model, system, analysis)
+            assert analysis.getCounts()[0] == nFactor
+            assert analysis.getCounts()[1] == analysis._convergence_test.getIterations()
+
+
+@pytest.mark.parametrize("lineSearch", [Bisection, Secant, RegulaFalsi])
+def test_line_search_stabilizes_modified_newton(lineSearch):
+    model, uu = column(load=20.0, element=HardeningBeam)
+    algorithm = Newton(tangent="iteration")
+    algorithm.uu = uu
+    assert algorithm.solve(model, UmfPack(), NormUnbalance(tol=1e-8, maxIter=50))
+    reference = model.u[uu].copy()
+
+    # the initial tangent alone diverges: the search scales the increments
+    # with residual evaluations only (one factorization)
+    model, uu = column(load=20.0, element=HardeningBeam)
+    search = lineSearch()
+    algorithm = Newton(tangent="step", lineSearch=search)
+    algorithm.uu = uu
+    test, system = NormUnbalance(tol=1e-8, maxIter=100), UmfPack()
+    assert algorithm.solve(model, system, test)
+    assert np.allclose(model.u[uu], reference, rtol=1e-6)
+    assert system._nFactor == 1 and system._nSolve == test.getIterations()
+    assert search.getEvaluations() <= 10
@@ -0,0 +1,48 @@
+import numpy as np
+from scipy.sparse.linalg import spsolve
+
+from conftest import numbered_frame
+from oneFEM.analysis.system import Iterative, SmoothedAggregation
+
+
+def test_rigid_body_modes_are_nullspace():
+    model, K, uu = numbered_frame()
+    B = model.getRigidBodyModes()
+    assert B.shape == (model.nDOF, 6)
+    assert np.allclose(K @ B, 0.0, atol=1e-6*abs(K).max())
+    assert np.array_equal(model.getRigidBodyModes(uu), B[uu])
+
+
+def test_amg_cuts_iterations():
+    model, K, uu = numbered_frame(6, 6, 6)
+    Kuu = K[uu][:, uu]
+    b = np.ones(uu.shape[0])
+    reference = spsolve(Kuu.tocsc(), b)
+
+    iterations = {}
+    for preconditioner in ("jacobi", SmoothedAggregation(coarse_size=200)):
+        system = Iterative(preconditioner=preconditioner, maxiter=20000)
+        system._setNullspace(model.getRigidBodyModes(uu))
+        system._setA(Kuu)
+        x = system._solve(b)
+        assert np.allclose(x, reference, rtol=1e-5, atol=1e-8*np.abs(reference).max())
+        iterations[preconditioner if isinstance(preconditioner, str) else "amg"] = system.getIterations()
+
+    assert preconditioner.getLevels() > 1
+    assert 5*iterations["amg"] < iterations["jacobi"]
+
+
+def test_amg_keeps_aggregates_on_new_values():
+    model, K, uu = numbered_frame(4, 4, 4)
+    Kuu = K[uu][:, uu]
+    amg = SmoothedAggregation(coarse_size=100)
+    system = Iterative(preconditioner=amg)
+    system._setNullspace(model.getRigidBodyModes(uu))
+    system._setA(Kuu)
+    b = np.ones(uu.shape[0])
+    x = system._solve(b)
+    T = [level["T"] for level in amg._levels]
+
+    system._setA(2.0*Kuu)
+    assert [level["T"] for level in amg._levels] == T
+    assert np.allclose(system._solve(b), x/2.0, rtol=1e-5)
@@ -0,0 +1,81 @@
+import numpy as np
+from scipy.sparse import issparse
+
+from oneFEM.model.assembler import Assembler
+from oneFEM.model.element.main import Element
+
+
+class Spring(Element):
+    # linear spring between two global d.o.f.s (with an optional force)
+    def __init__(self, ele_id, dofs, k, f=()):
+        super().__init__(ele_id)
+        self._gd = list(dofs)
+        self._k = k*np.array([[1.0, -1.0], [-1.0, 1.0]])
+        self._f = np.asarray(f, dtype=float)
+
+    def _domain(self):
+        pass
+
+    def getDOFs(self):
+        return self._gd
+
+
+def springs(nDOF=12, nElem=40, seed=0):
+    rng = np.random.default_rng(seed)
+    elements = []
+    for i in range(nElem):
+        dofs = rng.choice(nDOF, 2, replace=False)
+        elements.append(Spring(i, dofs, rng.uniform(1.0, 2.0), rng.uniform(-1.0, 1.0, 2) if i % 3 == 0 else ()))
+    return elements
+
+
+def dense(elements, nDOF):
+    # reference: element by element dense assembly
+    K = np.zeros((nDOF, nDOF))
+    F = np.zeros(nDOF)
+    for element in elements:
+        gd = element.getDOFs()
+        K[np.ix_(gd, gd)] += element.getStiffness()
+        if element.getForce().size:
+            F[gd] += element.getForce()
+    return K, F
+
+
+def test_sparse_assembly_matches_dense():
+    elements = springs()
+    K, F = Assembler()._assemble(elements, 12)
+    Kref, Fref = dense(elements, 12)
+    assert issparse(K) and K.format == "csr"
+    assert K.nnz < 12*12
+    assert np.allclose(K.toarray(), Kref)
+    assert np.allclose(F, Fref)
+
+
+def test_assembly_of_unconnected_dofs():
+    # d.o.f.s without elements keep empty rows
+    K, F = Assembler()._assemble([Spring(1, [0, 3], 2.0)], 6)
+    assert K.shape == (6, 6) and K.nnz == 4
+    assert np.array_equal(K.toarray()[[1, 2, 4, 5]], np.zeros((4, 6)))
+    assert np.array_equal(F, np.zeros(6))
+
+
+def test_numeric_reassembly_reuses_pattern():
+    elements = springs()
+    assembler = Assembler()
+    K1, _ = assembler._assemble(elements, 12)
+
+    # new values, same topology: only the numeric phase runs
+    for element in elements:
+        element._k = 2.0*element._k
+    K2, F2 = assembler._assemble(elements, 12)
+    assert np.shares_memory(K2.indices, K1.indices) and np.shares_memory(K2.indptr, K1.indptr)
+    Kref, Fref = dense(elements, 12)
+    assert np.allclose(K2.toarray(), Kref)
+    assert np.allclose(F2, Fref)
+
+    # new topology: the pattern is built again once invalidated
+    elements.append(Spring(len(elements), [0, 11], 1.0))
+    assembler._invalidate()
+    K3, _ = assembler._assemble(elements, 12)
+    assert not np.shares_memory(K3.indices, K1.indices)
+    assert np.allclose(K3.toarray(), dense(elements, 12)[0])
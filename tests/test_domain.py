@@ -0,0 +1,76 @@
+import pytest
+
+from conftest import SECTION
+from oneFEM.model import Domain
+from oneFEM.model.node import Node36
+from oneFEM.model.element.beam import BernoulliBeam
+from oneFEM.model.pattern import Plain
+from oneFEM.output.recorder import ElementRecorder, NodeRecorder
+
+
+def chain(n=4):
+    # n beams along X
+    model = Domain()
+    nodes = [Node36(i, coord=[2.0*i, 0.0, 0.0]) for i in range(n + 1)]
+    beams = [BernoulliBeam(10 + i, [nodes[i], nodes[i + 1]], **SECTION) for i in range(n)]
+    model.add(*nodes, *beams)
+    return model, nodes, beams
+
+
+def test_lookup_by_id():
+    model, nodes, beams = chain()
+    assert model.getNode(2) is nodes[2] and model.getElement(12) is beams[2]
+    assert model.getNode(99) is None
+    assert nodes[2] in model and beams[2] in model
+    assert model.getNodes() == nodes and model.getElements() == beams
+
+
+def test_duplicate_ids():
+    model, nodes, _ = chain()
+    model.add(nodes[0])     # same object again: nothing to do
+    assert len(model.getNodes()) == len(nodes)
+    with pytest.raises(ValueError):
+        model.add(Node36(0, coord=[0.0, 1.0, 0.0]))
+    with pytest.raises(ValueError):
+        model.add(Node36(50, coord=[0.0, 1.0, 0.0]), Node36(50, coord=[0.0, 2.0, 0.0]))
+
+
+def test_remove_element():
+    model, nodes, beams = chain()
+    model.remove(beams[1])
+    assert beams[1] not in model and model.getElement(11) is None
+    assert model.getElements() == [beams[0], beams[2], beams[3]]
+    assert model.getNodes() == nodes
+
+    # an object that is not in the domain (same ID) is not removed
+    model.remove(BernoulliBeam(12, [nodes[2], nodes[3]], **SECTION))
+    assert model.getElement(12) is beams[2]
+
+
+def test_remove_node_cascades():
+    model, nodes, beams = chain()
+    pattern = Plain(1, load=[[nodes[2], 1.0], [nodes[4], 2.0]])
+    on_node = NodeRecorder(1, nodes[2], [1], ["disp"])
+    on_element = ElementRecorder(2, beams[1], ["force"])
+    elsewhere = NodeRecorder(3, nodes[4], [1], ["disp"])
+    model.add(pattern, on_node, on_element, elsewhere)
+
+    adjacency = model.getAdjacency()
+    assert set(adjacency.getConnected("element", nodes[2])) == {beams[1], beams[2]}
+    assert adjacency.getConnected("pattern", nodes[2]) == [pattern]
+
+    # the beams and recorders on the node go, the pattern only loses its load
+    model.remove(nodes[2])
+    assert nodes[2] not in model
+    assert model.getElements() == [beams[0], beams[3]]
+    assert model.getRecorder(1) is None and model.getRecorder(2) is None
+    assert model.getRecorder(3) is elsewhere
+    assert model.getPattern(1) is pattern and pattern.getNodes() == [nodes[4]]
+    assert adjacency.getConnected("element", nodes[3]) == [beams[3]]
+
+
+def test_node_graph():
+    model, nodes, _ = chain()
+    indptr, indices = model.getAdjacency().getNodeGraph(model.getNodeStore().getNodes())
+    neighbours = [set(indices[indptr[i]:indptr[i + 1]]) for i in range(len(nodes))]
+    assert neighbours == [{1}, {0, 2}, {1, 3}, {2, 4}, {3}]
@@ -0,0 +1,225 @@
+import numpy as np
+import pytest
+from scipy.sparse.linalg import spsolve
+
+from conftest import build_frame
+from oneFEM.model.pattern import Plain, UniformExcitation
+from oneFEM.model.tseries import Constant, Path
+from oneFEM.output.recorder.node_recorder import NodeRecorder
+from oneFEM.analysis.eigen import Eigen
+from oneFEM.analysis.integrator import ModalSuperposition, Newmark
+from oneFEM.analysis.system.umfpack import UmfPack
+
+
+def loaded_frame(rot_mass=0.1, load=True):
+    # frame with a constant lateral load at the roof and a roof recorder
+    model, nodes = build_frame(rot_mass=rot_mass)
+    roof = nodes[2, 2, 3]
+    if load:
+        model.add(Plain(1, tseries=Constant(1, 1.0), load=[[roof, 10.0, 5.0, 0.0, 0.0, 0.0, 0.0]]))
+    recorder = NodeRecorder(1, roof, [1, 2, 3], ["disp", "vel", "accel"])
+    model.add(recorder)
+    model._domain()
+    model._assemble()
+    model._assembleMass()
+    return model, recorder
+
+
+def test_path_series():
+    series = Path(1, values=[0.0, 2.0, 1.0], dt=0.5, factor=2.0)
+    assert np.allclose(series.getFactor([0.25, 0.5, 0.75, 2.0]), [2.0, 4.0, 3.0, 0.0])
+    series = Path(2, values=[0.0, 2.0, 1.0], time=[0.0, 1.0, 3.0], useLast=True)
+    assert np.allclose(series.getFactor([-1.0, 2.0, 5.0]), [0.0, 1.5, 1.0])
+    with pytest.raises(ValueError):
+        Path(3, values=[0.0, 1.0])
+
+
+def test_modal_superposition_step_load():
+    # undamped modes under a suddenly applied load: q = p/lambda (1 - cos wt)
+    model, recorder = loaded_frame()
+    eigen = Eigen(1, nModes=6)
+    lam, phi = eigen.solve(model)
+    times = ModalSuperposition(1, damping=0.0).analyze(model, eigen, 0.01, 100)
+
+    q = (phi.T @ model.F)[:, None]/lam[:, None]*(1.0 - np.cos(np.sqrt(lam)[:, None]*times))
+    assert np.allclose(recorder.getHistory("disp"), (phi[recorder.getDOFs()] @ q).T, atol=1e-12)
+    assert np.allclose(model.u, phi @ q[:, -1], atol=1e-12)
+
+    # average acceleration: close to the exact recurrence for a small step
+    model.u = np.zeros(model.nDOF)
+    model.v = np.zeros(model.nDOF)
+    ModalSuperposition(1, damping=0.0, method="newmark").analyze(model, eigen, 0.001, 1000)
+    assert np.allclose(model.u, phi @ q[:, -1], rtol=0.0, atol=1e-2*np.abs(q).max()*np.abs(phi).max())
+
+
+def test_uniform_excitation_is_an_inertia_load():
+    # constant ground acceleration a_g: same response as the load -M i a_g
+    model, recorder = loaded_frame(load=False)
+    model.add(UniformExcitation(2, dof=1, tseries=Path(1, values=[3.0, 3.0], time=[0.0, 1.0], useLast=True)))
+    eigen = Eigen(1, nModes=6)
+    ModalSuperposition(1, damping=0.05).analyze(model, eigen, 0.01, 50)
+    H = recorder.getHistory("accel").copy()
+
+    reference, reference_recorder = loaded_frame(load=False)
+    i = np.zeros(reference.nDOF)
+    dofs = reference.getNodeStore().getDOFs()[:, 0]
+    i[dofs[dofs >= 0]] = 1.0
+    F = -3.0*(reference.M @ i)
+    loads = [[node, *F[node.getDOFs()]] for node in reference.getNodes()]
+    reference.add(Plain(1, tseries=Constant(1, 1.0), load=loads))
+    reference._assemble()
+    ModalSuperposition(1, damping=0.05).analyze(reference, Eigen(1, nModes=6), 0.01, 50)
+    assert np.allclose(H, reference_recorder.getHistory("accel"), atol=1e-10)
+
+
+
+def test_modal_superposition_starts_from_preload():
+    model, recorder = loaded_frame()
+    uu, _ = model.getDOFPartition()
+    model.u[uu] = spsolve(model.K.tocsr()[uu][:, uu].tocsc(), model.F[uu])
+    preload = model.u.copy()
+
+    # static solution seen by the retained modes: the preload stays at rest
+    eigen = Eigen(1, nModes=20)
+    lam, phi = eigen.solve(model)
+    static = phi @ ((phi.T @ model.F)/lam)
+
+    for method in ("exact", "newmark"):
+        model.u = preload.copy()
+        model.v = np.zeros(model.nDOF)
+        ModalSuperposition(1, damping=0.05, method=method).analyze(model, eigen, 0.01, 50)
+        H = recorder.getHistory("disp")
+        assert H.shape == (51, 3)
+        assert np.allclose(H, static[recorder.getDOFs()], rtol=1e-8, atol=1e-14)
+
+
+def test_modal_superposition_free_vibration():
+    model, _ = loaded_frame(load=False)
+    eigen = Eigen(1, nModes=4)
+    lam, phi = eigen.solve(model)
+    omega = np.sqrt(lam[0])
+    model.u = phi[:, 0].copy()
+    model.v = np.zeros(model.nDOF)
+
+    integrator = ModalSuperposition(1, damping=0.0, method="exact")
+    times = integrator.analyze(model, eigen, 0.01, 100)
+    q = integrator.getModalResponse()[0]
+    assert np.allclose(q[0], np.cos(omega*times), atol=1e-10)
+    assert np.allclose(q[1:], 0.0, atol=1e-10)
+
+def test_newmark_against_modal_newmark():
+    # all modes but the highest one: same recurrence, same response
+    model, recorder = loaded_frame()
+    uu, _ = model.getDOFPartition()
+    ModalSuperposition(1, damping=0.0, method="newmark").analyze(model, Eigen(1, nModes=uu.shape[0] - 1), 0.02, 100)
+    reference = {r: recorder.getHistory(r).copy() for r in ("disp", "vel", "accel")}
+
+    model.u = np.zeros(model.nDOF)
+    model.v = np.zeros(model.nDOF)
+    model.a = np.zeros(model.nDOF)
+    system = UmfPack()
+    Newmark(1).analyze(model, 0.02, 100, system=system)
+    for result, H in reference.items():
+        assert np.allclose(recorder.getHistory(result), H, rtol=0.0, atol=1e-4*np.abs(H).max())
+    assert system._nFactor == 1
+
+
+
+def test_newmark_massless_rotations():
+    # translational masses only (singular M) and a load at t = 0: the
+    # rotations are condensed, the response is that of the condensed system
+    model, recorder = loaded_frame(rot_mass=0.0)
+    Newmark(1).analyze(model, 0.02, 100)
+    H = recorder.getHistory("disp")
+    assert np.all(np.isfinite(model.u)) and np.all(np.isfinite(model.a))
+
+    uu, _ = model.getDOFPartition()
+    K = model.K.toarray()[np.ix_(uu, uu)]
+    M = model.M.toarray()[np.ix_(uu, uu)]
+    F = model.F[uu]
+    m = np.flatnonzero(M.diagonal() > 0.0)
+    o = np.flatnonzero(M.diagonal() == 0.0)
+    T = -np.linalg.solve(K[np.ix_(o, o)], K[np.ix_(o, m)])
+    Kc = K[np.ix_(m, m)] + K[np.ix_(m, o)] @ T
+    Fc = F[m] - K[np.ix_(m, o)] @ np.linalg.solve(K[np.ix_(o, o)], F[o])
+    Mc = M[np.ix_(m, m)]
+
+    dt, g, b = 0.02, 0.5, 0.25
+    u, v = np.zeros(m.shape[0]), np.zeros(m.shape[0])
+    a = np.linalg.solve(Mc, Fc)
+    Kh = Kc + Mc/(b*dt**2)
+    for _ in range(100):
+        un = np.linalg.solve(Kh, Fc + Mc @ (u/(b*dt**2) + v/(b*dt) + (0.5/b - 1.0)*a))
+        an = (un - u)/(b*dt**2) - v/(b*dt) - (0.5/b - 1.0)*a
+        v = v + dt*((1.0 - g)*a + g*an)
+        u, a = un, an
+
+    full = np.zeros(model.nDOF)
+    full[uu[m]] = u
+    full[uu[o]] = T @ u + np.linalg.solve(K[np.ix_(o, o)], F[o])
+    assert np.allclose(model.u, full, rtol=1e-8, atol=1e-12)
+    assert np.allclose(H[-1], full[recorder.getDOFs()], rtol=1e-8, atol=1e-12)
+
+def test_newmark_refactors_only_on_new_dt():
+    model, _ = loaded_frame()
+    system = UmfPack()
+    integrator = Newmark(1)
+    integrator.analyze(model, 0.01, 20, system=system)
+    integrator.analyze(model, 0.01, 20, system=system)
+    assert system._nFactor == 1
+    integrator.analyze(model, 0.005, 20, system=system)
+    assert system._nFactor == 2
+
+
+def test_newmark_nonlinear_run_of_linear_frame():
+    # linear elements: the iterations converge at once to the linear response
+    model, recorder = loaded_frame()
+    Newmark(1).analyze(model, 0.01, 50)
+    H = recorder.getHistory("disp").copy()
+
+    model, recorder = loaded_frame()
+    system = UmfPack()
+    Newmark(1).analyze(model, 0.01, 50, system=system, nonlinear=True)
+    assert np.allclose(recorder.getHistory("disp"), H, rtol=1e-8, atol=1e-12)
+    assert system._nFactor == 1
+
+
+def test_newmark_without_mass():
+    model, _ = loaded_frame(rot_mass=0.0)
+    model.M = 0.0*model.M
+    with pytest.raises(ValueError):
+        Newmark(1).analyze(model, 0.01, 10)
+
+
+def test_modal_superposition_result_aliases():
+    model, recorder = loaded_frame()
+    roof = recorder.getNodes()[0]
+    aliases = NodeRecorder(2, roof, [1, 2, 3], ["displacement", "velocity", "a", "reaction"])
+    model.add(aliases)
+    ModalSuperposition(1, damping=0.05).analyze(model, Eigen(1, nModes=6), 0.01, 20)
+    for alias, result in (("displacement", "disp"), ("velocity", "vel"), ("a", "accel")):
+        assert np.array_equal(aliases.getHistory(alias), recorder.getHistory(result))
+    assert aliases.getHistory("reaction") is None
+
+
+def test_newmark_result_aliases():
+    model, recorder = loaded_frame()
+    roof = recorder.getNodes()[0]
+    aliases = NodeRecorder(2, roof, [1, 2, 3], ["displacement", "velocity", "a", "reaction"])
+    model.add(aliases)
+    Newmark(1).analyze(model, 0.01, 20)
+    for alias, result in (("displacement", "disp"), ("velocity", "vel"), ("a", "accel")):
+        assert np.array_equal(aliases.getHistory(alias), recorder.getHistory(result))
+    assert aliases.getHistory("reaction") is None
+
+
+def test_newmark_forms_effective_stiffness_once():
+    # linear run: K is not set again, K_eff is formed for the first step only
+    model, _ = loaded_frame()
+    integrator = Newmark(1)
+    integrator.analyze(model, 0.01, 20)
+    assert integrator.getFormations() == 1
+
+    version = model._getStiffnessVersion()
+    model._assemble()
+    assert model._getStiffnessVersion() != version
@@ -0,0 +1,103 @@
+import numpy as np
+import pytest
+from scipy.linalg import eigh
+
+from oneFEM.analysis import Analysis
+from oneFEM.analysis.algorithm import Linear
+from oneFEM.analysis.eigen import Eigen
+from oneFEM.analysis.system.umfpack import UmfPack
+
+
+def dense(model):
+    # reference eigenvalues of the free d.o.f.s (dense generalized problem)
+    uu, _ = model.getDOFPartition()
+    model._assembleMass()
+    K = model.K.toarray()[np.ix_(uu, uu)]
+    M = model.M.toarray()[np.ix_(uu, uu)]
+    return eigh(K, M, eigvals_only=True)
+
+
+@pytest.mark.parametrize("method", ["lanczos", "subspace"])
+def test_lowest_modes(frame, method):
+    model, _ = frame
+    reference = dense(model)
+    eigen = Eigen(1, nModes=6, method=method)
+    vals, phi = eigen.solve(model)
+    assert np.allclose(vals, reference[:6], rtol=1e-8)
+
+    # M-orthonormal mode shapes that solve K phi = lambda M phi (the subspace
+    # iteration stops on the eigenvalues, the vectors are less accurate)
+    uu, _ = model.getDOFPartition()
+    assert np.allclose(phi.T @ (model.M @ phi), np.eye(6), atol=1e-8)
+    residual = model.K @ phi - (model.M @ phi)*vals
+    assert np.allclose(residual[uu], 0.0, atol=1e-4*np.abs(model.K @ phi).max())
+    assert np.allclose(eigen.getPeriods(), 2.0*np.pi/np.sqrt(vals))
+
+
+@pytest.mark.parametrize("method", ["lanczos", "subspace"])
+def test_modes_nearest_to_shift(frame, method):
+    model, _ = frame
+    reference = dense(model)
+    sigma = 1.01*reference[10]
+    nearest = np.sort(reference[np.argsort(np.abs(reference - sigma))[:6]])
+
+    eigen = Eigen(1, nModes=6, sigma=sigma, method=method)
+    vals, _ = eigen.solve(model)
+    assert np.allclose(vals, nearest, rtol=1e-8)
+    if method == "subspace":
+        assert np.all(eigen.getConvergence()[1])
+
+
+def test_static_factorization_and_cached_modes(frame):
+    model, _ = frame
+    linear = Linear()
+    Analysis(algorithm=linear)._organize(model)
+    system = UmfPack()
+    linear.solve(model, system)
+    assert system._nFactor == 1
+
+    # sigma = 0: the eigen solver works with the factorization of Kuu
+    vals, _ = Eigen(1, nModes=4).solve(model, system=system)
+    assert system._nFactor == 1
+
+    # fewer modes: served from the domain cache, no new solve
+    nSolve = system._nSolve
+    fewer, _ = Eigen(2, nModes=2).solve(model, system=system)
+    assert np.array_equal(fewer, vals[:2]) and system._nSolve == nSolve
+
+    # same K: the cache is kept, new values of K: the cache is dropped
+    model.K = model.K.copy()
+    assert model.getModes() is not None
+    model.K = 2.0*model.K
+    assert model.getModes() is None
+    doubled, _ = Eigen(1, nModes=4).solve(model)
+    assert np.allclose(doubled, 2.0*vals, rtol=1e-8)
+
+
+def test_subspace_warm_start(frame):
+    model, _ = frame
+    eigen = Eigen(1, nModes=4, method="subspace")
+    eigen.solve(model)
+    cold = eigen.getIterations()
+    assert np.all(eigen.getConvergence()[1])
+
+    # slightly stiffer frame: the cache is dropped, the last modes start the iteration
+    model.K = 1.02*model.K
+    assert model.getModes() is None
+    vals, _ = eigen.solve(model)
+    assert np.allclose(vals, dense(model)[:4], rtol=1e-8)
+    assert eigen.getIterations() < cold
+
+
+def test_modes_follow_mass_change(frame):
+    model, nodes = frame
+    eigen = Eigen(1, nModes=4)
+    before, _ = eigen.solve(model)
+
+    # four times the masses: the cached modes are dropped on reassembly
+    for node in nodes.values():
+        node.setMass(4.0*np.asarray(node.getMass()))
+    model._assemble()
+    after, _ = eigen.solve(model)
+    assert np.allclose(after, before/4.0, rtol=1e-8)
+    assert np.allclose(after, dense(model)[:4], rtol=1e-8)
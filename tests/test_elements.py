@@ -0,0 +1,57 @@
+import numpy as np
+
+from conftest import SECTION
+from oneFEM.model.node import Node36
+from oneFEM.model.element.beam import BernoulliBeam
+from oneFEM.model.element.truss import Truss
+from oneFEM.model.element.section import Rectangular
+from oneFEM.model.material.uniaxial import Elastic
+
+
+def rigid_modes(coords):
+    # rigid translations and rotations of 6-d.o.f. nodes (columns)
+    modes = []
+    for axis in np.eye(3):
+        modes.append(np.concatenate([np.concatenate([axis, np.zeros(3)]) for _ in coords]))
+        modes.append(np.concatenate([np.concatenate([np.cross(axis, x), axis]) for x in coords]))
+    return np.array(modes).T
+
+
+def members(seed=0, n=8):
+    rng = np.random.default_rng(seed)
+    return [(rng.uniform(-5.0, 5.0, 3), rng.uniform(-5.0, 5.0, 3)) for _ in range(n)] + [(np.zeros(3), np.array([0.0, 0.0, 3.0]))]
+
+
+def test_beam_group_kernel():
+    beams = [BernoulliBeam(i, [Node36(2*i, coord=list(xi)), Node36(2*i + 1, coord=list(xj))], **SECTION)
+             for i, (xi, xj) in enumerate(members())]
+    k = BernoulliBeam._batchStiffness(beams)
+    assert k.shape == (len(beams), 12, 12)
+    for beam, ke in zip(beams, k):
+        assert np.allclose(ke, np.asarray(beam.getStiffness()))
+        assert np.allclose(ke, ke.T)
+        xi, xj = (np.asarray(nd.getCoordinates(), dtype=float) for nd in beam.getNodes())
+        assert np.allclose(ke @ rigid_modes([xi, xj]), 0.0, atol=1e-6*np.abs(ke).max())
+
+
+def test_beam_cantilever_tip():
+    # cantilever along X: tip deflections P L^3/(3 E I), axial P L/(E A)
+    L, P = 4.0, 10.0
+    beam = BernoulliBeam(1, [Node36(1, coord=[0.0, 0.0, 0.0]), Node36(2, coord=[L, 0.0, 0.0])], **SECTION)
+    k = np.asarray(beam.getStiffness())[6:, 6:]
+    u = np.linalg.solve(k, P*np.array([1.0, 1.0, 1.0, 0.0, 0.0, 0.0]))
+    E, A, I = SECTION["E"], SECTION["A"], SECTION["Iz"]
+    assert np.allclose(u[:3], [P*L/(E*A), P*L**3/(3*E*I), P*L**3/(3*E*I)])
+
+
+def test_truss_group_kernel():
+    section = Rectangular(1, mat=Elastic(1, E=2e8), h=0.2, w=0.1)
+    trusses = [Truss(i, nodes=[Node36(2*i, coord=list(xi)), Node36(2*i + 1, coord=list(xj))], section=section)
+               for i, (xi, xj) in enumerate(members())]
+    k = Truss._batchStiffness(trusses)
+    for truss, ke, (xi, xj) in zip(trusses, k, members()):
+        n = (xj - xi)/np.linalg.norm(xj - xi)
+        knn = 2e8*0.02/np.linalg.norm(xj - xi)*np.outer(n, n)
+        assert np.allclose(ke[:3, :3], knn) and np.allclose(ke[:3, 6:9], -knn)
+        assert np.allclose(ke[3:6], 0.0) and np.allclose(ke[9:], 0.0)
+        assert np.allclose(ke, np.asarray(truss.getStiffness()))
@@ -0,0 +1,124 @@
+import numpy as np
+import pytest
+import scipy.sparse as sp
+from scipy.sparse.linalg import LinearOperator, spsolve
+
+from conftest import build_frame
+from oneFEM.analysis.system import Iterative
+
+
+def coupled_grid(n=12):
+    # grid Laplacian with two coupled unknowns per grid point (SPD)
+    T = sp.diags([-1.0, 2.0, -1.0], [-1, 0, 1], shape=(n, n))
+    L = sp.kron(sp.identity(n), T) + sp.kron(T, sp.identity(n))
+    return (sp.kron(L, np.array([[2.0, 0.5], [0.5, 1.0]])) + 0.01*sp.identity(2*n*n)).tocsr()
+
+
+class Operator(LinearOperator):
+    # matrix-free view of A that provides its diagonal (blocks)
+    def __init__(self, A):
+        super().__init__(float, A.shape)
+        self._K = A
+
+    def _matvec(self, x):
+        return self._K @ x.ravel()
+
+    def diagonal(self):
+        return self._K.diagonal()
+
+    def addDiagonalBlocks(self, blocks, label, pos):
+        A = self._K.tocoo()
+        keep = label[A.row] == label[A.col]
+        np.add.at(blocks, (label[A.row[keep]], pos[A.row[keep]], pos[A.col[keep]]), A.data[keep])
+
+
+@pytest.mark.parametrize("method, preconditioner", [("cg", None), ("cg", "jacobi"), ("cg", "block-jacobi"),
+                                                    ("gmres", "ilu"), ("bicgstab", "ilu")])
+def test_krylov_solution(method, preconditioner):
+    A = coupled_grid()
+    b = np.random.default_rng(0).uniform(-1.0, 1.0, A.shape[0])
+    system = Iterative(method=method, preconditioner=preconditioner, block=2, maxiter=2000)
+    system._setA(A)
+    x = system._solve(b)
+    assert np.allclose(x, spsolve(A.tocsc(), b), rtol=1e-5, atol=1e-8*np.abs(x).max())
+    assert system.getIterations() > 0 and system.getResidual() <= 1e-8
+
+
+def test_preconditioners_cut_iterations():
+    A = coupled_grid()
+    b = np.ones(A.shape[0])
+    iterations = {}
+    for preconditioner in (None, "jacobi", "block-jacobi", "ilu"):
+        system = Iterative(preconditioner=preconditioner, block=2, maxiter=2000)
+        system._setA(A)
+        system._solve(b)
+        iterations[preconditioner] = system.getIterations()
+    assert iterations["ilu"] < iterations["block-jacobi"] <= iterations["jacobi"] <= iterations[None]
+
+
+def test_matrix_free_operator():
+    A = coupled_grid()
+    b = np.ones(A.shape[0])
+    for preconditioner in ("jacobi", "block-jacobi"):
+        system = Iterative(preconditioner=preconditioner, block=2, maxiter=2000)
+        system._setA(Operator(A))
+        assert np.allclose(A @ system._solve(b), b, atol=1e-6)
+
+    system = Iterative(preconditioner="ilu")
+    system._setA(Operator(A))
+    with pytest.raises(ValueError):
+        system._solve(b)
+
+
+def test_warm_start():
+    A = coupled_grid()
+    b = np.ones(A.shape[0])
+    system = Iterative(maxiter=2000)
+    system._setA(A)
+    system._solve(b)
+    first = system.getIterations()
+    system._solve(b)
+    assert system.getIterations() < first
+    assert len(system.getHistory()) == 2 and system._nFactor == 1
+
+
+def pinned_frame():
+    # base nodes pinned (translations fixed, rotations free): the free
+    # d.o.f.s of these nodes are not in contiguous groups of 6
+    model, nodes = build_frame()
+    for (i, j, k), node in nodes.items():
+        if k == 0:
+            node.setFix([True]*3 + [False]*3)
+    model._domain()
+    model._assemble()
+    uu, _ = model.getDOFPartition()
+    return model, uu, model.K.tocsr()[uu][:, uu]
+
+
+def test_block_jacobi_node_blocks():
+    model, uu, Kuu = pinned_frame()
+    nodes = model.getDOFNodes(uu)
+    counts = np.bincount(nodes)[np.unique(nodes)]
+    assert counts.max() == 6 and counts.min() == 3
+    assert not np.array_equal(np.unique(nodes, return_inverse=True)[1], np.arange(uu.shape[0]) // 6)
+
+    b = np.ones(uu.shape[0])
+    system = Iterative(preconditioner="block-jacobi", maxiter=5000)
+    system._setBlocks(nodes)
+    system._setA(Kuu)
+    x = system._solve(b)
+    assert np.allclose(x, spsolve(Kuu.tocsc(), b), rtol=1e-5, atol=1e-10*np.abs(x).max())
+
+
+def test_not_converged():
+    _, uu, Kuu = pinned_frame()
+    b = np.ones(uu.shape[0])
+    system = Iterative(preconditioner="jacobi", maxiter=2)
+    system._setA(Kuu)
+    with pytest.raises(ValueError):
+        system._solve(b)
+
+    system = Iterative(preconditioner="jacobi", maxiter=2, strict=False)
+    system._setA(Kuu)
+    system._solve(b)
+    assert "not converged" in system._report()
@@ -0,0 +1,87 @@
+import numpy as np
+import pytest
+from scipy.sparse.linalg import spsolve
+
+from conftest import build_frame
+from oneFEM.model.pattern import Plain
+from oneFEM.model.tseries import Constant
+from oneFEM.analysis import Analysis
+from oneFEM.analysis.algorithm import Linear
+from oneFEM.analysis.system.umfpack import UmfPack
+
+
+def loaded(frame):
+    # frame with a lateral roof load and its free/fixed split
+    model, nodes = frame
+    model.add(Plain(1, tseries=Constant(1, 1.0), load=[[nodes[2, 2, 3], 10.0, 5.0, 0.0, 0.0, 0.0, 0.0]]))
+    model._assemble()
+    algorithm = Linear()
+    analysis = Analysis(algorithm=algorithm)
+    analysis._organize(model)
+    return model, algorithm
+
+
+def test_linear_solves_free_block(frame):
+    model, algorithm = loaded(frame)
+    uu, pp = algorithm._dofs()
+    assert np.array_equal(np.sort(np.concatenate([uu, pp])), np.arange(model.nDOF))
+
+    K = model.K.tocsr()
+    F = model.F.copy()
+    system = UmfPack()
+    algorithm.solve(model, system)
+    assert np.allclose(model.u[uu], spsolve(K[uu][:, uu].tocsc(), F[uu]))
+    assert np.allclose(model.F[pp], K[pp] @ model.u)
+    assert np.allclose(np.bincount(np.arange(model.nDOF) % 6, weights=model.F)[:3], 0.0, atol=1e-9)
+
+
+def test_blocks_are_refilled_in_place(frame):
+    model, algorithm = loaded(frame)
+    uu, _ = algorithm._dofs()
+    system = UmfPack()
+    algorithm.solve(model, system)
+    u = model.u[uu].copy()
+    Kuu = algorithm._blocks(model.K.tocsr())["Kuu"]
+
+    # new load, same K: the factorization is reused
+    model.F[uu] *= 2.0
+    algorithm.solve(model, system)
+    assert np.allclose(model.u[uu], 2.0*u)
+    assert system._nFactor == 1 and system._nSolve == 2
+
+    # new values, same pattern: the blocks keep their index arrays
+    partition = algorithm._partition
+    model.K = 2.0*model.K.tocsr()
+    blocks = algorithm._blocks(model.K.tocsr())
+    assert algorithm._partition is partition
+    assert np.shares_memory(blocks["Kuu"].indices, Kuu.indices)
+    assert np.allclose(blocks["Kuu"].toarray(), 2.0*Kuu.toarray())
+
+
+def test_load_cases_share_one_factorization():
+    model, nodes = build_frame()
+    model.add(Plain(1, load=[[nodes[0, 0, 3], 10.0, 0.0, 0.0, 0.0, 0.0, 0.0]]),
+              Plain(2, load=[[nodes[2, 2, 3], 0.0, 5.0, -20.0, 0.0, 0.0, 0.0]]),
+              Plain(3, load=[[nodes[1, 1, 2], 0.0, 0.0, 0.0, 1.0, 2.0, 0.0]]))
+    model._domain()
+    model._assemble()
+    algorithm = Linear()
+    Analysis(algorithm=algorithm)._organize(model)
+    uu, pp = algorithm._dofs()
+
+    system = UmfPack()
+    assert algorithm.solveCases(model, system) == [1, 2, 3]
+    assert system._nFactor == 1 and system._nSolve == 1
+
+    K = model.K.tocsr()
+    _, P = model._assembleLoads()
+    for i, pID in enumerate(algorithm.getCaseIDs()):
+        u, F = algorithm.getCase(pID)
+        assert np.allclose(u[uu], spsolve(K[uu][:, uu].tocsc(), P[uu, i]))
+        assert np.allclose(F[pp], K[pp] @ u)
+
+    u, F = algorithm.getCombination({1: 1.2, 3: -0.5}, model)
+    assert np.allclose(u[uu], spsolve(K[uu][:, uu].tocsc(), 1.2*P[uu, 0] - 0.5*P[uu, 2]))
+    assert np.array_equal(model.u, u) and np.array_equal(model.F, F)
+    with pytest.raises(ValueError):
+        algorithm.getCase(4)
@@ -0,0 +1,49 @@
+import numpy as np
+
+from oneFEM.model import Domain
+from oneFEM.model.node import Node36
+
+
+def line(model, n):
+    nodes = [Node36(i, coord=[float(i), 0.0, 0.0]) for i in range(n)]
+    for i, node in enumerate(nodes):
+        node.setMass([float(i)]*6)
+    model.add(*nodes)
+    return nodes
+
+
+def test_nodes_are_views_of_the_store():
+    # more nodes than the initial capacity: the store grows, the values stay
+    model = Domain()
+    nodes = line(model, 40)
+    store = model.getNodeStore()
+    assert len(store) == 40 and list(store.getNodes()) == nodes
+    assert np.array_equal(store.getCoordinates()[:, 0], np.arange(40.0))
+    assert np.array_equal(store.getMass()[:, 0], np.arange(40.0))
+
+    nodes[3].setMass([7.0]*6)
+    assert np.array_equal(store.getMass()[3], np.full(6, 7.0))
+
+
+def test_commit_scatters_the_solution():
+    model = Domain()
+    nodes = line(model, 3)
+    for i, node in enumerate(nodes):
+        node._setDOF(list(range(6*i, 6*i + 6)))
+    model.u = np.arange(18.0)
+    model._commit()
+    for i, node in enumerate(nodes):
+        assert np.array_equal(np.asarray(node.getResult("disp", [1, 2, 3, 4, 5, 6])), np.arange(6*i, 6*i + 6.0))
+    assert np.array_equal(model.getNodeStore().getCommitDisp().ravel(), np.arange(18.0))
+
+
+def test_removed_node_keeps_its_data():
+    model = Domain()
+    nodes = line(model, 5)
+    model.remove(nodes[1])
+    store = model.getNodeStore()
+    assert len(store) == 4 and nodes[1] not in store.getNodes()
+    assert np.array_equal(nodes[1].getCoordinates(), [1.0, 0.0, 0.0])
+    assert np.array_equal(nodes[1].getMass(), np.full(6, 1.0))
+    for node in store.getNodes():
+        assert np.array_equal(node.getMass(), np.full(6, node.getCoordinates()[0]))
@@ -0,0 +1,154 @@
+import numpy as np
+
+from conftest import SECTION, bandwidth, build_frame
+from oneFEM.model import Domain
+from oneFEM.model.assembler import Assembler
+from oneFEM.model.node import Node36
+from oneFEM.model.element.beam import BernoulliBeam
+from oneFEM.analysis.numberer import Numberer, Plain, RevCuthillMcKee, NestedDissection
+from oneFEM.analysis.system.umfpack import UmfPack
+
+
+def strip(nx=30, nz=3):
+    # long frame whose nodes are added storey by storey: the plain
+    # numbering has a wide band, RCM numbers it across the strip
+    model = Domain()
+    nodes = {}
+    for k in range(nz + 1):
+        for i in range(nx + 1):
+            node = Node36(len(nodes), coord=[4.0*i, 0.0, 3.0*k])
+            if k == 0 and i in (0, nx):
+                node.setFix([True]*6)
+            nodes[i, k] = node
+    model.add(*nodes.values())
+
+    elements = []
+    for (i, k), node in nodes.items():
+        if k > 0:
+            elements.append(BernoulliBeam(len(elements), [nodes[i, k - 1], node], **SECTION))
+        if i < nx:
+            elements.append(BernoulliBeam(len(elements), [node, nodes[i + 1, k]], **SECTION))
+    model.add(*elements)
+    return model
+
+
+def test_rcm_bandwidth_and_profile():
+    bands = {}
+    for numberer in (Plain(), RevCuthillMcKee()):
+        model = strip()
+        model._domain(numberer)
+        K, _ = Assembler()._assemble(model.getElements(), model.nDOF)
+        assert bandwidth(K) == numberer.getBandwidth()[1]
+        before, after = numberer.getProfile()
+        bands[type(numberer).__name__] = (bandwidth(K), before, after)
+
+        # every node gets consecutive d.o.f.s, all d.o.f.s are used once
+        dofs = np.sort(np.concatenate([node.getDOFs() for node in model.getNodes()]))
+        assert np.array_equal(dofs, np.arange(model.nDOF))
+
+    assert bands["RevCuthillMcKee"][0] < bands["Plain"][0]/2
+    assert bands["RevCuthillMcKee"][2] < bands["RevCuthillMcKee"][1]
+    assert bands["Plain"][1] == bands["Plain"][2]
+
+
+def test_partition_is_sorted(frame):
+    model, _ = frame
+    uu, pp = model.getDOFPartition()
+    assert np.all(np.diff(uu) > 0)
+    assert np.all(np.diff(pp) > 0)
+    assert np.array_equal(np.sort(np.concatenate([uu, pp])), np.arange(model.nDOF))
+
+
+def test_rcm_bandwidth_of_free_block():
+    plain, rcm = strip(), strip()
+    plain._domain(Plain())
+    numberer = RevCuthillMcKee()
+    rcm._domain(numberer)
+    plain._assemble()
+    rcm._assemble()
+
+    uu, _ = rcm.getDOFPartition()
+    K = rcm.K.tocsr()
+    assert bandwidth(K[uu][:, uu]) == numberer.getBandwidth()[1]
+
+    uu, _ = plain.getDOFPartition()
+    K = plain.K.tocsr()
+    assert bandwidth(K[uu][:, uu]) > 2*numberer.getBandwidth()[1]
+
+
+def test_numberers_are_quiet_by_default(capsys):
+    for numberer in (RevCuthillMcKee(), NestedDissection()):
+        model, _ = build_frame()
+        model._domain(numberer)
+    assert capsys.readouterr().out == ""
+
+
+def block_pattern(model):
+    # nonzeros of K with full nodal blocks on the node graph (d.o.f. order)
+    store = model.getNodeStore()
+    indptr, indices = model.getAdjacency().getNodeGraph(store.getNodes())
+    first = store.getDOFs()[:, 0]
+    ndof = store.getNDOF()
+    mask = np.zeros((model.nDOF, model.nDOF), dtype=bool)
+    for a in range(first.shape[0]):
+        for b in np.append(indices[indptr[a]:indptr[a + 1]], a):
+            mask[first[a]:first[a] + ndof[a], first[b]:first[b] + ndof[b]] = True
+    return mask
+
+
+def symbolic_cholesky(mask):
+    # nonzeros of the Cholesky factor by elimination on the pattern
+    mask = mask.copy()
+    for k in range(mask.shape[0]):
+        rows = k + 1 + np.flatnonzero(mask[k + 1:, k])
+        mask[np.ix_(rows, rows)] = True
+    return np.count_nonzero(np.tril(mask))
+
+
+def test_factor_prediction():
+    for numberer in (Plain(), RevCuthillMcKee(), NestedDissection()):
+        model, _ = build_frame(3, 3, 3)
+        model._domain(numberer)
+        assert numberer.getFactorNNZ()[1] == symbolic_cholesky(block_pattern(model))
+
+
+def test_factor_prediction_is_lazy(monkeypatch):
+    calls = []
+    predict = Numberer._factorNNZ
+    monkeypatch.setattr(Numberer, "_factorNNZ", staticmethod(lambda *args: calls.append(1) or predict(*args)))
+
+    model, _ = build_frame()
+    numberer = NestedDissection()
+    model._domain(numberer)
+    assert calls == []
+    before, after = numberer.getFactorNNZ()
+    assert len(calls) == 2 and after < before
+    numberer.getFactorNNZ()
+    assert len(calls) == 2
+
+
+def test_nested_dissection_natural_ordering():
+    factors = {}
+    for numberer in (Plain(), NestedDissection()):
+        model, _ = build_frame(6, 6, 6)
+        model._domain(numberer)
+        model._assemble()
+        uu, _ = model.getDOFPartition()
+        Kuu = model.K.tocsr()[uu][:, uu]
+
+        system = UmfPack()
+        system._setOrdering(numberer, uu)
+        system._setA(Kuu)
+        x = system._solve(np.ones(uu.shape[0]))
+        assert np.allclose(Kuu @ x, 1.0)
+        if system._lu is not None:
+            factors[type(numberer).__name__] = (system._permc_spec, system._lu.L.nnz + system._lu.U.nnz)
+
+        # rows not in numbering order: the system falls back to COLAMD
+        system._setOrdering(numberer, uu[::-1])
+        assert system._permc_spec == "COLAMD"
+
+    if factors:
+        assert factors["Plain"][0] == "COLAMD"
+        assert factors["NestedDissection"][0] == "NATURAL"
+        assert factors["NestedDissection"][1] < factors["Plain"][1]
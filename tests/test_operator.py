@@ -0,0 +1,42 @@
+import numpy as np
+
+from conftest import numbered_frame
+from oneFEM.analysis.system import Iterative
+
+
+def test_operator_matches_assembled_stiffness():
+    model, K, uu = numbered_frame()
+    Kuu = K[uu][:, uu]
+    rng = np.random.default_rng(0)
+    v = rng.standard_normal(uu.shape[0])
+    for store in (True, False):
+        operator = model.getOperator(uu, store=store)
+        assert operator.shape == Kuu.shape
+        assert np.allclose(operator @ v, Kuu @ v)
+        assert np.allclose(operator.diagonal(), Kuu.diagonal())
+
+    w = rng.standard_normal(model.nDOF)
+    assert np.allclose(model.getOperator() @ w, K @ w)
+
+
+def test_matrix_free_block_jacobi():
+    model, K, uu = numbered_frame()
+    Kuu = K[uu][:, uu]
+    b = np.ones(uu.shape[0])
+    solutions = []
+    for A in (Kuu, model.getOperator(uu)):
+        system = Iterative(preconditioner="block-jacobi", maxiter=5000)
+        system._setA(A)
+        solutions.append((system._solve(b), system.getIterations()))
+    assert np.allclose(solutions[0][0], solutions[1][0], rtol=1e-6, atol=1e-12)
+    assert solutions[0][1] == solutions[1][1]
+
+
+def test_element_matrices_are_stored_on_request():
+    model, K, uu = numbered_frame()
+    v = np.random.default_rng(0).standard_normal(uu.shape[0])
+    operator = model.getOperator(uu)
+    assert operator._ke is None
+    stored = model.getOperator(uu, store=True)
+    assert stored._ke is not None
+    assert np.allclose(stored @ v, operator @ v)
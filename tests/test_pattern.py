@@ -0,0 +1,29 @@
+import numpy as np
+import pytest
+
+from conftest import build_frame
+from oneFEM.model.pattern import Plain
+from oneFEM.model.tseries import Constant
+
+
+def test_plain_accepts_node_ids():
+    forces = {}
+    for key in ("node", "ID"):
+        model, nodes = build_frame()
+        roof = nodes[2, 2, 3]
+        target = roof if key == "node" else roof._ID
+        pattern = Plain(1, tseries=Constant(1, 1.0), load=[[target, 10.0, 5.0, 0.0, 0.0, 0.0, 0.0]])
+        model.add(pattern)
+        assert pattern.getNodes() == [roof]
+        model._domain()
+        model._assemble()
+        forces[key] = model.F.copy()
+
+    assert np.abs(forces["node"]).sum() == 15.0
+    assert np.array_equal(forces["ID"], forces["node"])
+
+
+def test_plain_unknown_node_id():
+    model, _ = build_frame()
+    with pytest.raises(ValueError):
+        model.add(Plain(1, load=[[999, 1.0]]))
@@ -0,0 +1,63 @@
+import numpy as np
+
+from oneFEM.model.tseries import Path
+from oneFEM.analysis.eigen import Eigen, ResponseSpectrum
+
+
+def spectrum():
+    # design-like spectrum tabulated from T = 0.05 s
+    periods = np.array([0.05, 0.1, 0.5, 1.0, 2.0, 4.0])
+    return Path(1, values=[4.0, 7.5, 7.5, 3.75, 1.9, 0.5], time=periods)
+
+
+def test_cqc_against_double_loop(frame):
+    model, _ = frame
+    rsa = ResponseSpectrum(1, spectrum(), dof=1, damping=0.05, combination="CQC")
+    peaks = rsa.analyze(model, Eigen(1, nModes=12))
+
+    U = rsa.getModalResponse()
+    rho = rsa.getCorrelation()
+    expected = np.zeros(U.shape[0])
+    for i in range(U.shape[1]):
+        for j in range(U.shape[1]):
+            expected += U[:, i]*rho[i, j]*U[:, j]
+    assert np.allclose(peaks["disp"], np.sqrt(np.maximum(expected, 0.0)))
+    assert np.allclose(np.diag(rho), 1.0)
+
+    srss = ResponseSpectrum(1, spectrum(), dof=1, damping=0.05, combination="SRSS")
+    peaks = srss.analyze(model, Eigen(1, nModes=12))
+    assert np.allclose(peaks["disp"], np.sqrt(np.sum(U**2, axis=1)))
+
+
+def test_modal_base_shear(frame):
+    # the x reactions of every mode balance its effective mass times Sa
+    model, _ = frame
+    rsa = ResponseSpectrum(1, spectrum(), dof=1)
+    rsa.analyze(model, Eigen(1, nModes=6))
+    _, mass = rsa.getParticipation()
+
+    _, pp = model.getDOFPartition()
+    dofs = model.getNodeStore().getDOFs()[:, 0]
+    x = np.intersect1d(dofs[dofs >= 0], pp)
+    shear = (model.K @ rsa.getModalResponse())[x].sum(axis=0)
+    assert np.allclose(shear, -mass*rsa.getSpectralAccelerations())
+    assert np.sum(mass) <= np.sum(model.M.diagonal()[dofs[dofs >= 0]])
+
+
+def test_short_periods_use_first_spectral_value(frame):
+    model, _ = frame
+    rsa = ResponseSpectrum(1, spectrum(), dof=1)
+    rsa.analyze(model, Eigen(1, nModes=40))
+
+    periods = 2.0*np.pi/np.sqrt(Eigen(1, nModes=40).solve(model)[0])
+    Sa = rsa.getSpectralAccelerations()
+    assert np.any(periods < 0.05)
+    assert np.all(Sa > 0.0)
+    assert np.allclose(Sa[periods < 0.05], 4.0)
+
+
+def test_path_ends():
+    path = Path(1, values=[1.0, 2.0], time=[1.0, 2.0])
+    assert np.allclose(path.getFactor([0.5, 1.5, 3.0]), [0.0, 1.5, 0.0])
+    path = Path(1, values=[1.0, 2.0], time=[1.0, 2.0], useFirst=True, useLast=True)
+    assert np.allclose(path.getFactor([0.5, 1.5, 3.0]), [1.0, 1.5, 2.0])
@@ -0,0 +1,59 @@
+import gc
+import sys
+
+import numpy as np
+import pytest
+from scipy.sparse.linalg import spsolve
+
+from conftest import numbered_frame
+from oneFEM.analysis.system import AdditiveSchwarz, Iterative
+
+
+def test_bad_subdomains_do_not_fail_on_collection():
+    errors = []
+    hook = sys.unraisablehook
+    sys.unraisablehook = errors.append
+    try:
+        with pytest.raises(TypeError):
+            AdditiveSchwarz(None)
+        gc.collect()
+    finally:
+        sys.unraisablehook = hook
+    assert errors == []
+
+
+def test_partition_covers_free_dofs():
+    model, _, uu = numbered_frame(4, 4, 4)
+    subdomains, owner = model.getPartition(3, overlap=1, dofs=uu)
+    assert len(subdomains) == 3
+    assert owner.shape == uu.shape and set(np.unique(owner)) == {0, 1, 2}
+    for part, dofs in enumerate(subdomains):
+        assert np.all(np.isin(np.flatnonzero(owner == part), dofs))
+    assert sum(dofs.shape[0] for dofs in subdomains) > uu.shape[0]
+
+
+def test_serial_preconditioner_is_exact_on_one_subdomain():
+    _, K, uu = numbered_frame()
+    Kuu = K[uu][:, uu]
+    precond = AdditiveSchwarz([np.arange(uu.shape[0])], parallel=False)
+    precond._setup(Kuu)
+    b = np.ones(uu.shape[0])
+    assert np.allclose(Kuu @ (precond.getOperator() @ b), b)
+
+
+def test_parallel_schwarz_cg():
+    model, K, uu = numbered_frame(4, 4, 4)
+    Kuu = K[uu][:, uu]
+    b = np.ones(uu.shape[0])
+    reference = spsolve(Kuu.tocsc(), b)
+
+    iterations = []
+    for parallel in (False, True):
+        precond = AdditiveSchwarz(*model.getPartition(4, dofs=uu), parallel=parallel)
+        system = Iterative(preconditioner=precond)
+        system._setNullspace(model.getRigidBodyModes(uu))
+        system._setA(Kuu)
+        assert np.allclose(system._solve(b), reference, rtol=1e-5, atol=1e-8*np.abs(reference).max())
+        iterations.append(system.getIterations())
+        precond._close()
+    assert iterations[0] == iterations[1]
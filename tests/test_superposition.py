@@ -0,0 +1,95 @@
+import numpy as np
+import pytest
+from scipy.sparse.linalg import spsolve
+
+from conftest import build_frame
+from oneFEM.model.pattern import Plain
+from oneFEM.model.superposition import Superposition
+from oneFEM.analysis import Analysis
+from oneFEM.analysis.algorithm import Linear
+
+
+def cases():
+    # frame with three load cases on different roof nodes
+    model, nodes = build_frame()
+    model.add(Plain(1, load=[[nodes[0, 0, 3], 10.0, 0.0, 0.0, 0.0, 0.0, 0.0]]),
+              Plain(2, load=[[nodes[2, 2, 3], 0.0, 5.0, -20.0, 0.0, 0.0, 0.0]]),
+              Plain(3, load=[[nodes[1, 1, 2], 0.0, 0.0, 0.0, 1.0, 2.0, 0.0]]))
+    model._domain()
+    model._assemble()
+    linear = Linear()
+    Analysis(algorithm=linear)._organize(model)
+    linear.solveCases(model)
+    uu, pp = linear._dofs()
+    return model, linear, uu, pp
+
+
+def test_combination_against_direct_solve():
+    model, linear, uu, pp = cases()
+    factors = {1: 1.2, 2: 1.6, 3: -0.5}
+    u, F = linear.getCombination(factors)
+
+    _, P = model._assembleLoads()
+    load = P @ np.array([1.2, 1.6, -0.5])
+    K = model.K.tocsr()
+    expected = np.zeros(model.nDOF)
+    expected[uu] = spsolve(K[uu][:, uu].tocsc(), load[uu])
+    assert np.allclose(u, expected, rtol=1e-10, atol=1e-14)
+    assert np.allclose(F[pp], (K @ expected)[pp], rtol=1e-8, atol=1e-8)
+    assert np.allclose(F[uu], load[uu])
+    assert np.allclose(model.getSuperposition().getDisp(factors), u)
+
+
+def test_element_forces():
+    model, linear, _, _ = cases()
+    superposition = model.getSuperposition()
+    factors = [{1: 1.0}, {2: 1.0, 3: 2.0}]
+    for element in model.getElements():
+        gd = np.asarray(element.getDOFs())
+        k = np.asarray(element.getStiffness())
+        E = superposition.getElementForces(factors, element.getID())
+        u = [linear.getCase(1)[0], linear.getCase(2)[0] + 2.0*linear.getCase(3)[0]]
+        for j in range(2):
+            assert np.allclose(E[:gd.shape[0], j], k @ u[j][gd], atol=1e-9)
+    with pytest.raises(ValueError):
+        superposition.getElementForces({1: 1.0}, -1)
+
+
+def test_envelope():
+    model, _, _, _ = cases()
+    superposition = model.getSuperposition()
+    W = np.random.default_rng(0).uniform(-2.0, 2.0, (3, 50))
+    envelope = superposition.getEnvelope(W)
+    for name, R in (("u", superposition.getDisp(W)), ("F", superposition.getReactions(W)),
+                    ("element", superposition.getElementForces(W))):
+        assert np.allclose(envelope[name][0], R.max(axis=-1))
+        assert np.allclose(envelope[name][1], R.min(axis=-1))
+
+
+def test_cases_dropped_on_renumbering():
+    model, _, _, _ = cases()
+    assert model.getSuperposition().getCaseIDs() == [1, 2, 3]
+    model._domain()
+    assert model.getSuperposition() is None
+
+
+def test_chunked_envelope(monkeypatch):
+    model, _, _, _ = cases()
+    superposition = model.getSuperposition()
+    W = np.random.default_rng(0).uniform(-2.0, 2.0, (3, 50))
+    expected = {"u": superposition.getDisp(W), "F": superposition.getReactions(W),
+                "element": superposition.getElementForces(W)}
+
+    monkeypatch.setattr(Superposition, "_chunk", 100)
+    envelope = superposition.getEnvelope(W)
+    for name, R in expected.items():
+        assert np.allclose(envelope[name][0], R.max(axis=-1))
+        assert np.allclose(envelope[name][1], R.min(axis=-1))
+
+
+def test_cases_dropped_when_stiffness_changes():
+    model, _, _, _ = cases()
+    model.K = model.K.copy()
+    assert model.getSuperposition() is not None
+    model.K = 2.0*model.K
+    assert model.getSuperposition() is None
@@ -0,0 +1,87 @@
+import numpy as np
+import pytest
+import scipy.sparse as sp
+
+from conftest import bandwidth
+from oneFEM.analysis.system import BandSPD, FullGeneral
+from oneFEM.analysis.system.umfpack import UmfPack
+
+
+def grid(n):
+    # 2D grid Laplacian (natural order: half bandwidth n)
+    T = sp.diags([-1.0, 2.0, -1.0], [-1, 0, 1], shape=(n, n))
+    return (sp.kron(sp.identity(n), T) + sp.kron(T, sp.identity(n))).tocsr()
+
+
+def laplacian(n=40, seed=0):
+    # grid Laplacian with shuffled unknowns: the natural order is poor
+    A = grid(n)
+    p = np.random.default_rng(seed).permutation(n*n)
+    return A[p][:, p].tocsc()
+
+
+@pytest.mark.parametrize("System", [UmfPack, FullGeneral])
+def test_factorization_cache(System):
+    A = laplacian(10)
+    b = np.arange(A.shape[0], dtype=float)
+    system = System()
+    system._setA(A)
+    assert np.allclose(A @ system._solve(b), b)
+
+    # same matrix: the factorization is kept, several right-hand sides at once
+    system._setA(A.copy())
+    X = system._solve(np.column_stack([b, 2.0*b]))
+    assert X.shape == (A.shape[0], 2) and np.allclose(A @ X[:, 1], 2.0*b)
+    assert system._nFactor == 1
+
+    # new values: numeric factorization only
+    system._setA(2.0*A)
+    assert system._is_analyzed and not system._is_factored
+    assert np.allclose(2.0*(A @ system._solve(b)), b)
+    assert system._nFactor == 2
+
+    # new pattern: analysis and factorization
+    B = (A + sp.diags([1.0], [5], shape=A.shape) + sp.diags([1.0], [-5], shape=A.shape)).tocsr()
+    system._setA(B)
+    assert not system._is_analyzed
+    assert np.allclose(B @ system._solve(b), b)
+    assert system._nFactor == 3
+
+
+
+def test_refactorization_reuses_ordering():
+    A = laplacian()
+    b = np.arange(A.shape[0], dtype=float)
+    system = UmfPack()
+    system._setA(A)
+    x = system._solve(b)
+    assert np.allclose(A @ x, b)
+    if system._lu is None:
+        return
+    fill = system._lu.L.nnz + system._lu.U.nnz
+
+    # same pattern, new values: numeric refactorization with the stored ordering
+    system._setA(2.0*A)
+    x = system._solve(b)
+    assert system._nFactor == 2 and system._is_permuted
+    assert np.allclose(2.0*(A @ x), b)
+    assert system._lu.L.nnz + system._lu.U.nnz == fill
+
+def test_band_spd():
+    A = grid(12)
+    b = np.ones((A.shape[0], 2))
+    system = BandSPD()
+    system._setA(A)
+    assert np.allclose(A @ system._solve(b), b)
+    assert system.getBandwidth() == bandwidth(A) == 12
+
+    system._setA(3.0*A)
+    assert np.allclose(3.0*(A @ system._solve(b[:, 0])), 1.0)
+    assert system._nFactor == 2
+
+
+def test_band_spd_not_positive_definite():
+    system = BandSPD()
+    system._setA(sp.diags([1.0, -1.0, 1.0]))
+    with pytest.raises(ValueError):
+        system._solve(np.ones(3))